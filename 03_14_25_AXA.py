@@ -1,7 +1,5 @@
 import os
-import time
 import shutil
-import glob
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -12,6 +10,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from PyPDF2 import PdfMerger, PdfReader
 from PyPDF2.errors import PdfReadError
 from webdriver_manager.chrome import ChromeDriverManager
+from waits import wait_for_selector, wait_for_download, wait_for_dom_stable, snapshot
 
 # === Config ===
 MAIN_DIR = os.path.join("Cutler", "AXA")
@@ -50,7 +49,8 @@ driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), opti
 wait = WebDriverWait(driver, 20)
 
 driver.get("https://erie.equitableadvisors.com/market-watch-c217c")
-time.sleep(5)
+wait_for_selector(driver, "span.date")
+wait_for_dom_stable(driver)
 
 # === Find all date spans ===
 date_spans = driver.find_elements(By.CSS_SELECTOR, "span.date")
@@ -69,6 +69,7 @@ for idx, date_span in enumerate(date_spans, start=1):
         try:
             article_div = date_span.find_element(By.XPATH, "./ancestor::div[2]")
             read_button = article_div.find_element(By.XPATH, ".//button[contains(text(), 'Click to read')]")
+            before = snapshot(TEMP_CHROME_DOWNLOAD_DIR)
             driver.execute_script("arguments[0].click();", read_button)
 
             # Wait for modal and click proceed
@@ -77,22 +78,10 @@ for idx, date_span in enumerate(date_spans, start=1):
             proceed.click()
 
             # === Wait for download to complete ===
-            download_complete = False
-            wait_time = 0
-            while not download_complete and wait_time < 20:
-                time.sleep(1)
-                crdownload_files = glob.glob(os.path.join(TEMP_CHROME_DOWNLOAD_DIR, "*.crdownload"))
-                pdf_files = glob.glob(os.path.join(TEMP_CHROME_DOWNLOAD_DIR, "*.pdf"))
-                if not crdownload_files and pdf_files:
-                    download_complete = True
-                wait_time += 1
-
-            if not download_complete:
+            latest_pdf = wait_for_download(TEMP_CHROME_DOWNLOAD_DIR, timeout=20, before=before)
+            if latest_pdf is None:
                 print(f" Download timed out for article {date_str}")
                 continue
-
-            # Get the downloaded PDF
-            latest_pdf = max(glob.glob(os.path.join(TEMP_CHROME_DOWNLOAD_DIR, "*.pdf")), key=os.path.getctime)
             target_name = f"{pub_date.strftime('%Y-%m-%d')}_{idx}.pdf"
             final_path = os.path.join(DOWNLOAD_DIR, target_name)
             shutil.move(latest_pdf, final_path)
@@ -102,7 +91,7 @@ for idx, date_span in enumerate(date_spans, start=1):
             # Close modal
             close_btn = driver.find_element(By.CSS_SELECTOR, "button.fancybox-close-small")
             close_btn.click()
-            time.sleep(1)
+            wait_for_dom_stable(driver, timeout=5)
 
         except Exception as e:
             print(f" Error on article dated {date_str}: {e}")
@@ -1,5 +1,4 @@
 import os
-import time
 import requests
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -7,6 +6,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from PyPDF2 import PdfMerger, PdfReader
 from PyPDF2.errors import PdfReadError
 import undetected_chromedriver as uc
+from progress_events import emit
+from run_profiler import stage
+from waits import wait_for_selector, wait_for_dom_stable
 
 # === Paths ===
 DOWNLOAD_DIR = os.path.join("Cutler", "Alger", "downloads")
@@ -33,10 +35,10 @@ try:
         EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='radio'][value='show-doc']"))
     )
     driver.execute_script("arguments[0].click();", radio_button)
-    time.sleep(3)  # Allow DOM to update
 
     # === Wait for document section to load ===
-    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "td.ft-doc")))
+    wait_for_selector(driver, "td.ft-doc a[target='_blank']")
+    wait_for_dom_stable(driver)
 
     # === Collect all commentary links ===
     links = driver.find_elements(By.CSS_SELECTOR, "td.ft-doc a[target='_blank']")
@@ -48,6 +50,7 @@ try:
             commentary_links.append((text, href))
 
     print(f"\n Found {len(commentary_links)} commentary PDFs.")
+    emit("links_found", count=len(commentary_links))
 finally:
     driver.quit()
 
@@ -63,6 +66,7 @@ for idx, (label, href) in enumerate(commentary_links, start=1):
         file_path = os.path.join(DOWNLOAD_DIR, file_name)
         with open(file_path, "wb") as f:
             f.write(response.content)
+        emit("pdf_downloaded", path=file_path, bytes=os.path.getsize(file_path))
         print(f"  Downloaded: {file_name}")
         downloaded_files.append(file_path)
     except Exception as e:
@@ -83,7 +87,8 @@ if downloaded_files:
         except Exception as e:
             print(f"  Error appending {f}: {e}")
     if valid_files:
-        merger.write(MERGED_PDF)
+        with stage("merge"):
+            merger.write(MERGED_PDF)
         merger.close()
         print(f"\n Merged PDF saved at: {MERGED_PDF}")
     else:
@@ -1,5 +1,4 @@
 import os
-import time
 import requests
 import sys
 import warnings
@@ -11,6 +10,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from playwright.sync_api import sync_playwright
+from progress_events import emit
+from run_profiler import stage
+from waits import wait_for_selector
 
 # === Setup ===
 BASE_URL = "https://www.saturna.com"
@@ -90,7 +92,7 @@ print(f"{len(valid_links)} articles within last 4 months")
 downloaded_paths = []
 
 with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False, slow_mo=200)
+    browser = p.chromium.launch(headless=False)
     context = browser.new_context(user_agent=user_agent)
 
     for cookie in selenium_cookies:
@@ -114,7 +116,7 @@ with sync_playwright() as p:
         print(f"\nVisiting: {article_url}")
         try:
             page.goto(article_url, timeout=60000)
-            time.sleep(2)
+            wait_for_selector(page, "a[href$='.pdf']", timeout=10)
             article_html = page.content()
             article_soup = BeautifulSoup(article_html, "html.parser")
 
@@ -135,6 +137,7 @@ with sync_playwright() as p:
                     if response.ok and response.headers.get("Content-Type", "").lower().startswith("application/pdf"):
                         with open(filepath, "wb") as f:
                             f.write(response.content)
+                        emit("pdf_downloaded", path=filepath, bytes=os.path.getsize(filepath))
                         print(f"Saved: {filename}")
                         downloaded_paths.append(filepath)
                     else:
@@ -153,7 +156,8 @@ if downloaded_paths:
         merger.append(path)
     merged_name = f"Amana_{datetime.today().strftime('%Y%m%d')}_Merged.pdf"
     merged_path = os.path.join(downloads_dir, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"Merged {len(downloaded_paths)} PDFs into {merged_name}")
 else:
@@ -1,8 +1,6 @@
 import os
-import time
 import sys
 import warnings
-import requests
 from datetime import datetime
 from bs4 import BeautifulSoup
 from PyPDF2 import PdfMerger
@@ -11,9 +9,13 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from playwright.sync_api import sync_playwright
 import subprocess
 import platform
+from fund_manifest import FundManifest
+from run_profiler import stage
+from waits import wait_for_dom_stable
+from download_engine import download_all
+from async_crawl import crawl, playwright_cookies
 
 # === ChromeDriver Setup ===
 def get_installed_chrome_version():
@@ -54,10 +56,8 @@ BASE_DIR = os.path.join(script_dir, "Cutler", FUND_NAME)
 downloads_dir = os.path.join(BASE_DIR, "downloads")
 os.makedirs(downloads_dir, exist_ok=True)
 
-# Clean old PDFs
-for f in os.listdir(downloads_dir):
-    if f.endswith(".pdf"):
-        os.remove(os.path.join(downloads_dir, f))
+# Unchanged reports from earlier runs are kept; anything not seen this run is pruned below
+manifest = FundManifest(downloads_dir)
 
 # === Step 1: Use Selenium to Extract All Product Links from Paginated Search ===
 print("Launching Selenium to fetch product links...")
@@ -72,7 +72,7 @@ try:
         print(f"Loading search page: {current_url}")
         driver.get(current_url)
         WebDriverWait(driver, 30).until(EC.presence_of_all_elements_located((By.CLASS_NAME, "search-item")))
-        time.sleep(2)
+        wait_for_dom_stable(driver)
 
         soup = BeautifulSoup(driver.page_source, "html.parser")
         search_items = soup.select("div.search-item a.product.standard")
@@ -111,73 +111,47 @@ del driver
 
 print(f"Total unique product pages collected: {len(product_links)}")
 
-# === Step 2: Use Playwright to Visit Each Product Page and Download Quarterly Commentary PDFs ===
+# === Step 2: Crawl the Product Pages in Parallel Tabs and Download Quarterly Commentary PDFs ===
+def quarterly_commentary_links(page_html, product_url):
+    soup = BeautifulSoup(page_html, "html.parser")
+    pdf_urls = []
+    for link in soup.select("a.reusable-link.standard"):
+        text_tag = link.select_one("span.ar-download-title-text")
+        if text_tag and "Quarterly Commentary" in text_tag.text:
+            pdf_href = link.get("href")
+            if not pdf_href or not pdf_href.endswith(".pdf"):
+                continue
+            pdf_urls.append(pdf_href if pdf_href.startswith("http") else BASE_URL + pdf_href)
+    return pdf_urls
+
+crawled = crawl(product_links, quarterly_commentary_links, wait_for="span.ar-download-title-text", headless=False,
+                context_options={"user_agent": user_agent}, cookies=playwright_cookies(selenium_cookies))
+
+pdf_urls_found = []
+for product_url, pdf_urls, error in crawled:
+    print(f"\nProduct page: {product_url}")
+    if error is not None:
+        print(f"Failed to process product page: {error}")
+    elif not pdf_urls:
+        print("No Quarterly Commentary PDF found on this page.")
+    for full_pdf_url in pdf_urls or []:
+        print(f"Quarterly Commentary: {full_pdf_url}")
+        if full_pdf_url not in pdf_urls_found:
+            pdf_urls_found.append(full_pdf_url)
+
+# Download every commentary at once over pooled connections
 downloaded_paths = []
-
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False, slow_mo=200)
-    context = browser.new_context(user_agent=user_agent)
-
-    for cookie in selenium_cookies:
-        try:
-            context.add_cookies([{
-                "name": cookie['name'],
-                "value": cookie['value'],
-                "domain": cookie['domain'].lstrip('.'),
-                "path": cookie['path'],
-                "expires": cookie.get('expiry'),
-                "httpOnly": cookie['httpOnly'],
-                "secure": cookie['secure'],
-                "sameSite": "Lax"
-            }])
-        except Exception as e:
-            print(f"Skipping cookie: {e}")
-
-    page = context.new_page()
-
-    for product_url in product_links:
-        print(f"\nVisiting product page: {product_url}")
-        try:
-            page.goto(product_url, timeout=60000)
-            time.sleep(2)
-
-            page_html = page.content()
-            soup = BeautifulSoup(page_html, "html.parser")
-
-            commentary_links = soup.select("a.reusable-link.standard")
-
-            found = False
-            for link in commentary_links:
-                text_tag = link.select_one("span.ar-download-title-text")
-                if text_tag and "Quarterly Commentary" in text_tag.text:
-                    pdf_href = link.get("href")
-                    if not pdf_href or not pdf_href.endswith(".pdf"):
-                        continue
-                    full_pdf_url = pdf_href if pdf_href.startswith("http") else BASE_URL + pdf_href
-                    filename = full_pdf_url.split("/")[-1]
-                    filepath = os.path.join(downloads_dir, filename)
-
-                    print(f"Downloading Quarterly Commentary: {full_pdf_url}")
-                    try:
-                        response = requests.get(full_pdf_url, timeout=30)
-                        if response.ok and response.headers.get("Content-Type", "").lower().startswith("application/pdf"):
-                            with open(filepath, "wb") as f:
-                                f.write(response.content)
-                            downloaded_paths.append(filepath)
-                            print(f"Saved: {filename}")
-                            found = True
-                        else:
-                            print("Invalid PDF response.")
-                    except Exception as e:
-                        print(f"Failed to download: {e}")
-
-            if not found:
-                print("No Quarterly Commentary PDF found on this page.")
-
-        except Exception as e:
-            print(f"Failed to process product page: {e}")
-
-    browser.close()
+results = download_all([(url, os.path.join(downloads_dir, url.split("/")[-1])) for url in pdf_urls_found], manifest)
+for result in results:
+    filename = result.url.split("/")[-1]
+    if result.error:
+        print(f"Failed to download {filename}: {result.error}")
+        continue
+    downloaded_paths.append(result.path)
+    print(f"{'Saved' if result.changed else 'Unchanged'}: {filename}")
+
+manifest.prune()
+manifest.save()
 
 # === Step 3: Merge Downloaded PDFs ===
 if downloaded_paths:
@@ -186,7 +160,8 @@ if downloaded_paths:
         merger.append(path)
     merged_name = f"Ariel_{today_str}_Merged.pdf"
     merged_path = os.path.join(downloads_dir, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"\nMerged {len(downloaded_paths)} PDFs into {merged_name}")
 else:
@@ -1,5 +1,4 @@
 import os
-import time
 import requests
 from datetime import datetime
 from bs4 import BeautifulSoup
@@ -9,6 +8,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+from waits import wait_for_selector
 
 # === Configuration ===
 FUND_NAME = "Clarkston"
@@ -42,7 +42,7 @@ options.add_experimental_option("prefs", prefs)
 
 driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
 driver.get(TARGET_URL)
-time.sleep(5)
+wait_for_selector(driver, "li[data-type='comm']")
 
 soup = BeautifulSoup(driver.page_source, "html.parser")
 driver.quit()
@@ -1,5 +1,4 @@
 import os
-import time
 import requests
 from datetime import datetime
 from bs4 import BeautifulSoup
@@ -8,6 +7,7 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from waits import wait_for_selector
 
 # === Setup ===
 script_dir = os.getcwd()
@@ -37,7 +37,7 @@ TARGET_TITLES = {
 options = uc.ChromeOptions()
 driver = uc.Chrome(headless=True, options=options)
 driver.get(URL)
-time.sleep(5)
+wait_for_selector(driver, "table tbody tr")
 
 # === Parse HTML
 soup = BeautifulSoup(driver.page_source, "html.parser")
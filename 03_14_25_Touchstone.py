@@ -6,6 +6,8 @@ from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeo
 import httpx
 from datetime import datetime
 from PyPDF2 import PdfMerger
+from progress_events import emit
+from run_profiler import stage
 
 # === Setup Directories ===
 today_str = datetime.today().strftime('%Y%m%d')
@@ -27,6 +29,7 @@ def download_pdf(url, fund_name):
             if response.status_code == 200:
                 with open(output_path, "wb") as f:
                     f.write(response.content)
+                emit("pdf_downloaded", path=output_path, bytes=os.path.getsize(output_path))
                 print(f"[Touchstone] Downloaded: {output_path}")
             else:
                 print(f"[Touchstone] Failed to download: {url} - Status: {response.status_code}")
@@ -93,7 +96,8 @@ if pdf_files:
         merger.append(pdf)
     merged_name = f"Touchstone_{today_str}_Merged.pdf"
     merged_path = os.path.join(DOWNLOAD_DIR, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"\nMerged {len(pdf_files)} PDFs into {merged_name}")
 else:
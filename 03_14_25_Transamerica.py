@@ -1,10 +1,11 @@
 import os
-import time
-import requests
 from datetime import datetime
 from bs4 import BeautifulSoup
 from PyPDF2 import PdfMerger
 from playwright.sync_api import sync_playwright
+from download_engine import download_all
+from run_profiler import stage
+from waits import wait_for_selector, wait_for_dom_stable
 
 # === Setup ===
 BASE_URL = "https://www.transamerica.com"
@@ -23,7 +24,7 @@ for f in os.listdir(downloads_dir):
 # === Step 1: Playwright - Navigate and Click Documents ===
 print("Launching Playwright browser...")
 with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False, slow_mo=150)
+    browser = p.chromium.launch(headless=False)
     context = browser.new_context()
     page = context.new_page()
     page.goto(TARGET_URL, timeout=60000)
@@ -58,7 +59,8 @@ with sync_playwright() as p:
         """, el)
         
         print("Documents tab clicked using full event dispatch.")
-        time.sleep(3)
+        wait_for_selector(page, "a[data-metrics-link-type='download']")
+        wait_for_dom_stable(page)
 
     except Exception as e:
         print("Failed to switch to Documents tab:", e)
@@ -85,27 +87,21 @@ with sync_playwright() as p:
 
     print(f"Filtered Quarterly Commentary PDFs: {len(commentary_links)}")
 
-    # === Download PDFs ===
-    downloaded_paths = []
-    for title, url in commentary_links:
-        filename = title.replace(" ", "_")
-        filepath = os.path.join(downloads_dir, filename)
-        print(f"Downloading: {url}")
-
-        try:
-            response = requests.get(url, timeout=30)
-            if response.ok and response.headers.get("Content-Type", "").lower().startswith("application/pdf"):
-                with open(filepath, "wb") as f:
-                    f.write(response.content)
-                print(f"Saved: {filename}")
-                downloaded_paths.append(filepath)
-            else:
-                print("Invalid PDF response.")
-        except Exception as e:
-            print(f"Failed to download: {e}")
-
     browser.close()
 
+# === Download PDFs ===
+# Outside the Playwright block: its event loop would clash with the download engine's
+downloaded_paths = []
+filenames = [title.replace(" ", "_") for title, _ in commentary_links]
+results = download_all([(url, os.path.join(downloads_dir, filename))
+                        for (_, url), filename in zip(commentary_links, filenames)])
+for filename, result in zip(filenames, results):
+    if result.error:
+        print(f"Failed to download {result.url}: {result.error}")
+        continue
+    print(f"Saved: {filename}")
+    downloaded_paths.append(result.path)
+
 # === Step 2: Merge PDFs ===
 if downloaded_paths:
     merger = PdfMerger()
@@ -113,7 +109,8 @@ if downloaded_paths:
         merger.append(path)
     merged_name = f"Transamerica_{today_str}_Merged.pdf"
     merged_path = os.path.join(downloads_dir, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"Merged {len(downloaded_paths)} PDFs into {merged_name}")
 else:
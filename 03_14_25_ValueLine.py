@@ -1,11 +1,13 @@
 import os
-import time
 import requests
 from datetime import datetime
 from bs4 import BeautifulSoup
 from PyPDF2 import PdfMerger
 
 from playwright.sync_api import sync_playwright
+from progress_events import emit
+from run_profiler import stage
+from waits import wait_for_dom_stable
 
 # === Setup Directories ===
 today_str = datetime.today().strftime('%Y%m%d')
@@ -30,7 +32,7 @@ with sync_playwright() as p:
     page = browser.new_page()
     page.goto(COMMENTARY_URL, timeout=60000)
     page.wait_for_selector(".col-xs-12", timeout=10000)
-    time.sleep(1)
+    wait_for_dom_stable(page)
 
     soup = BeautifulSoup(page.content(), "html.parser")
     sections = soup.find_all("div", class_="col-xs-12")
@@ -54,6 +56,7 @@ with sync_playwright() as p:
                 if r.ok:
                     with open(filepath, "wb") as f:
                         f.write(r.content)
+                    emit("pdf_downloaded", path=filepath, bytes=os.path.getsize(filepath))
                     latest_pdfs.append(filepath)
             except Exception as e:
                 print(f"Failed to download {full_url}: {e}")
@@ -67,7 +70,8 @@ if latest_pdfs:
         merger.append(pdf)
     merged_name = f"ValueLine_{today_str}_Merged.pdf"
     merged_path = os.path.join(downloads_dir, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"\nMerged {len(latest_pdfs)} PDFs into {merged_name}")
 else:
@@ -1,5 +1,4 @@
 import os
-import time
 import requests
 from datetime import datetime
 from urllib.parse import urljoin
@@ -11,6 +10,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from PyPDF2 import PdfMerger, PdfReader
 from PyPDF2.errors import PdfReadError
+from waits import wait_for_dom_stable
 
 # Configuration
 driver_path = r"C:\chromedriver-win64\chromedriver.exe"
@@ -55,7 +55,7 @@ for ticker in tickers:
                 WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.CLASS_NAME, "book_download_lnk"))
                 )
-                time.sleep(1)
+                wait_for_dom_stable(driver, timeout=5)
             except Exception:
                 print(f"[SKIP] No download links found for {ticker} ({doc_label})")
                 continue
@@ -1,5 +1,4 @@
 import os
-import time
 import requests
 from datetime import datetime
 from bs4 import BeautifulSoup
@@ -10,6 +9,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from playwright.sync_api import sync_playwright
+from progress_events import emit
+from run_profiler import stage
+from waits import wait_for_selector, wait_for_dom_stable
 
 # === Setup Directories ===
 BASE_URL = "https://advisor.vcm.com"
@@ -33,7 +35,7 @@ driver = uc.Chrome(version_main=136, options=uc_options)
 driver.get(VICTORY_UPDATES_URL)
 
 WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.CLASS_NAME, "columncontrol")))
-time.sleep(3)
+wait_for_dom_stable(driver)
 
 selenium_cookies = driver.get_cookies()
 user_agent = driver.execute_script("return navigator.userAgent;")
@@ -64,7 +66,7 @@ with sync_playwright() as p:
     page = context.new_page()
     page.goto(VICTORY_UPDATES_URL, timeout=60000)
     page.wait_for_selector(".columncontrol", timeout=15000)
-    time.sleep(2)
+    wait_for_dom_stable(page)
 
     soup = BeautifulSoup(page.content(), "html.parser")
     for link in soup.select("a[href*='/products/mutual-funds/mutual-funds-list/']"):
@@ -84,7 +86,7 @@ with sync_playwright() as p:
         print(f"[{i}/{len(fund_links)}] {fund_url}")
         try:
             page.goto(fund_url, timeout=60000)
-            time.sleep(2)
+            wait_for_selector(page, "a.advisor-commentary.manager-commentary.pdf-icon[href$='.pdf']", timeout=10)
             fund_soup = BeautifulSoup(page.content(), "html.parser")
             commentary_link = fund_soup.select_one("a.advisor-commentary.manager-commentary.pdf-icon[href$='.pdf']")
             if commentary_link:
@@ -99,6 +101,7 @@ with sync_playwright() as p:
                     if r.ok and r.headers.get("Content-Type", "").lower().startswith("application/pdf"):
                         with open(filepath, "wb") as f:
                             f.write(r.content)
+                        emit("pdf_downloaded", path=filepath, bytes=os.path.getsize(filepath))
                         downloaded_paths.append(filepath)
                     else:
                         print("Skipped: Not a valid PDF.")
@@ -116,7 +119,8 @@ if downloaded_paths:
         merger.append(pdf)
     merged_name = f"Victory_{today_str}_Merged.pdf"
     merged_path = os.path.join(downloads_dir, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"\nMerged {len(downloaded_paths)} PDFs into {merged_name}")
 else:
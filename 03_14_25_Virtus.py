@@ -1,6 +1,4 @@
 import os
-import time
-import requests
 from datetime import datetime
 from bs4 import BeautifulSoup
 from PyPDF2 import PdfMerger
@@ -10,6 +8,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from playwright.sync_api import sync_playwright
+from run_profiler import stage
+from waits import wait_for_dom_stable
+from download_engine import download_all
+from async_crawl import crawl, playwright_cookies
 
 # === Setup Directories ===
 BASE_URL = "https://www.virtus.com"
@@ -33,7 +35,7 @@ driver = uc.Chrome(version_main=136, options=uc_options)
 driver.get(FUND_LISTING_URL)
 
 WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.ID, "js-daily-performance")))
-time.sleep(3)
+wait_for_dom_stable(driver)
 
 selenium_cookies = driver.get_cookies()
 user_agent = driver.execute_script("return navigator.userAgent;")
@@ -46,25 +48,16 @@ with sync_playwright() as p:
     browser = p.chromium.launch(headless=False)
     context = browser.new_context(user_agent=user_agent)
 
-    for cookie in selenium_cookies:
+    for cookie in playwright_cookies(selenium_cookies):
         try:
-            context.add_cookies([{
-                "name": cookie['name'],
-                "value": cookie['value'],
-                "domain": cookie['domain'].lstrip('.'),
-                "path": cookie['path'],
-                "expires": cookie.get('expiry'),
-                "httpOnly": cookie['httpOnly'],
-                "secure": cookie['secure'],
-                "sameSite": "Lax"
-            }])
+            context.add_cookies([cookie])
         except Exception as e:
             print(f"[Cookie] Skipped: {e}")
 
     page = context.new_page()
     page.goto(FUND_LISTING_URL, timeout=60000)
     page.wait_for_selector("#js-daily-performance", timeout=15000)
-    time.sleep(2)
+    wait_for_dom_stable(page)
 
     # Only select fund rows in the visible "Daily" table
     rows = page.query_selector_all("#js-daily-performance tbody tr")
@@ -80,54 +73,51 @@ with sync_playwright() as p:
 
     print(f"[Virtus] Found {len(fund_links)} unique fund pages.")
 
-    # === Step 3: Download Quarterly Commentary PDFs ===
-    downloaded_paths = []
-
-    for i, fund_url in enumerate(sorted(fund_links), 1):
-        print(f"[{i}/{len(fund_links)}] {fund_url}")
-        try:
-            page.goto(fund_url, timeout=60000)
-            time.sleep(2)
-            soup = BeautifulSoup(page.content(), "html.parser")
-
-            # Target the Marketing Materials block
-            # Search all tables that might include commentary PDFs
-            tables = soup.find_all("table")
-            for table in tables:
-                for row in table.find_all("tr"):
-                    cells = row.find_all("td")
-                    if not cells or len(cells) < 2:
-                        continue
-                    description = cells[0].get_text(strip=True).lower()
-                    if "commentary" not in description:
-                        continue
-                    link_tag = row.select_one("a.file[href$='.pdf']")
-                    if not link_tag:
-                        continue
-                    href = link_tag.get("href", "")
-                    if href.startswith("mailto:") or not href.endswith(".pdf"):
-                        continue
-                    full_url = href if href.startswith("http") else BASE_URL + href
-                    filename = full_url.split("/")[-1]
-                    filepath = os.path.join(downloads_dir, filename)
-
-                    print(f"[Download] {filename}")
-                    try:
-                        r = requests.get(full_url, timeout=30)
-                        if r.ok and r.headers.get("Content-Type", "").lower().startswith("application/pdf"):
-                            with open(filepath, "wb") as f:
-                                f.write(r.content)
-                            downloaded_paths.append(filepath)
-                        else:
-                            print("Skipped: Not a valid PDF.")
-                    except Exception as e:
-                        print(f"Failed download: {e}")
-
-        except Exception as e:
-            print(f"Error scraping {fund_url}: {e}")
-
     browser.close()
 
+# === Step 3: Crawl the Fund Pages in Parallel Tabs and Download Quarterly Commentary PDFs ===
+def commentary_links(page_html, fund_url):
+    soup = BeautifulSoup(page_html, "html.parser")
+    pdf_urls = []
+    # Search all tables that might include commentary PDFs (the Marketing Materials block)
+    for table in soup.find_all("table"):
+        for row in table.find_all("tr"):
+            cells = row.find_all("td")
+            if not cells or len(cells) < 2:
+                continue
+            description = cells[0].get_text(strip=True).lower()
+            if "commentary" not in description:
+                continue
+            link_tag = row.select_one("a.file[href$='.pdf']")
+            if not link_tag:
+                continue
+            href = link_tag.get("href", "")
+            if href.startswith("mailto:") or not href.endswith(".pdf"):
+                continue
+            pdf_urls.append(href if href.startswith("http") else BASE_URL + href)
+    return pdf_urls
+
+crawled = crawl(sorted(fund_links), commentary_links, wait_for="a.file[href$='.pdf']", headless=False,
+                context_options={"user_agent": user_agent}, cookies=playwright_cookies(selenium_cookies))
+
+pdf_urls_found = []
+for i, (fund_url, pdf_urls, error) in enumerate(crawled, 1):
+    print(f"[{i}/{len(crawled)}] {fund_url}")
+    if error is not None:
+        print(f"Error scraping {fund_url}: {error}")
+        continue
+    pdf_urls_found += [url for url in pdf_urls if url not in pdf_urls_found]
+
+# Download every commentary at once over pooled connections
+downloaded_paths = []
+for result in download_all([(url, os.path.join(downloads_dir, url.split("/")[-1])) for url in pdf_urls_found]):
+    filename = result.url.split("/")[-1]
+    if result.error:
+        print(f"[Skipped] {filename}: {result.error}")
+        continue
+    print(f"[Download] {filename}")
+    downloaded_paths.append(result.path)
+
 # === Step 4: Merge PDFs ===
 if downloaded_paths:
     merger = PdfMerger()
@@ -135,7 +125,8 @@ if downloaded_paths:
         merger.append(pdf)
     merged_name = f"Virtus_{today_str}_Merged.pdf"
     merged_path = os.path.join(downloads_dir, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"\nMerged {len(downloaded_paths)} PDFs into {merged_name}")
 else:
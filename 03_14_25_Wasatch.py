@@ -1,9 +1,12 @@
 import os
-import requests
 from datetime import datetime
 from urllib.parse import urljoin
+from bs4 import BeautifulSoup
 from PyPDF2 import PdfMerger
 from playwright.sync_api import sync_playwright
+from run_profiler import stage
+from download_engine import download_all
+from async_crawl import crawl
 
 # === Setup Paths ===
 MAIN_URL = "https://wasatchglobal.com/mutual-fund-performance-overviews/"
@@ -25,8 +28,7 @@ print("Launching Playwright and loading Wasatch fund overview page...")
 
 with sync_playwright() as p:
     headless_mode = os.environ.get("HEADLESS_MODE", "true").lower() == "true"
-    browser = p.chromium.launch(headless=headless_mode, slow_mo=0 if headless_mode else 150)
-    #browser = p.chromium.launch(headless=False, slow_mo=150)
+    browser = p.chromium.launch(headless=headless_mode)
     context = browser.new_context()
     page = context.new_page()
     page.goto(MAIN_URL, wait_until="domcontentloaded", timeout=120000)
@@ -53,58 +55,50 @@ with sync_playwright() as p:
 
     print(f"Matched {len(filtered_links)} U.S. Mutual Fund links.")
 
-    # === Step 2: Visit each and collect commentary PDFs ===
-    pdf_links = []
-
-    for ticker, href in filtered_links:
-        try:
-            print(f"Visiting fund page for: {ticker} → {href}")
-            new_page = context.new_page()
-            new_page.goto(href, wait_until="domcontentloaded", timeout=60000)
-
-            # Locate and filter links to commentary PDFs
-            commentary_links = new_page.locator("a:has(span:text('Commentary'))")
-            c_count = commentary_links.count()
-
-            for j in range(c_count):
-                a = commentary_links.nth(j)
-                file_href = a.get_attribute("href")
-                if file_href and "Commentary" in file_href and file_href.endswith(".pdf"):
-                    full_url = file_href if file_href.startswith("http") else urljoin(href, file_href)
-                    title = f"{ticker}_Commentary"
-                    pair = (title, full_url)
-                    if pair not in pdf_links:
-                        pdf_links.append(pair)
-                        print(f"  Found: {full_url}")
-
-            new_page.close()
-
-        except Exception as e:
-            print(f"  Failed to process {ticker}: {e}")
-
     browser.close()
 
+# === Step 2: Crawl the Fund Pages in Parallel Tabs and Collect Commentary PDFs ===
+def commentary_links(page_html, href):
+    soup = BeautifulSoup(page_html, "html.parser")
+    pdf_urls = []
+    for a in soup.select("a[href]"):
+        if not any("commentary" in span.get_text().lower() for span in a.find_all("span")):
+            continue
+        file_href = a["href"]
+        if "Commentary" in file_href and file_href.endswith(".pdf"):
+            pdf_urls.append(file_href if file_href.startswith("http") else urljoin(href, file_href))
+    return pdf_urls
+
+tickers = {href: ticker for ticker, href in filtered_links}
+crawled = crawl([href for _, href in filtered_links], commentary_links, wait_for="a:has(span:text('Commentary'))",
+                headless=headless_mode)
+
+pdf_links = []
+for href, pdf_urls, error in crawled:
+    ticker = tickers[href]
+    print(f"Fund page for: {ticker} → {href}")
+    if error is not None:
+        print(f"  Failed to process {ticker}: {error}")
+        continue
+    for full_url in pdf_urls:
+        pair = (f"{ticker}_Commentary", full_url)
+        if pair not in pdf_links:
+            pdf_links.append(pair)
+            print(f"  Found: {full_url}")
+
 print(f"\nFinal count of unique PDFs to download: {len(pdf_links)}")
 
 # === Step 3: Download PDFs ===
 downloaded_paths = []
+filenames = [title.replace(" ", "_").replace("/", "-") + ".pdf" for title, _ in pdf_links]
+results = download_all([(url, os.path.join(downloads_dir, filename)) for (_, url), filename in zip(pdf_links, filenames)])
 
-for title, url in pdf_links:
-    filename = title.replace(" ", "_").replace("/", "-") + ".pdf"
-    filepath = os.path.join(downloads_dir, filename)
-    print(f"Downloading: {url}")
-
-    try:
-        response = requests.get(url, timeout=30)
-        if response.ok and response.headers.get("Content-Type", "").lower().startswith("application/pdf"):
-            with open(filepath, "wb") as f:
-                f.write(response.content)
-            print(f"Saved: {filename}")
-            downloaded_paths.append(filepath)
-        else:
-            print("Invalid PDF response.")
-    except Exception as e:
-        print(f"Failed to download: {e}")
+for filename, result in zip(filenames, results):
+    if result.error:
+        print(f"Failed to download {result.url}: {result.error}")
+        continue
+    print(f"Saved: {filename}")
+    downloaded_paths.append(result.path)
 
 # === Step 4: Merge PDFs ===
 if downloaded_paths:
@@ -113,7 +107,8 @@ if downloaded_paths:
         merger.append(path)
     merged_name = f"Wasatch_{today_str}_Merged.pdf"
     merged_path = os.path.join(downloads_dir, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"\nMerged {len(downloaded_paths)} PDFs into {merged_name}")
 else:
@@ -1,10 +1,11 @@
 import os
-import time
-import requests
 from datetime import datetime
 from urllib.parse import urljoin
 from PyPDF2 import PdfMerger
 from playwright.sync_api import sync_playwright
+from run_profiler import stage
+from waits import wait_for_dom_stable
+from download_engine import download_all
 
 # === Setup Paths ===
 URL = "https://weitzinvestments.com/perspectives/commentary/default.fs"
@@ -25,7 +26,7 @@ for f in os.listdir(downloads_dir):
 print("Launching Playwright to scrape Weitz commentary page...")
 
 with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False, slow_mo=150)
+    browser = p.chromium.launch(headless=False)
     context = browser.new_context()
     page = context.new_page()
     page.goto(URL, timeout=120000)
@@ -42,7 +43,7 @@ with sync_playwright() as p:
             toggle.scroll_into_view_if_needed()
             toggle.click()
             print(f"Expanded: {toggle.inner_text()}")
-            time.sleep(1)
+            wait_for_dom_stable(page, timeout=5)
         except Exception as e:
             print(f"Failed to expand section {i}: {e}")
 
@@ -65,22 +66,14 @@ with sync_playwright() as p:
 
 # === Step 2: Download PDFs ===
 downloaded_paths = []
-for title, url in pdf_links:
-    filename = title + ".pdf"
-    filepath = os.path.join(downloads_dir, filename)
-    print(f"Downloading: {url}")
+results = download_all([(url, os.path.join(downloads_dir, title + ".pdf")) for title, url in pdf_links])
 
-    try:
-        response = requests.get(url, timeout=30)
-        if response.ok and response.headers.get("Content-Type", "").lower().startswith("application/pdf"):
-            with open(filepath, "wb") as f:
-                f.write(response.content)
-            print(f"Saved: {filename}")
-            downloaded_paths.append(filepath)
-        else:
-            print("Invalid PDF response.")
-    except Exception as e:
-        print(f"Failed to download: {e}")
+for (title, url), result in zip(pdf_links, results):
+    if result.error:
+        print(f"Failed to download {url}: {result.error}")
+        continue
+    print(f"Saved: {title}.pdf")
+    downloaded_paths.append(result.path)
 
 # === Step 3: Merge PDFs ===
 if downloaded_paths:
@@ -89,7 +82,8 @@ if downloaded_paths:
         merger.append(path)
     merged_name = f"Weitz_{today_str}_Merged.pdf"
     merged_path = os.path.join(downloads_dir, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"\nMerged {len(downloaded_paths)} PDFs into {merged_name}")
 else:
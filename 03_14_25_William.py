@@ -1,5 +1,4 @@
 import os
-import time
 import requests
 from datetime import datetime
 from PyPDF2 import PdfMerger
@@ -7,6 +6,9 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from progress_events import emit
+from run_profiler import stage
+from waits import wait_for_dom_stable
 
 # === Config ===
 URL = "https://www.williamblairfunds.com/literature/fund-literature/manager-commentaries/"
@@ -35,7 +37,7 @@ driver = uc.Chrome(options=options)
 
 # === Load Page ===
 driver.get(URL)
-time.sleep(10) 
+wait_for_dom_stable(driver)
 
 # === Wait for all <a> links to appear on the page ===
 try:
@@ -76,6 +78,7 @@ for link in pdf_links:
         r = requests.get(link, timeout=20)
         with open(file_path, "wb") as f:
             f.write(r.content)
+        emit("pdf_downloaded", path=file_path, bytes=os.path.getsize(file_path))
         pdf_paths.append(file_path)
     except Exception as e:
         print(f" Failed to download {filename}: {e}")
@@ -90,7 +93,8 @@ if pdf_paths:
     today = datetime.today().strftime("%Y%m%d")
     merged_name = f"WilliamBlair_{today}_Merged.pdf"
     merged_path = os.path.join(downloads_dir, merged_name)
-    merger.write(merged_path)
+    with stage("merge"):
+        merger.write(merged_path)
     merger.close()
     print(f"\n Merged {len(pdf_paths)} PDFs into: {merged_name}")
 else:
@@ -1,6 +1,4 @@
 import os
-import time
-import requests
 import sys
 import warnings
 from datetime import datetime, timedelta
@@ -10,7 +8,8 @@ import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from playwright.sync_api import sync_playwright
+from async_crawl import crawl, playwright_cookies
+from download_engine import download_all
 
 # === Setup ===
 BASE_URL = "https://www.saturna.com"
@@ -86,65 +85,39 @@ for block in blocks:
 
 print(f"{len(valid_links)} articles within last 4 months")
 
-# === Step 3: Use Playwright to visit article pages and download PDFs ===
-downloaded_paths = []
+# === Step 3: Crawl the Article Pages in Parallel Tabs and Download PDFs ===
+def article_pdf_links(article_html, article_url):
+    article_soup = BeautifulSoup(article_html, "html.parser")
+    return [a["href"] if a["href"].startswith("http") else BASE_URL + a["href"]
+            for a in article_soup.select("a[href$='.pdf']")]
+
+crawled = crawl([article_url for _, _, article_url in valid_links], article_pdf_links, wait_for="a[href$='.pdf']",
+                headless=False, context_options={"user_agent": user_agent},
+                cookies=playwright_cookies(selenium_cookies))
+results = {result.url: result for result in crawled}
+
+pairs = []
+for label, date_str, article_url in valid_links:
+    _, pdf_urls, error = results[article_url]
+    print(f"\nArticle: {article_url}")
+    if error is not None:
+        print(f"Failed to load article page: {error}")
+        continue
+    if not pdf_urls:
+        print("No PDF links found.")
+        continue
+    for i, full_pdf_url in enumerate(pdf_urls):
+        print(f"Found {full_pdf_url}")
+        pairs.append((full_pdf_url, os.path.join(downloads_dir, f"{label}_{date_str}_{i+1}.pdf")))
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=False, slow_mo=200)
-    context = browser.new_context(user_agent=user_agent)
-
-    for cookie in selenium_cookies:
-        try:
-            context.add_cookies([{
-                "name": cookie['name'],
-                "value": cookie['value'],
-                "domain": cookie['domain'].lstrip('.'),
-                "path": cookie['path'],
-                "expires": cookie.get('expiry'),
-                "httpOnly": cookie['httpOnly'],
-                "secure": cookie['secure'],
-                "sameSite": "Lax"
-            }])
-        except Exception as e:
-            print(f"Skipping cookie due to error: {e}")
-
-    page = context.new_page()
-
-    for label, date_str, article_url in valid_links:
-        print(f"\nVisiting: {article_url}")
-        try:
-            page.goto(article_url, timeout=60000)
-            time.sleep(2)
-            article_html = page.content()
-            article_soup = BeautifulSoup(article_html, "html.parser")
-
-            pdf_links = article_soup.select("a[href$='.pdf']")
-            if not pdf_links:
-                print("No PDF links found.")
-                continue
-
-            for i, pdf_a in enumerate(pdf_links):
-                href = pdf_a["href"]
-                full_pdf_url = href if href.startswith("http") else BASE_URL + href
-                filename = f"{label}_{date_str}_{i+1}.pdf"
-                filepath = os.path.join(downloads_dir, filename)
-
-                print(f"Downloading {full_pdf_url}")
-                try:
-                    response = requests.get(full_pdf_url, timeout=30)
-                    if response.ok and response.headers.get("Content-Type", "").lower().startswith("application/pdf"):
-                        with open(filepath, "wb") as f:
-                            f.write(response.content)
-                        print(f"Saved: {filename}")
-                        downloaded_paths.append(filepath)
-                    else:
-                        print("Invalid PDF response or content type.")
-                except Exception as e:
-                    print(f"Failed to download: {e}")
-        except Exception as e:
-            print(f"Failed to load article page: {e}")
-
-    browser.close()
+# Download every PDF at once over pooled connections
+downloaded_paths = []
+for result in download_all(pairs):
+    if result.error:
+        print(f"Failed to download {result.url}: {result.error}")
+        continue
+    print(f"Saved: {os.path.basename(result.path)}")
+    downloaded_paths.append(result.path)
 
 # === Step 4: Merge downloaded PDFs ===
 if downloaded_paths:
@@ -0,0 +1,98 @@
+# async_crawl.py
+import asyncio
+import os
+import time
+from collections import namedtuple
+
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+# Tabs open at once in the crawling context; CUTLER_CRAWL_TABS=1 visits pages one by one
+CRAWL_TABS = int(os.getenv("CUTLER_CRAWL_TABS", "6"))
+PAGE_TIMEOUT = 60000
+# How long to wait for a page's link selector before parsing whatever has loaded
+SELECTOR_TIMEOUT = 15000
+# Resource types a link crawl never needs; not fetching them is most of the page weight
+BLOCKED_RESOURCES = {"image", "media", "font"}
+
+CrawlResult = namedtuple("CrawlResult", ["url", "value", "error"])
+
+def playwright_cookies(selenium_cookies):
+    """Convert cookies from Selenium's driver.get_cookies() for context.add_cookies()."""
+    cookies = []
+    for cookie in selenium_cookies:
+        converted = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie["domain"].lstrip("."),
+            "path": cookie["path"],
+            "httpOnly": cookie["httpOnly"],
+            "secure": cookie["secure"],
+            "sameSite": "Lax",
+        }
+        if cookie.get("expiry") is not None:
+            converted["expires"] = cookie["expiry"]
+        cookies.append(converted)
+    return cookies
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def _crawl(urls, extract, wait_for, tabs, headless, context_options, cookies, log):
+    results = {}
+    pending = asyncio.Queue()
+    for url in urls:
+        pending.put_nowait(url)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        context = await browser.new_context(**(context_options or {}))
+        for cookie in cookies:
+            try:
+                await context.add_cookies([cookie])
+            except Exception as e:
+                log(f"Skipping cookie: {e}")
+        await context.route("**/*", _block_heavy_resources)
+
+        async def tab():
+            # Each tab is reused for its share of the URLs instead of opening a page per URL
+            page = await context.new_page()
+            while not pending.empty():
+                url = pending.get_nowait()
+                try:
+                    await page.goto(url, wait_until="domcontentloaded", timeout=PAGE_TIMEOUT)
+                    if wait_for:
+                        try:
+                            await page.wait_for_selector(wait_for, state="attached", timeout=SELECTOR_TIMEOUT)
+                        except PlaywrightTimeoutError:
+                            pass  # parsed as is; extract() decides whether the page has nothing
+                    html = await page.content()
+                    # Parsing in a thread keeps the other tabs loading meanwhile
+                    results[url] = CrawlResult(url, await asyncio.to_thread(extract, html, url), None)
+                except Exception as e:
+                    results[url] = CrawlResult(url, None, e)
+            await page.close()
+
+        await asyncio.gather(*(tab() for _ in range(tabs)))
+        await browser.close()
+    return [results[url] for url in urls]
+
+def crawl(urls, extract, wait_for=None, tabs=CRAWL_TABS, headless=True, context_options=None, cookies=(),
+          log=print):
+    """Load `urls` in up to `tabs` concurrent tabs of one browser context; returns a CrawlResult per URL, in order.
+
+    Each page is waited on until `wait_for` (a Playwright selector) is in
+    the DOM, then extract(html, url) runs on its HTML; the return value is
+    the result's value, an exception is its error. `cookies` are Playwright
+    cookie dicts (see playwright_cookies) added to the context first.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return []
+    tabs = max(1, min(tabs, len(urls)))
+    started = time.perf_counter()
+    results = asyncio.run(_crawl(urls, extract, wait_for, tabs, headless, context_options, cookies, log))
+    log(f"Crawled {len(urls)} pages with {tabs} tabs in {time.perf_counter() - started:.1f}s")
+    return results
@@ -0,0 +1,228 @@
+# browser_pool.py
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+# Path to your manually downloaded ChromeDriver
+DRIVER_PATH = r"C:\chromedriver-win64\chromedriver.exe"
+# Warm Chrome instances kept per process (one per scraper_scheduler browser worker, so
+# none of them waits for a browser), and pages served by one before it is restarted
+# (long-lived Chrome slowly grows in memory)
+MAX_BROWSERS = 3
+MAX_USES = 25
+HEALTH_CHECK_TIMEOUT = 10
+
+DEFAULT_ARGUMENTS = (
+    "--headless",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--enable-unsafe-swiftshader",  # Fix for WebGL issue
+    "--log-level=3",
+    "--disable-web-security",
+    "--ignore-certificate-errors",
+    "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/99.0.4844.51 Safari/537.36",
+)
+# Opening a PDF URL saves the file instead of showing Chrome's viewer; the
+# folder is set per tab with set_download_directory()
+DEFAULT_PREFS = {
+    "download.prompt_for_download": False,
+    "plugins.always_open_pdf_externally": True,
+}
+
+def chrome_options(extra_arguments=()):
+    options = Options()
+    for argument in DEFAULT_ARGUMENTS + tuple(extra_arguments):
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", DEFAULT_PREFS)
+    return options
+
+def set_download_directory(driver, directory):
+    """Save this browser's downloads to `directory` until it is set again."""
+    driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+        "behavior": "allow",
+        "downloadPath": os.path.abspath(directory),
+    })
+
+class _Browser:
+    def __init__(self, driver):
+        self.driver = driver
+        self.home = driver.current_window_handle
+        self.uses = 0
+        self.broken = False
+
+    def healthy(self):
+        try:
+            self.driver.set_script_timeout(HEALTH_CHECK_TIMEOUT)
+            return self.driver.execute_script("return 1") == 1 and self.home in self.driver.window_handles
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+class BrowserPool:
+    """A few warm Chrome instances handed out one tab at a time.
+
+    A WebDriver session only drives one window at a time, so each browser
+    serves one page() at once; callers in other threads wait for a free one.
+    Each page() gets a fresh tab whose cookies and site storage are wiped
+    when it is returned, so funds and documents do not see each other's
+    sessions. A browser that fails its health check or has served
+    MAX_USES pages is quit and replaced.
+    """
+
+    def __init__(self, max_browsers=MAX_BROWSERS, max_uses=MAX_USES, extra_arguments=(), driver_path=DRIVER_PATH):
+        self.max_browsers = max_browsers
+        self.max_uses = max_uses
+        self.extra_arguments = tuple(extra_arguments)
+        self.driver_path = driver_path
+        self._idle = []
+        self._started = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def _launch(self):
+        started = time.perf_counter()
+        driver = webdriver.Chrome(service=Service(self.driver_path), options=chrome_options(self.extra_arguments))
+        print(f"Started Chrome in {time.perf_counter() - started:.1f}s")
+        return _Browser(driver)
+
+    def warm(self, count=None):
+        """Start browsers now (up to `count`, default all) instead of on first use."""
+        count = min(count or self.max_browsers, self.max_browsers)
+        while True:
+            with self._condition:
+                if self._started >= count:
+                    return
+                self._started += 1
+            try:
+                browser = self._launch()
+            except Exception:
+                with self._condition:
+                    self._started -= 1
+                    self._condition.notify()
+                raise
+            self._release(browser)
+
+    def _acquire(self, deadline=None):
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("browser pool is closed")
+                if self._idle:
+                    browser = self._idle.pop()
+                    break
+                if self._started < self.max_browsers:
+                    self._started += 1
+                    browser = None
+                    break
+                if deadline is None:
+                    self._condition.wait()
+                    continue
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise TimeoutError(f"no browser became free (all {self.max_browsers} in use)")
+                self._condition.wait(left)
+        if browser is not None and browser.healthy():
+            return browser
+        if browser is not None:
+            print("Replacing an unresponsive Chrome")
+            browser.quit()
+        try:
+            return self._launch()
+        except Exception:
+            with self._condition:
+                self._started -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, browser):
+        retire = browser.broken or browser.uses >= self.max_uses
+        with self._condition:
+            if retire or self._closed:
+                self._started -= 1
+            else:
+                self._idle.append(browser)
+            self._condition.notify()
+        if retire or self._closed:
+            browser.quit()
+
+    @contextmanager
+    def page(self, label=None, deadline=None):
+        """Yield a driver switched to a new, clean tab of a warm browser.
+
+        `label` (fund or document name) is only used in log messages. With a
+        `deadline` (a time.monotonic() value) waiting for a free browser
+        raises TimeoutError once it has passed.
+        """
+        browser = self._acquire(deadline)
+        driver = browser.driver
+        try:
+            driver.switch_to.new_window("tab")
+        except Exception:
+            browser.broken = True
+            self._release(browser)
+            raise
+        browser.uses += 1
+        try:
+            yield driver
+        except Exception:
+            if not browser.healthy():
+                print(f"Chrome stopped responding{f' during {label}' if label else ''}; it will be restarted")
+                browser.broken = True
+            raise
+        finally:
+            if not browser.broken:
+                self._reset_tab(browser)
+            self._release(browser)
+
+    def _reset_tab(self, browser):
+        driver = browser.driver
+        try:
+            origin = urlsplit(driver.current_url)
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            if origin.scheme in ("http", "https"):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                    "origin": f"{origin.scheme}://{origin.netloc}",
+                    "storageTypes": "local_storage,session_storage,indexeddb,service_workers,cache_storage",
+                })
+            driver.close()
+            driver.switch_to.window(browser.home)
+        except Exception:
+            browser.broken = True
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._started -= len(idle)
+            self._condition.notify_all()
+        for browser in idle:
+            browser.quit()
+
+# === Process-Wide Pool ===
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def shared_pool(**options):
+    """The pool every scraper in this process draws from; created (with `options`) on first call."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = BrowserPool(**options)
+            atexit.register(_shared.close)
+        return _shared
@@ -0,0 +1,120 @@
+# company_matcher.py
+from collections import deque
+
+try:
+    import ahocorasick  # pyahocorasick, optional C implementation
+except ImportError:
+    ahocorasick = None
+
+def _is_word_char(ch):
+    # Same notion of a word character as re's \w for str patterns
+    return ch.isalnum() or ch == "_"
+
+def _is_boundary(text, index):
+    """Equivalent of re's \\b at `index` in `text`."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+def _fold(text):
+    """Lowercase `text` without changing its length so match offsets stay valid."""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    # A handful of characters (e.g. "İ") expand when lowercased
+    return "".join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
+
+class _Automaton:
+    """Pure-Python Aho-Corasick automaton, used when pyahocorasick is not installed."""
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        for value, pattern in patterns:
+            state = 0
+            for ch in pattern:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(value)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def iter(self, text):
+        """Yield (end_index, value) for every pattern occurrence, like pyahocorasick."""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for index, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for value in output[state]:
+                    yield index, value
+
+class CompanyMatcher:
+    """Single-pass, whole-word matcher for many company names.
+
+    Matches the same occurrences as re.search(rf"\\b{re.escape(name)}\\b", text, re.IGNORECASE)
+    for every name (without re.IGNORECASE when `case_sensitive`), but scans
+    the text once regardless of the number of names.
+    """
+
+    def __init__(self, names, case_sensitive=False):
+        self.names = list(dict.fromkeys(name for name in names if name))
+        self._fold = (lambda text: text) if case_sensitive else _fold
+        patterns = [(i, self._fold(name)) for i, name in enumerate(self.names)]
+        self._lengths = [len(pattern) for _, pattern in patterns]
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for value, pattern in patterns:
+                existing = self._automaton.get(pattern, ())
+                self._automaton.add_word(pattern, existing + (value,))
+            self._automaton.make_automaton()
+            self._iter = self._iter_pyahocorasick
+        else:
+            self._automaton = _Automaton(patterns)
+            self._iter = self._automaton.iter
+
+    def _iter_pyahocorasick(self, text):
+        for end, values in self._automaton.iter(text):
+            for value in values:
+                yield end, value
+
+    def find(self, text):
+        """Return the set of names that occur in `text` as whole words."""
+        found = set()
+        folded = self._fold(text)
+        for end, value in self._iter(folded):
+            start = end - self._lengths[value] + 1
+            if _is_boundary(text, start) and _is_boundary(text, end + 1):
+                found.add(self.names[value])
+        return found
+
+    def paragraph_companies(self, text):
+        """Split `text` on blank lines and return [(paragraph, names mentioned)], paragraphs stripped."""
+        return [(paragraph.strip(), self.find(paragraph)) for paragraph in text.split("\n\n")]
+
+    def group_by_company(self, text):
+        """Return {name: [paragraphs mentioning it]} with names in construction order."""
+        grouped = {}
+        for paragraph, names in self.paragraph_companies(text):
+            for name in names:
+                grouped.setdefault(name, []).append(paragraph)
+        return {name: grouped[name] for name in self.names if name in grouped}
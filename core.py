@@ -1,163 +1,125 @@
 import os
-import subprocess
+import sys
 from datetime import datetime
-from PyPDF2 import PdfMerger
-from excerption_base import extract_full_text_from_pdf, identify_companies_in_text, extract_company_paragraphs, filter_relevant_paragraphs, remove_duplicate_paragraphs
-from tickers import tickers
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import LETTER
-import textwrap
+from funds import fund_scripts
+from pipeline import COMPILED_DIR, run_pipeline, render_part, merge_pdfs
+from scraper_scheduler import format_durations
+from progress_events import ProgressTracker
+from run_ledger import RunLedger, format_timings
+import run_profiler
+from run_profiler import ProfileReport
 import streamlit as st
-import threading
-import time
 
 # === Setup Directories ===
-base_dir = os.path.join(os.getcwd(), "Cutler")
-compiled_dir = os.path.join(base_dir, "Compiled")
+compiled_dir = COMPILED_DIR
 os.makedirs(compiled_dir, exist_ok=True)
 today_str = datetime.today().strftime("%Y%m%d")
 
-# === Define Fund Scripts ===
-fund_scripts = {
-    "Amana (Saturna Capital)": "03_14_25_Amana.py",
-    "American Century Investments (ACI)": "03_14_25_ACI.py",
-    "Allianz Global Investors": "03_14_25_Allianz.py",
-    "Alger Funds": "03_14_25_Alger.py",
-    "ALPS Funds": "03_14_25_ALPS.py",
-    "Appleseed Fund": "03_14_25_Appleseed.py",
-    "Ariel Investments": "03_14_25_Ariel.py",
-    "Artisan Partners": "03_14_25_Artisan.py",
-    "Baird Asset Management": "03_14_25_Baird.py",
-    "Baron Capital": "03_14_25_Baron.py",
-    "Brookfield Asset Management": "03_14_25_Brookfield.py",
-    "Buffalo Funds": "03_14_25_Buffalo.py",
-    "Causeway Capital": "03_14_25_Causeway.py",
-    "Cavanal Hill Funds": "03_14_25_CavanalHill.py",
-    "Clipper Fund": "03_14_25_Clipper.py",
-    "Dodge & Cox": "03_14_25_DodgeCox.py",
-    "Fidelity Investments": "03_14_25_Fidelity.py",
-    "First Eagle Fund": "03_14_25_FirstEagleFund.py",
-    "Gabelli Funds": "03_14_25_Gabelli.py",
-    "Harbor Funds": "03_14_25_Harbor.py",
-    "Longleaf Partners": "03_14_25_Longleaf.py",
-    "MFS Investment Management": "03_14_25_MFS.py",
-    "Oakmark Fund": "03_14_25_Oakmark.py",
-    "Poplar Forest Funds": "03_14_25_PFF.py",
-    "Sequoia Funds": "03_14_25_Sequoia.py",
-    "Touchstone Mutual Funds": "03_14_25_Touchstone.py",
-    "Tweedy Browne Funds": "03_14_25_Tweedy.py",
-    "T. Rowe Price": "03_14_25_TRowe.py",
-    "Transamerica": "03_14_25_Transamerica.py",
-    "Value Line Funds": "03_14_25_ValueLine.py",
-    "Victory Funds": "03_14_25_Victory.py",
-    "Virtus Funds": "03_14_25_Virtus.py",
-    "Wasatch Global Funds": "03_14_25_Wasatch.py",
-    "Weitz Investments": "03_14_25_Weitz.py",
-    "William Blair Funds": "03_14_25_William.py"
-}
-
 st.title("Cutler Capital: Full Mutual Fund Compilation")
 
+# `streamlit run core.py -- --resume` starts with resuming ticked
+resume = st.checkbox("Resume the previous run (only redo failed or missing work)", value="--resume" in sys.argv)
+profile_stage = st.selectbox("Capture a cProfile of one stage", ["(none)"] + list(run_profiler.STAGES))
+
 if st.button("Download All Reports and Generate Compiled Excerpt"):
-    all_pdf_paths = []
+    ledger = RunLedger()
+    run_id = ledger.start_run(resume=resume)
+    # Scrapers and worker processes inherit the environment, so every process profiles the same stage
+    if profile_stage == "(none)":
+        os.environ.pop(run_profiler.PROFILE_STAGE_ENV, None)
+    else:
+        os.environ[run_profiler.PROFILE_STAGE_ENV] = profile_stage
+    profile = ProfileReport()
     status_placeholder = st.empty()
     progress_bar = st.progress(0)
     skipped_funds = []
+    scraper_results = []
+    fund_pdfs = {}
+    fund_parts = {}
+    unchanged_funds = set()
 
     total = len(fund_scripts)
-    for i, (fund_name, script) in enumerate(fund_scripts.items()):
-        status_placeholder.markdown(f"Running scraper for **{fund_name}**")
-        fund_folder = fund_name.replace(" ", "_").replace("&", "and").replace(".", "")
-        fund_dir = os.path.join(base_dir, fund_folder, "downloads")
-        os.makedirs(fund_dir, exist_ok=True)
-
-        try:
-            subprocess.run(["python", script], check=True, timeout=120)
-        except subprocess.CalledProcessError as e:
-            st.error(f"Script failed for {fund_name}: {e}")
+    status_placeholder.markdown(f"Running scrapers for **{total}** funds (run {run_id})...")
+    tracker = ProgressTracker(fund_scripts)
+
+    # Scraping, text extraction, excerption and rendering overlap: each fund
+    # is rendered as soon as its own excerpt is ready
+    for update in run_pipeline(fund_scripts, scrape_options={"timeout": 120}, ledger=ledger):
+        fund_name = update.fund
+        if update.kind == "resumed":
+            st.info(f"{fund_name}: already scraped in run {run_id}, not scraping again")
+        elif update.kind == "profile":
+            profile.add(fund_name, update.payload)
+        elif update.kind == "event":
+            tracker.update(fund_name, update.payload)
+            status_placeholder.markdown(f"Working — {tracker.summary()}")
+        elif update.kind == "scraped":
+            result = update.payload
+            scraper_results.append(result)
+            if result.timed_out:
+                st.warning(f"Script for {fund_name} timed out.")
+            elif result.returncode != 0:
+                st.error(f"Script failed for {fund_name}: exit status {result.returncode}")
+        elif update.kind == "sources":
+            fund_pdfs[fund_name] = update.payload
+            if not update.payload:
+                st.warning(f"No PDFs found for {fund_name} after running {fund_scripts[fund_name]}")
+        elif update.kind == "extract_failed":
+            pdf_path, error = update.payload
+            st.error(f"Text extraction failed for {os.path.basename(pdf_path)} ({fund_name}): {error}")
+        elif update.kind == "excerpt_failed":
+            st.error(f"Excerption failed for {fund_name}: {update.payload}")
+        elif update.kind == "unchanged":
+            unchanged_funds.add(fund_name)
+            st.info(f"{fund_name}: source PDFs unchanged, reusing the previous excerpt")
+        elif update.kind == "skipped":
             skipped_funds.append(fund_name)
-            continue
-        except subprocess.TimeoutExpired:
-            st.warning(f"Script for {fund_name} timed out.")
-            skipped_funds.append(fund_name)
-            continue
-
-        pdfs_found = False
-        for file in os.listdir(fund_dir):
-            if file.endswith(".pdf"):
-                file_path = os.path.join(fund_dir, file)
-                all_pdf_paths.append((fund_name, file_path))
-                pdfs_found = True
-
-        if not pdfs_found:
-            st.warning(f"No PDFs found for {fund_name} after running {script}")
-            skipped_funds.append(fund_name)
-
-        progress_bar.progress((i + 1) / total)
-
-    compiled_merged_path = os.path.join(compiled_dir, f"Compiled_{today_str}_Merged.pdf")
-    merger = PdfMerger()
-    for _, path in all_pdf_paths:
-        merger.append(path)
-    merger.write(compiled_merged_path)
-    merger.close()
-    st.success(f"Merged PDF saved to: {compiled_merged_path}")
-    st.download_button("Download Merged PDF", compiled_merged_path, file_name=os.path.basename(compiled_merged_path))
+        elif update.kind == "excerpted" and update.payload:
+            # A part rendered earlier in this run is only current if the excerpt was reused as-is
+            try:
+                fund_parts[fund_name] = render_part(fund_name, update.payload, today_str, ledger,
+                                                    reuse=fund_name in unchanged_funds)
+            except Exception as e:
+                st.error(f"Rendering failed for {fund_name}: {e}")
+            else:
+                st.success(f"Excerpted {fund_name}: {len(update.payload)} companies")
+
+        if update.kind in ("excerpted", "excerpt_failed", "skipped"):
+            tracker.finish(fund_name)
+            status_placeholder.markdown(f"Finished **{fund_name}** — {tracker.summary()}")
+        progress_bar.progress(tracker.fraction())
+
+    st.text("Scraper durations:\n" + "\n".join(format_durations(scraper_results)))
+    st.text(f"Stage timings (run {run_id}):\n" + "\n".join(format_timings(ledger.timings())))
 
     if skipped_funds:
         st.warning("The following funds were skipped:")
         for fund in skipped_funds:
             st.text(f"- {fund}")
 
-    st.write("Starting excerption...")
-    full_text = extract_full_text_from_pdf(compiled_merged_path)
-    results_by_fund = {}
-
-    for fund_name, _ in all_pdf_paths:
-        if fund_name not in results_by_fund:
-            results_by_fund[fund_name] = {}
-        for ticker, company in tickers.items():
-            paras = extract_company_paragraphs(full_text, company)
-            filtered = filter_relevant_paragraphs(paras, tickers)
-            if filtered:
-                if company not in results_by_fund[fund_name]:
-                    results_by_fund[fund_name][company] = []
-                results_by_fund[fund_name][company].extend(filtered)
-
-    for fund in results_by_fund:
-        results_by_fund[fund] = remove_duplicate_paragraphs(results_by_fund[fund])
+    # Merge only at the very end, for the downloadable compiled PDF
+    compiled_merged_path = os.path.join(compiled_dir, f"Compiled_{today_str}_Merged.pdf")
+    merge_pdfs([path for fund_name in fund_scripts for path in fund_pdfs.get(fund_name, [])], compiled_merged_path)
+    st.success(f"Merged PDF saved to: {compiled_merged_path}")
+    st.download_button("Download Merged PDF", compiled_merged_path, file_name=os.path.basename(compiled_merged_path))
 
+    # Stitch the per-fund excerpts together in fund order regardless of which finished first
     output_pdf_path = os.path.join(compiled_dir, f"Excerpted_Compiled_{today_str}.pdf")
-    c = canvas.Canvas(output_pdf_path, pagesize=LETTER)
-    width, height = LETTER
-    y = height - 50
-    line_height = 14
-
-    for fund, company_dict in results_by_fund.items():
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(50, y, f"{fund}")
-        y -= line_height * 2
-
-        for company, paragraphs in company_dict.items():
-            c.setFont("Helvetica-Bold", 14)
-            c.drawString(50, y, f"{company}")
-            y -= line_height
-            c.setFont("Helvetica", 12)
-            for i, para in enumerate(paragraphs, 1):
-                lines = textwrap.wrap(f"Paragraph {i}: {para}", width=100)
-                for line in lines:
-                    if y <= 50:
-                        c.showPage()
-                        y = height - 50
-                        c.setFont("Helvetica", 12)
-                    c.drawString(50, y, line)
-                    y -= line_height
-                y -= line_height
-            y -= line_height * 2
-            if y <= 50:
-                c.showPage()
-                y = height - 50
-
-    c.save()
+    merge_pdfs([fund_parts[fund_name] for fund_name in fund_scripts if fund_name in fund_parts], output_pdf_path)
     st.success(f"Excerpted PDF saved to: {output_pdf_path}")
     st.download_button("Download Excerpted PDF", output_pdf_path, file_name=os.path.basename(output_pdf_path))
+
+    profile.add(None, run_profiler.drain())
+    profile_html = profile.write()[1]
+    st.text("Slowest stages:\n" + "\n".join(
+        f"{row['stage']}: {row['wall']:.1f}s wall, {row['cpu']:.1f}s CPU" for row in profile.stage_totals()[:5]))
+    st.text("Most idle scrapers (waiting / sleeping / working):\n" + "\n".join(
+        f"{row['fund']}: {row['wait']:.1f}s / {row['sleep']:.1f}s / {row['work']:.1f}s"
+        for row in profile.idle_rows()[:5]))
+    st.success(f"Stage profile saved to: {profile_html}")
+
+    failed = [row for row in ledger.timings() if row[2] == "failed"]
+    ledger.finish_run("failed" if failed else "done")
+    ledger.close()
+    if failed:
+        st.warning(f"{len(failed)} stages failed; rerun with resume ticked to redo only those.")
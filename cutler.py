@@ -0,0 +1,197 @@
+# cutler.py
+"""Headless entry point for the full compilation, e.g. from cron:
+
+    python -m cutler run --funds "Sequoia Funds" "Tweedy Browne Funds" --scrape-workers 8 --ocr-workers 16 --resume
+    python -m cutler list
+
+Exits 0 when every fund was scraped, excerpted and rendered, 1 otherwise.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+import excerption_base
+from funds import fund_scripts, fund_folder
+from pipeline import COMPILED_DIR, EXTRACT_WORKERS, run_pipeline, render_part, merge_pdfs
+from run_ledger import RunLedger, format_timings
+import run_profiler
+from run_profiler import ProfileReport
+from scraper_scheduler import (format_durations, DEFAULT_MAX_WORKERS, DEFAULT_MAX_BROWSER_WORKERS,
+                               DEFAULT_MAX_HTTP_WORKERS)
+
+# Same scraper timeout as core.py
+DEFAULT_SCRAPE_TIMEOUT = 120
+
+def resolve_funds(names):
+    """Map fund names or folder names to fund_scripts keys, in fund order; raises ValueError on unknown names."""
+    if not names:
+        return list(fund_scripts)
+    by_folder = {fund_folder(fund).lower(): fund for fund in fund_scripts}
+    by_name = {fund.lower(): fund for fund in fund_scripts}
+    wanted, unknown = set(), []
+    for name in names:
+        fund = by_name.get(name.lower()) or by_folder.get(name.lower())
+        if fund is None:
+            unknown.append(name)
+        else:
+            wanted.add(fund)
+    if unknown:
+        raise ValueError(f"Unknown funds: {', '.join(unknown)} (see `python -m cutler list`)")
+    return [fund for fund in fund_scripts if fund in wanted]
+
+def run(options, funds):
+    if options.ocr_workers:
+        excerption_base.OCR_WORKERS = options.ocr_workers
+    if options.adaptive_ocr:
+        excerption_base.ADAPTIVE_OCR = True
+    if options.profile_stage:
+        # Inherited by scrapers and worker processes
+        os.environ[run_profiler.PROFILE_STAGE_ENV] = options.profile_stage
+    scrape_options = {
+        "max_workers": options.scrape_workers,
+        "max_browser_workers": options.browser_workers,
+        "max_http_workers": options.http_workers,
+        "timeout": options.scrape_timeout,
+    }
+    date_str = datetime.today().strftime("%Y%m%d")
+    os.makedirs(COMPILED_DIR, exist_ok=True)
+
+    ledger = RunLedger()
+    run_id = ledger.start_run(resume=options.resume)
+    started = time.perf_counter()
+    log = lambda message: print(f"[{time.perf_counter() - started:7.1f}s] {message}", flush=True)
+    log(f"Run {run_id}: {len(funds)} funds, {options.scrape_workers} scrapers, "
+        f"{options.extract_workers} extract processes, {excerption_base.OCR_WORKERS} OCR workers")
+
+    scraper_results = []
+    fund_pdfs = {}
+    fund_parts = {}
+    unchanged_funds = set()
+    problems = {}
+    profile = ProfileReport()
+
+    for update in run_pipeline(funds, scrape_options=scrape_options, extract_workers=options.extract_workers,
+                               ledger=ledger):
+        fund = update.fund
+        if update.kind == "event":
+            if options.verbose:
+                log(f"{fund}: {update.payload['event'].replace('_', ' ')}")
+        elif update.kind == "profile":
+            profile.add(fund, update.payload)
+        elif update.kind == "resumed":
+            log(f"{fund}: already scraped in run {run_id}")
+        elif update.kind == "scraped":
+            result = update.payload
+            scraper_results.append(result)
+            if result.returncode == 0:
+                log(f"{fund}: scraped in {result.duration:.1f}s")
+            else:
+                status = "timed out" if result.timed_out else f"exit status {result.returncode}"
+                problems[fund] = f"scraper {status}"
+                log(f"{fund}: scraper {status}")
+                if options.verbose and result.stderr:
+                    print(result.stderr, file=sys.stderr)
+        elif update.kind == "sources":
+            fund_pdfs[fund] = update.payload
+            log(f"{fund}: {len(update.payload)} source PDFs")
+        elif update.kind == "extract_failed":
+            pdf_path, error = update.payload
+            problems[fund] = f"extraction failed for {os.path.basename(pdf_path)}"
+            log(f"{fund}: extraction failed for {os.path.basename(pdf_path)}: {error}")
+        elif update.kind == "unchanged":
+            unchanged_funds.add(fund)
+            log(f"{fund}: sources unchanged, reusing the previous excerpt")
+        elif update.kind == "excerpt_failed":
+            problems[fund] = f"excerption failed: {update.payload}"
+            log(f"{fund}: excerption failed: {update.payload}")
+        elif update.kind == "skipped":
+            problems.setdefault(fund, f"skipped: {update.payload}")
+            log(f"{fund}: skipped ({update.payload})")
+        elif update.kind == "excerpted":
+            if not update.payload:
+                log(f"{fund}: no relevant paragraphs")
+                continue
+            try:
+                fund_parts[fund] = render_part(fund, update.payload, date_str, ledger, reuse=fund in unchanged_funds)
+            except Exception as e:
+                problems[fund] = f"rendering failed: {e}"
+                log(f"{fund}: rendering failed: {e}")
+            else:
+                log(f"{fund}: excerpted {len(update.payload)} companies")
+
+    merged_path = os.path.join(COMPILED_DIR, f"Compiled_{date_str}_Merged.pdf")
+    merge_pdfs([path for fund in funds for path in fund_pdfs.get(fund, [])], merged_path)
+    output_path = os.path.join(COMPILED_DIR, f"Excerpted_Compiled_{date_str}.pdf")
+    merge_pdfs([fund_parts[fund] for fund in funds if fund in fund_parts], output_path)
+    log(f"Merged PDF: {merged_path}")
+    log(f"Excerpted PDF: {output_path}")
+
+    print("\nScraper durations:")
+    print("\n".join(format_durations(scraper_results)) or "(none run)")
+    print(f"\nStage timings (run {run_id}):")
+    print("\n".join(format_timings(ledger.timings())))
+    print("\nStage totals (wall / CPU / peak RSS):")
+    profile.add(None, run_profiler.drain())
+    for row in profile.stage_totals():
+        rss = f"{row['peak_rss'] / (1024 * 1024):.0f} MB" if row["peak_rss"] else "n/a"
+        print(f"{row['stage']}: {row['wall']:.1f}s / {row['cpu']:.1f}s / {rss} ({row['calls']} calls)")
+    idle = [row for row in profile.idle_rows() if row["wait"] + row["sleep"] > 0]
+    if idle:
+        print("\nScraper time waiting / sleeping / working:")
+        for row in idle:
+            print(f"{row['fund']}: {row['wait']:.1f}s / {row['sleep']:.1f}s / {row['work']:.1f}s")
+    profile_html = profile.write()[1]
+    print(f"Profile report: {profile_html}")
+    if options.profile_stage:
+        print(f"cProfile output for {options.profile_stage}: {run_profiler.PROFILES_DIR}")
+    print(f"\nTotal: {time.perf_counter() - started:.1f}s for {len(funds)} funds")
+
+    ledger.finish_run("failed" if problems else "done")
+    ledger.close()
+    if problems:
+        print(f"\n{len(problems)} funds had problems (rerun with --resume to redo only those):", file=sys.stderr)
+        for fund, problem in problems.items():
+            print(f"- {fund}: {problem}", file=sys.stderr)
+        return 1
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m cutler", description="Cutler fund report compilation.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list the fund names accepted by --funds")
+
+    run_parser = commands.add_parser("run", help="scrape, excerpt and compile reports")
+    run_parser.add_argument("--funds", nargs="+", metavar="FUND", help="fund or folder names (default: all)")
+    run_parser.add_argument("--scrape-workers", type=int, default=DEFAULT_MAX_WORKERS, help="scrapers at once")
+    run_parser.add_argument("--browser-workers", type=int, default=DEFAULT_MAX_BROWSER_WORKERS,
+                            help="browser scrapers at once")
+    run_parser.add_argument("--http-workers", type=int, default=DEFAULT_MAX_HTTP_WORKERS,
+                            help="plain HTTP scrapers at once")
+    run_parser.add_argument("--scrape-timeout", type=float, default=DEFAULT_SCRAPE_TIMEOUT,
+                            help="seconds before a scraper is killed")
+    run_parser.add_argument("--extract-workers", type=int, default=EXTRACT_WORKERS,
+                            help="processes extracting text and excerpting")
+    run_parser.add_argument("--ocr-workers", type=int, default=None,
+                            help="Tesseract processes in total, split between extract workers")
+    run_parser.add_argument("--adaptive-ocr", action="store_true", help="OCR at low DPI, re-OCR unsure pages")
+    run_parser.add_argument("--profile-stage", choices=run_profiler.STAGES,
+                            help="capture a cProfile of this stage in every process")
+    run_parser.add_argument("--resume", action="store_true", help="continue the last unfinished run")
+    run_parser.add_argument("-v", "--verbose", action="store_true", help="print progress events and scraper errors")
+
+    options = parser.parse_args(argv)
+    if options.command == "list":
+        for fund in fund_scripts:
+            print(f"{fund}  ({fund_folder(fund)})")
+        return 0
+    try:
+        funds = resolve_funds(options.funds)
+    except ValueError as e:
+        parser.error(str(e))
+    return run(options, funds)
+
+if __name__ == "__main__":
+    sys.exit(main())
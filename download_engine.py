@@ -0,0 +1,88 @@
+# download_engine.py
+import asyncio
+import os
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from progress_events import emit
+from run_profiler import stage
+
+try:
+    import h2  # noqa: F401  (httpx only speaks HTTP/2 when the h2 package is installed)
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# Downloads in flight at once, in total and per host; sites throttle a client
+# that opens many connections, so the per-host cap stays small
+MAX_CONNECTIONS = 16
+PER_HOST_CONNECTIONS = 4
+DEFAULT_TIMEOUT = 30
+# Connection failures (not HTTP errors) are retried this many times
+CONNECT_RETRIES = 2
+
+DownloadResult = namedtuple("DownloadResult", ["url", "path", "changed", "error"])
+# Error of downloads cut off by download_all's deadline
+DEADLINE_ERROR = "deadline reached"
+
+async def _download_one(client, url, dest_path, manifest, headers, host_limit):
+    async with host_limit:
+        try:
+            if manifest is not None:
+                existing, request_headers = manifest.request_headers(url, headers)
+                response = await client.get(url, headers=request_headers)
+                path, changed = manifest.record(url, dest_path, existing, response)
+                return DownloadResult(url, path, changed, None)
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            if not response.content.startswith(b"%PDF"):
+                raise ValueError(f"{url} did not return a PDF ({response.headers.get('Content-Type', 'unknown type')})")
+            with open(dest_path, "wb") as f:
+                f.write(response.content)
+            emit("pdf_downloaded", path=dest_path, bytes=os.path.getsize(dest_path))
+            return DownloadResult(url, dest_path, True, None)
+        except Exception as e:
+            # httpx timeouts have empty messages, so keep the exception type; status errors add a help line
+            return DownloadResult(url, None, False, f"{type(e).__name__}: {e}".splitlines()[0])
+
+async def _download(pairs, manifest, headers, max_connections, per_host, timeout, deadline):
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2, limits=limits, retries=CONNECT_RETRIES)
+    host_limits = {}
+    for url, _ in pairs:
+        host_limits.setdefault(urlsplit(url).netloc, asyncio.Semaphore(per_host))
+    async with httpx.AsyncClient(transport=transport, timeout=timeout, follow_redirects=True) as client:
+        tasks = [asyncio.ensure_future(_download_one(client, url, dest_path, manifest, headers,
+                                                     host_limits[urlsplit(url).netloc]))
+                 for url, dest_path in pairs]
+        remaining = None if deadline is None else max(0, deadline - time.monotonic())
+        done, pending = await asyncio.wait(tasks, timeout=remaining)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        return [task.result() if task in done else DownloadResult(url, None, False, DEADLINE_ERROR)
+                for task, (url, _) in zip(tasks, pairs)]
+
+def download_all(pairs, manifest=None, headers=None, max_connections=MAX_CONNECTIONS,
+                 per_host=PER_HOST_CONNECTIONS, timeout=DEFAULT_TIMEOUT, deadline=None):
+    """Download (url, dest_path) pairs concurrently; returns a DownloadResult per pair, in order.
+
+    All downloads share one keep-alive connection pool (HTTP/2 where the
+    server and the h2 package allow), with at most `max_connections` in
+    flight and `per_host` per host. With a FundManifest, unchanged
+    documents are kept via conditional requests exactly as manifest.fetch()
+    would; without one, the response must be a PDF and is written to
+    dest_path. A failed download has an `error` message instead of raising.
+    Downloads still running at `deadline` (a time.monotonic() value) are
+    abandoned with the error DEADLINE_ERROR.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return []
+    # One stage call for the batch: the downloads overlap, so per-file times would overcount
+    with stage("download", manifest.fund if manifest is not None else None):
+        return asyncio.run(_download(pairs, manifest, headers, max_connections, per_host, timeout, deadline))
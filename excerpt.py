@@ -2,7 +2,10 @@
 import os
 import sys
 from PyPDF2 import PdfMerger
-from excerption_base import main as refine_excerpt, save_results_to_pdf
+import excerption_base
+from excerption_base import main as refine_excerpt, save_results_to_pdf, select_source_pdfs
+from fund_manifest import inputs_fingerprint, current_excerpt, save_excerpt_state
+from progress_events import emit
 
 BASE_DIR = os.path.join(os.getcwd(), "Cutler")
 
@@ -31,6 +34,22 @@ def process_fund(fund_name):
     os.makedirs(excerpted_dir, exist_ok=True)
 
     print(f"\n--- Processing: {fund_name} ---")
+    emit("fund_started", fund=fund_name)
+
+    source_pdfs = select_source_pdfs([
+        os.path.join(downloads_dir, f) for f in os.listdir(downloads_dir) if f.endswith(".pdf")
+    ])
+    fingerprint = inputs_fingerprint(source_pdfs) if source_pdfs else None
+    output_path = os.path.join(excerpted_dir, f"Excerpted_{folder_name}.pdf")
+    state = current_excerpt(excerpted_dir, fingerprint) if fingerprint else None
+    if state is not None:
+        # Same source PDFs as last time: reuse the saved excerpt instead of re-OCRing
+        if state["results"] and not os.path.isfile(output_path):
+            save_results_to_pdf(state["results"], output_path)
+            print(f" Source PDFs unchanged. Re-rendered saved excerpt to: {output_path}")
+        else:
+            print(" Source PDFs unchanged since the last excerpt. Skipping.")
+        return
 
     # Check for pre-merged file first
     merged_pdf_path = None
@@ -64,26 +83,38 @@ def process_fund(fund_name):
     # Run excerption
     try:
         print(" Running paragraph-level filtering...")
-        results = refine_excerpt(merged_pdf_path)
+        results = refine_excerpt(merged_pdf_path, label=fund_name)
+        excerption_base.check_cancelled()
         if results:
-            out_name = f"Excerpted_{folder_name}.pdf"
-            output_path = os.path.join(excerpted_dir, out_name)
             save_results_to_pdf(results, output_path)
             print(f" Excerpt saved to: {output_path}")
         else:
             print(f" No relevant content found in: {merged_pdf_path}")
+        if fingerprint:
+            save_excerpt_state(excerpted_dir, fingerprint, results)
+    except excerption_base.ExcerptCancelled:
+        raise
     except Exception as e:
         print(f" Error processing {merged_pdf_path}: {e}")
 
 if __name__ == "__main__":
     selected_funds = sys.argv[1:]
 
+    # --adaptive-ocr: OCR scanned pages at low DPI, re-rendering only low-confidence pages
+    if "--adaptive-ocr" in selected_funds:
+        selected_funds.remove("--adaptive-ocr")
+        excerption_base.ADAPTIVE_OCR = True
+
     if not selected_funds:
         print(" No mutual fund names passed. Exiting.")
         sys.exit(1)
 
     for fund in selected_funds:
         process_fund(fund)
+        emit("fund_done", fund=fund)
+
+    for fund, (pages, escalated) in excerption_base.adaptive_ocr_stats.items():
+        print(f" Adaptive OCR {fund}: {escalated}/{pages} pages escalated to {excerption_base.ADAPTIVE_HIGH_DPI} DPI")
 
     print("\n Excerpt generation completed.")
 
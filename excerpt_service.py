@@ -0,0 +1,262 @@
+# excerpt_service.py
+import argparse
+import contextlib
+import multiprocessing
+import os
+import queue
+import secrets
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+from funds import fund_folder
+from progress_events import ENABLED_ENV, parse_event, run_with_events
+
+# The service only listens on localhost. Requests arrive as pickles, so only
+# clients holding the secret key may connect: $CUTLER_EXCERPT_SERVICE_KEY if
+# set, else a random key the service writes on first start to a file only
+# this user can read
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = int(os.getenv("CUTLER_EXCERPT_SERVICE_PORT", "6070"))
+SERVICE_KEY_ENV = "CUTLER_EXCERPT_SERVICE_KEY"
+# Both derive from this file's directory, so the service and its clients agree
+# on the key even when started from different working directories
+SERVICE_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVICE_KEY_PATH = os.path.join(SERVICE_DIR, "Cutler", "cache", "excerpt_service.key")
+SERVICE_WORKERS = 2
+EXCERPT_SCRIPT = os.path.join(SERVICE_DIR, "excerpt.py")
+
+class ServiceUnavailable(Exception):
+    """No excerpt service could be reached; nothing was sent to it."""
+
+def service_authkey(create=False):
+    """The service's auth key, or None if there is none yet.
+
+    With create=True (the service itself) a missing key file is generated.
+    """
+    key = os.getenv(SERVICE_KEY_ENV)
+    if key:
+        return key.encode("utf-8")
+    try:
+        with open(SERVICE_KEY_PATH, "rb") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        if not create:
+            return None
+    os.makedirs(os.path.dirname(SERVICE_KEY_PATH), exist_ok=True)
+    key = secrets.token_hex(32).encode("ascii")
+    try:
+        fd = os.open(SERVICE_KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another service instance created it first
+        return service_authkey()
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+def _connect(port):
+    authkey = service_authkey()
+    if authkey is None:
+        raise ServiceUnavailable("no excerpt service key (the service has never been started)")
+    try:
+        return Client((SERVICE_HOST, port), authkey=authkey)
+    except (OSError, EOFError, AuthenticationError) as e:
+        raise ServiceUnavailable(f"{type(e).__name__}: {e}") from e
+
+# === Service Workers ===
+# Each pre-forked worker imports excerption_base once and keeps its company
+# matcher, OCR cache, Tesseract pool (and LayoutLM, if enabled) for every fund it handles
+
+def _init_service_worker(ocr_workers):
+    started = time.perf_counter()
+    os.environ[ENABLED_ENV] = "1"
+    import excerption_base
+    import excerpt  # noqa: F401  (imported once here instead of per request)
+    excerption_base.OCR_WORKERS = ocr_workers
+    excerption_base.get_company_matcher()
+    excerption_base.get_ocr_cache()
+    excerption_base.get_ocr_engine()
+    if excerption_base.ENABLE_LAYOUTLM:
+        excerption_base.get_layoutlm()
+    print(f"Excerpt worker {os.getpid()} ready in {time.perf_counter() - started:.1f}s "
+          f"(module import {excerption_base.IMPORT_SECONDS:.1f}s)", flush=True)
+
+def _worker_ready():
+    return os.getpid()
+
+class _EventWriter:
+    """stdout replacement that forwards progress event lines and keeps the rest."""
+
+    def __init__(self, events):
+        self.events = events
+        self.lines = []
+        self._partial = ""
+
+    def write(self, text):
+        self._partial += text
+        *complete, self._partial = self._partial.split("\n")
+        for line in complete:
+            event = parse_event(line)
+            if event is None:
+                self.lines.append(line + "\n")
+            else:
+                self.events.put(event)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def output(self):
+        return "".join(self.lines) + self._partial
+
+def _serve_excerpt(folder_name, adaptive_ocr, events, cancelled):
+    import excerption_base
+    import excerpt
+    from progress_events import emit
+
+    excerption_base.ADAPTIVE_OCR = adaptive_ocr
+    excerption_base.cancel_event = cancelled
+    writer = _EventWriter(events)
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(writer):
+            excerpt.process_fund(folder_name)
+            emit("fund_done", fund=folder_name)
+    except excerption_base.ExcerptCancelled:
+        return {"ok": False, "cancelled": True, "output": writer.output(), "error": "cancelled",
+                "seconds": time.perf_counter() - started}
+    except Exception as e:
+        return {"ok": False, "output": writer.output(), "error": f"{type(e).__name__}: {e}",
+                "seconds": time.perf_counter() - started}
+    finally:
+        # The worker outlives this fund; keep only the warm models and caches, not per-fund state
+        excerption_base.cancel_event = None
+        excerption_base.clear_paragraph_cache()
+        excerption_base.adaptive_ocr_stats.clear()
+    return {"ok": True, "output": writer.output(), "error": None, "seconds": time.perf_counter() - started}
+
+# === Server ===
+
+def _handle_connection(conn, executor, manager):
+    with conn:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request.get("op") == "ping":
+            conn.send({"result": {"ok": True, "pid": os.getpid()}})
+            return
+        events = manager.Queue()
+        cancelled = manager.Event()
+        future = executor.submit(_serve_excerpt, request["folder"], bool(request.get("adaptive_ocr")),
+                                 events, cancelled)
+        try:
+            while True:
+                if conn.poll():
+                    # The only message a client sends mid-request is {"op": "cancel"}
+                    conn.recv()
+                    cancelled.set()
+                    return
+                try:
+                    conn.send({"event": events.get(timeout=0.2)})
+                except queue.Empty:
+                    if future.done() and events.empty():
+                        break
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process itself died (e.g. a crash inside Tesseract or poppler)
+                result = {"ok": False, "output": "", "error": f"{type(e).__name__}: {e}", "seconds": None}
+            conn.send({"result": result})
+        except (EOFError, OSError):
+            # Client went away; nobody is waiting for this fund, so stop it at the next page
+            cancelled.set()
+
+def serve(workers=SERVICE_WORKERS, ocr_workers=None, port=SERVICE_PORT):
+    """Pre-fork `workers` warm excerpt processes and answer requests until interrupted."""
+    import excerption_base
+    authkey = service_authkey(create=True)
+    ocr_workers = ocr_workers or max(1, excerption_base.OCR_WORKERS // workers)
+    manager = multiprocessing.Manager()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_service_worker,
+                             initargs=(ocr_workers,)) as executor:
+        # Submitting one task per worker makes the pool start (and warm) every process now
+        for future in [executor.submit(_worker_ready) for _ in range(workers)]:
+            future.result()
+        print(f"Excerpt service listening on {SERVICE_HOST}:{port} with {workers} workers")
+        with Listener((SERVICE_HOST, port), authkey=authkey) as listener:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (AuthenticationError, EOFError, OSError) as e:
+                    print(f"Rejected a connection: {type(e).__name__}: {e}")
+                    continue
+                threading.Thread(target=_handle_connection, args=(conn, executor, manager), daemon=True).start()
+
+# === Client ===
+
+def service_available(port=SERVICE_PORT):
+    try:
+        with _connect(port) as conn:
+            conn.send({"op": "ping"})
+            return conn.recv()["result"]["ok"]
+    except (ServiceUnavailable, OSError, EOFError):
+        return False
+
+def request_excerpt(folder_name, adaptive_ocr=False, on_event=None, cancel=None, port=SERVICE_PORT):
+    """Have the running service excerpt one fund folder and return its result dict.
+
+    on_event(event) receives the fund's progress events as they happen. If
+    the threading.Event `cancel` is set the service is told to stop the fund
+    (before its next page, without writing an excerpt) and the call returns
+    {"ok": False, "cancelled": True}.
+    Raises ServiceUnavailable if no service accepted the connection, and
+    OSError or EOFError if the connection drops after the request was sent.
+    """
+    with _connect(port) as conn:
+        conn.send({"op": "excerpt", "folder": folder_name, "adaptive_ocr": adaptive_ocr})
+        while True:
+            if cancel is not None and cancel.is_set():
+                with contextlib.suppress(OSError):
+                    conn.send({"op": "cancel"})
+                return {"ok": False, "cancelled": True, "output": "", "error": "cancelled", "seconds": None}
+            if not conn.poll(0.5):
+                continue
+            message = conn.recv()
+            if "event" in message:
+                if on_event is not None:
+                    on_event(message["event"])
+                continue
+            return message["result"]
+
+def excerpt_fund(fund_name, on_event=None, cancel=None, adaptive_ocr=False):
+    """Excerpt one fund through the warm service, or in a fresh excerpt.py process if none is running.
+
+    Returns (returncode, stdout, stderr, timed_out) like run_with_events.
+    """
+    folder_name = fund_folder(fund_name)
+    try:
+        result = request_excerpt(folder_name, adaptive_ocr, on_event, cancel)
+    except ServiceUnavailable:
+        cmd = [sys.executable, EXCERPT_SCRIPT, folder_name] + (["--adaptive-ocr"] if adaptive_ocr else [])
+        return run_with_events(cmd, on_event, cancel=cancel)
+    except (OSError, EOFError) as e:
+        # The service already has the fund and may still be writing its excerpt;
+        # a second excerpt.py would write the same files, so report instead
+        return 1, "", f"Lost the excerpt service connection: {type(e).__name__}: {e}", False
+    returncode = 0 if result["ok"] else 1
+    return returncode, result["output"], result["error"] or "", False
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep warm excerpt workers running and serve fund requests.")
+    parser.add_argument("--workers", type=int, default=SERVICE_WORKERS, help="funds excerpted at once")
+    parser.add_argument("--ocr-workers", type=int, default=None, help="Tesseract processes per worker")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    options = parser.parse_args()
+    try:
+        serve(options.workers, options.ocr_workers, options.port)
+    except KeyboardInterrupt:
+        print("Excerpt service stopped")
@@ -1,5 +1,7 @@
-from pdf2image import convert_from_path
-from transformers import LayoutLMv3Processor, LayoutLMv3ForTokenClassification
+import time
+_import_started = time.perf_counter()
+
+from pdf2image import convert_from_path, pdfinfo_from_path
 import pytesseract
 import re
 import string
@@ -8,41 +10,370 @@ from reportlab.lib.pagesizes import LETTER
 from reportlab.pdfgen import canvas
 import os
 import textwrap
-from concurrent.futures import ThreadPoolExecutor
-
-# Load LayoutLMv3 Model
-processor = LayoutLMv3Processor.from_pretrained("microsoft/layoutlmv3-base")
-model = LayoutLMv3ForTokenClassification.from_pretrained("microsoft/layoutlmv3-base")
-
-def pdf_to_images(pdf_path, dpi=300):
-    poppler_path = r"C:\poppler-24.08.0\Library\bin" 
-    images = convert_from_path(pdf_path, dpi=dpi, poppler_path=poppler_path)
+from concurrent.futures import wait, FIRST_COMPLETED
+from PyPDF2 import PdfReader
+from ocr_cache import OCRCache, page_image_key
+from ocr_engine import OCREngine, DEFAULT_OCR_WORKERS
+from company_matcher import CompanyMatcher
+from near_duplicates import NearDuplicateIndex
+from progress_events import emit
+from run_profiler import stage
+import atexit
+import hashlib
+from collections import OrderedDict, namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# LayoutLMv3 is not used by the excerption pipeline; loading it costs seconds of
+# torch/transformers import and hundreds of MB, so it is opt-in and loaded lazily
+LAYOUTLM_MODEL_NAME = "microsoft/layoutlmv3-base"
+ENABLE_LAYOUTLM = os.getenv("CUTLER_ENABLE_LAYOUTLM", "").lower() in ("1", "true", "yes")
+_layoutlm = None
+
+def get_layoutlm():
+    """Return the (processor, model) pair, loading it on first use.
+
+    Requires ENABLE_LAYOUTLM (or CUTLER_ENABLE_LAYOUTLM=1 in the environment).
+    """
+    global _layoutlm
+    if not ENABLE_LAYOUTLM:
+        raise RuntimeError("LayoutLMv3 is disabled; set CUTLER_ENABLE_LAYOUTLM=1 to load it.")
+    if _layoutlm is None:
+        from transformers import LayoutLMv3Processor, LayoutLMv3ForTokenClassification
+        started = time.perf_counter()
+        processor = LayoutLMv3Processor.from_pretrained(LAYOUTLM_MODEL_NAME)
+        model = LayoutLMv3ForTokenClassification.from_pretrained(LAYOUTLM_MODEL_NAME)
+        print(f"Loaded {LAYOUTLM_MODEL_NAME} in {time.perf_counter() - started:.1f}s")
+        _layoutlm = (processor, model)
+    return _layoutlm
+
+POPPLER_PATH = r"C:\poppler-24.08.0\Library\bin"
+# Pages rendered per pdftoppm call while streaming
+RASTER_WINDOW = 4
+# Rendered pages allowed to wait for or sit in OCR at the same time
+OCR_MAX_IN_FLIGHT = 8
+
+def pdf_to_images(pdf_path, dpi=300, first_page=None, last_page=None):
+    with stage("rasterize"):
+        images = convert_from_path(pdf_path, dpi=dpi, poppler_path=POPPLER_PATH,
+                                   first_page=first_page, last_page=last_page)
     return images
 
+def pdf_page_count(pdf_path):
+    return pdfinfo_from_path(pdf_path, poppler_path=POPPLER_PATH)["Pages"]
+
+def iter_pdf_images(pdf_path, page_numbers=None, dpi=300, window=RASTER_WINDOW):
+    """Yield (page_number, image) pairs, rendering at most `window` pages at a time.
+
+    Unlike pdf_to_images this never holds the whole document in memory, so it
+    is safe on the compiled merged PDFs with thousands of pages.
+    """
+    if page_numbers is None:
+        page_numbers = range(1, pdf_page_count(pdf_path) + 1)
+    for first, last in _page_runs(sorted(page_numbers)):
+        for start in range(first, last + 1, window):
+            end = min(start + window - 1, last)
+            images = pdf_to_images(pdf_path, dpi=dpi, first_page=start, last_page=end)
+            for offset, image in enumerate(images):
+                yield start + offset, image
+            del images
+
+# Extra Tesseract command line options; part of the OCR cache key
+TESSERACT_CONFIG = ""
+OCR_CACHE_ENABLED = True
+# Tesseract worker processes; each runs with OMP_THREAD_LIMIT=1
+OCR_WORKERS = DEFAULT_OCR_WORKERS
+_ocr_cache = None
+_ocr_engine = None
+_tesseract_version_str = None
+
+def _tesseract_version():
+    global _tesseract_version_str
+    if _tesseract_version_str is None:
+        _tesseract_version_str = str(pytesseract.get_tesseract_version())
+    return _tesseract_version_str
+
+def get_ocr_cache():
+    global _ocr_cache
+    if _ocr_cache is None and OCR_CACHE_ENABLED:
+        _ocr_cache = OCRCache()
+    return _ocr_cache
+
+def get_ocr_engine():
+    global _ocr_engine
+    if _ocr_engine is None:
+        _ocr_engine = OCREngine(workers=OCR_WORKERS, config=TESSERACT_CONFIG)
+        atexit.register(_ocr_engine.shutdown)
+    return _ocr_engine
+
+def shutdown_ocr_engine():
+    global _ocr_engine
+    if _ocr_engine is not None:
+        atexit.unregister(_ocr_engine.shutdown)
+        _ocr_engine.shutdown()
+        _ocr_engine = None
+
 def extract_text_with_ai(image):
     """Extract text from an image using OCR and AI-powered LayoutLMv3"""
-    extracted_text = pytesseract.image_to_string(image)
+    extracted_text = pytesseract.image_to_string(image, config=TESSERACT_CONFIG)
     return extracted_text.strip()
 
-""" def extract_full_text_from_pdf(pdf_path):
-    images = pdf_to_images(pdf_path)
-    full_text = ""
-    for img in images:
-        full_text += extract_text_with_ai(img) + "\n\n"
-    return full_text
- """
-
-def extract_full_text_from_pdf(pdf_path):
-    images = pdf_to_images(pdf_path)
-    print(f"Starting parallel OCR on {len(images)} pages...")
-    
-    def ocr_page(img):
-        return extract_text_with_ai(img)
-
-    with ThreadPoolExecutor() as executor:
-        texts = list(executor.map(ocr_page, images))
-
-    return "\n\n".join(texts)
+# === Cancellation ===
+# A caller that may abandon a fund (the excerpt service) sets `cancel_event` to
+# anything with is_set(); the OCR loop checks it before every page
+cancel_event = None
+
+class ExcerptCancelled(Exception):
+    """The excerpt was cancelled before it finished."""
+
+def check_cancelled():
+    if cancel_event is not None and cancel_event.is_set():
+        raise ExcerptCancelled()
+
+def ocr_page_images(page_images, dpi=300, max_in_flight=OCR_MAX_IN_FLIGHT, with_confidence=False):
+    """OCR (page_number, image) pairs as they are produced.
+
+    The producer is only advanced while fewer than `max_in_flight` pages are
+    queued in the OCR engine, which keeps peak memory flat regardless of the
+    document length. Pages found in the OCR cache never reach the engine.
+    Returns {page_number: text}, or {page_number: (text, mean confidence)}
+    with `with_confidence`.
+    """
+    # Includes rasterizing, since page images are rendered as the loop pulls them
+    with stage("ocr"):
+        engine = get_ocr_engine()
+        cache = get_ocr_cache()
+        cache_config = f"{_tesseract_version()}|{TESSERACT_CONFIG}|{'data' if with_confidence else 'string'}"
+        results = {}
+        pending = {}
+        ocr_count = 0
+        start = time.perf_counter()
+
+        def collect(done):
+            for future in done:
+                page_number, key = pending.pop(future)
+                results[page_number] = future.result()
+                emit("page_ocr", page=page_number)
+                if key is not None:
+                    if with_confidence:
+                        cache.put(key, *results[page_number])
+                    else:
+                        cache.put(key, results[page_number])
+
+        for page_number, image in page_images:
+            if cancel_event is not None and cancel_event.is_set():
+                image.close()
+                for future in pending:
+                    future.cancel()
+                raise ExcerptCancelled()
+            key = None
+            if cache is not None:
+                key = page_image_key(image, dpi, cache_config)
+                cached = cache.get_with_confidence(key)
+                if cached is not None and (cached[1] is not None or not with_confidence):
+                    results[page_number] = cached if with_confidence else cached[0]
+                    image.close()
+                    emit("page_ocr", page=page_number, cached=True)
+                    continue
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending[engine.submit(image, with_confidence=with_confidence)] = (page_number, key)
+            image.close()
+            ocr_count += 1
+        collect(wait(pending).done)
+
+        if ocr_count:
+            print(f"[{dpi} DPI] " + engine.throughput_report(ocr_count, time.perf_counter() - start))
+        return results
+
+# === Adaptive-DPI OCR ===
+# OCR pages at ADAPTIVE_LOW_DPI first and re-render only the ones whose mean
+# Tesseract word confidence is below ADAPTIVE_MIN_CONFIDENCE at ADAPTIVE_HIGH_DPI.
+# Pages with no recognised words (blank or pure graphics) are final at the low DPI
+ADAPTIVE_OCR = False
+ADAPTIVE_LOW_DPI = 150
+ADAPTIVE_HIGH_DPI = 300
+ADAPTIVE_MIN_CONFIDENCE = 80.0
+# label -> [pages OCR'd, pages escalated to ADAPTIVE_HIGH_DPI]
+adaptive_ocr_stats = {}
+
+def ocr_pages_adaptive(pdf_path, page_numbers=None, label=None,
+                       low_dpi=None, high_dpi=None, min_confidence=None):
+    """OCR pages at low DPI, escalating low-confidence pages to high DPI.
+
+    Returns {page_number: text}. Escalation counts are accumulated in
+    adaptive_ocr_stats under `label` (defaults to the PDF file name).
+    """
+    low_dpi = low_dpi or ADAPTIVE_LOW_DPI
+    high_dpi = high_dpi or ADAPTIVE_HIGH_DPI
+    min_confidence = ADAPTIVE_MIN_CONFIDENCE if min_confidence is None else min_confidence
+    label = label or os.path.basename(pdf_path)
+
+    first_pass = ocr_page_images(iter_pdf_images(pdf_path, page_numbers, dpi=low_dpi),
+                                 dpi=low_dpi, with_confidence=True)
+    texts = {number: text for number, (text, _) in first_pass.items()}
+    # text_and_confidence reports 0.0 for a page without words; that is not a low-confidence read
+    escalate = sorted(number for number, (text, conf) in first_pass.items()
+                      if text.strip() and conf < min_confidence)
+    if escalate:
+        texts.update(ocr_page_images(iter_pdf_images(pdf_path, escalate, dpi=high_dpi), dpi=high_dpi))
+
+    counts = adaptive_ocr_stats.setdefault(label, [0, 0])
+    counts[0] += len(first_pass)
+    counts[1] += len(escalate)
+    if first_pass:
+        print(f"Adaptive OCR [{label}]: {len(escalate)}/{len(first_pass)} pages below "
+              f"{min_confidence:.0f} confidence at {low_dpi} DPI re-OCR'd at {high_dpi} DPI "
+              f"({len(escalate) / len(first_pass):.0%} escalation)")
+    return texts
+
+def ocr_pdf_pages(pdf_path, page_numbers=None, label=None):
+    if ADAPTIVE_OCR:
+        return ocr_pages_adaptive(pdf_path, page_numbers, label=label)
+    return ocr_page_images(iter_pdf_images(pdf_path, page_numbers))
+
+# === Native Text Layer Fast Path ===
+# Pages with fewer meaningful characters than this are treated as image-only
+MIN_TEXT_LAYER_CHARS = 40
+# Share of characters that must be letters, digits, whitespace or common punctuation
+MIN_TEXT_LAYER_CLEAN_RATIO = 0.85
+
+def is_usable_text_layer(text):
+    """Return True if an embedded page text layer looks like real, readable text."""
+    if not text:
+        return False
+    stripped = "".join(text.split())
+    if len(stripped) < MIN_TEXT_LAYER_CHARS:
+        return False
+    # Broken font encodings show up as (cid:123) runs or replacement characters
+    if "(cid:" in text or text.count("\ufffd") > len(stripped) * 0.01:
+        return False
+    clean = sum(1 for ch in stripped if ch.isalnum() or ch in string.punctuation)
+    if clean / len(stripped) < MIN_TEXT_LAYER_CLEAN_RATIO:
+        return False
+    # Glyph soup (one character per "word") is what bad text layers usually look like
+    words = text.split()
+    alpha_words = [w for w in words if any(ch.isalpha() for ch in w)]
+    if not alpha_words:
+        return False
+    avg_word_len = sum(len(w) for w in alpha_words) / len(alpha_words)
+    return 2.0 <= avg_word_len <= 20.0
+
+def reflow_text_layer(text):
+    """Rebuild blank-line separated paragraphs from a PDF text layer.
+
+    PyPDF2 returns one line per visual line with no blank lines between
+    paragraphs, while the downstream filters split on "\\n\\n" like Tesseract output.
+    A paragraph ends on an empty line or on a short line ending a sentence;
+    short unpunctuated lines are kept as headings.
+    """
+    lines = [line.strip() for line in text.splitlines()]
+    widths = sorted(len(line) for line in lines if line)
+    if not widths:
+        return ""
+    full_width = widths[int(len(widths) * 0.9)] if len(widths) > 1 else widths[0]
+
+    paragraphs = []
+    current = []
+    for line in lines:
+        if not line:
+            if current:
+                paragraphs.append(" ".join(current))
+                current = []
+            continue
+        if not current and len(line) < full_width * 0.5 and line[-1] not in string.punctuation:
+            paragraphs.append(line)  # headings stand on their own
+            continue
+        if current and current[-1].endswith("-") and line[:1].islower():
+            current[-1] = current[-1][:-1] + line  # re-join hyphenated words
+        else:
+            current.append(line)
+        if line[-1] in ".!?:\"”" and len(line) < full_width * 0.75:
+            paragraphs.append(" ".join(current))
+            current = []
+    if current:
+        paragraphs.append(" ".join(current))
+    return "\n\n".join(paragraphs)
+
+def extract_text_layer_pages(pdf_path):
+    """Return the embedded text of every page (None where extraction fails)."""
+    texts = []
+    reader = PdfReader(pdf_path)
+    for page in reader.pages:
+        try:
+            texts.append(page.extract_text() or "")
+        except Exception as e:
+            print(f"Text layer extraction failed on a page of {pdf_path}: {e}")
+            texts.append(None)
+    return texts
+
+def _page_runs(page_numbers):
+    """Group sorted 1-based page numbers into contiguous (first, last) ranges."""
+    runs = []
+    for number in page_numbers:
+        if runs and number == runs[-1][1] + 1:
+            runs[-1][1] = number
+        else:
+            runs.append([number, number])
+    return [(first, last) for first, last in runs]
+
+def extract_pages_from_pdf(pdf_path, label=None):
+    """Extract text page by page, only OCRing pages without a usable text layer.
+
+    Returns a list of (text, source) tuples in page order where source is
+    "text" for the embedded text layer and "ocr" for Tesseract output.
+    """
+    check_cancelled()
+    try:
+        layer_texts = extract_text_layer_pages(pdf_path)
+    except Exception as e:
+        print(f"Could not read text layer of {pdf_path}, falling back to OCR: {e}")
+        layer_texts = None
+
+    if layer_texts is None:
+        page_count = pdf_page_count(pdf_path)
+        emit("pdf_pages", path=pdf_path, pages=page_count, ocr=page_count)
+        texts = ocr_pdf_pages(pdf_path, label=label)
+        return [(texts[number], "ocr") for number in sorted(texts)]
+
+    pages = [None] * len(layer_texts)
+    ocr_page_numbers = []
+    for index, text in enumerate(layer_texts):
+        if text is not None and is_usable_text_layer(text):
+            pages[index] = (reflow_text_layer(text), "text")
+        else:
+            ocr_page_numbers.append(index + 1)
+    emit("pdf_pages", path=pdf_path, pages=len(pages), ocr=len(ocr_page_numbers))
+
+    if ocr_page_numbers:
+        print(f"OCR needed for {len(ocr_page_numbers)} of {len(pages)} pages")
+        texts = ocr_pdf_pages(pdf_path, ocr_page_numbers, label=label)
+        for number, text in texts.items():
+            pages[number - 1] = (text, "ocr")
+
+    return pages
+
+def report_page_sources(pdf_path, pages):
+    text_pages = [i + 1 for i, (_, source) in enumerate(pages) if source == "text"]
+    ocr_pages = [i + 1 for i, (_, source) in enumerate(pages) if source == "ocr"]
+    print(f"{os.path.basename(pdf_path)}: {len(pages)} pages, "
+          f"{len(text_pages)} from text layer, {len(ocr_pages)} OCR'd")
+    if ocr_pages:
+        print(f"  OCR'd pages: {', '.join(str(n) for n in ocr_pages)}")
+
+def extract_full_text_from_pdf(pdf_path, label=None):
+    pages = extract_pages_from_pdf(pdf_path, label=label)
+    report_page_sources(pdf_path, pages)
+    cache = get_ocr_cache()
+    if cache is not None and any(source == "ocr" for _, source in pages):
+        stats = cache.stats()
+        print(f"OCR cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['entries']} pages, {stats['bytes'] / 1e6:.1f} MB cached)")
+    return "\n\n".join(text for text, _ in pages)
 
 """ def is_holdings_paragraph(paragraph, tickers_dict):
     # Skip long paragraphs with lots of symbols/numbers and multiple company mentions
@@ -55,77 +386,213 @@ def extract_full_text_from_pdf(pdf_path):
                 return True
     return False """
 
-def is_holdings_paragraph(paragraph, tickers_dict):
+# === Paragraph Features ===
+# Features and filter decisions are computed once per unique paragraph and
+# reused by every company and fund that sees the same paragraph in a run
+ParagraphFeatures = namedtuple("ParagraphFeatures", [
+    "starts_with_table",  # Rule 0
+    "word_count",
+    "numeric_token_ratio",  # Rule 1
+    "numbers_only",  # Rule 2
+    "symbol_ratio",  # Rule 3
+    "uppercase_ratio",  # Rule 4
+    "is_holdings",  # Rule 6
+    "has_keyword",  # Rule 7
+])
+
+RELEVANCE_KEYWORDS = ["performance", "returns", "growth", "valuation", "strategy",
+                      "fund", "impact", "investment", "revenue", "market", "expansion",
+                      "company", "subscribers", "profit", "financials", "earnings", "business"]
+SYMBOL_CHARS = ['.', '%', '$', '-', '+', '=', '|']
+FINANCIAL_TERMS_RE = re.compile(r'\b(Inc\.|Ltd\.|Corp\.|Cl [A-Z]|ADR|Holdings|Technologies|LLC|S\.A\.|PLC)\b')
+NUMBERS_ONLY_RE = re.compile(r"^\s*[\d\s.,%$-]+\s*$")
+
+# Relevance decisions kept per process, keyed by paragraph and ticker set: boilerplate
+# repeats across companies and funds, so it is scored once per run. Least recently
+# used decisions are dropped beyond this many
+PARAGRAPH_CACHE_SIZE = 100_000
+
+_holdings_matchers = {}
+_paragraph_decisions = OrderedDict()
+
+def _tickers_key(tickers_dict):
+    return hashlib.blake2b("\x1f".join(tickers_dict.values()).encode("utf-8"), digest_size=16).digest()
+
+def _paragraph_key(paragraph, tickers_key):
+    return hashlib.blake2b(paragraph.encode("utf-8"), digest_size=16, key=tickers_key).digest()
+
+def _holdings_matcher(tickers_dict, tickers_key):
+    matcher = _holdings_matchers.get(tickers_key)
+    if matcher is None:
+        matcher = _holdings_matchers[tickers_key] = CompanyMatcher(tickers_dict.values(), case_sensitive=True)
+    return matcher
+
+def clear_paragraph_cache():
+    """Forget memoized relevance decisions; long-lived workers (excerpt_service) call this between requests."""
+    _paragraph_decisions.clear()
+
+def is_holdings_paragraph(paragraph, tickers_dict, tickers_key=None):
     if len(paragraph) < 400:
         return False
-    # Count company mentions
-    company_mentions = sum(1 for name in tickers_dict.values() if re.search(rf'\b{re.escape(name)}\b', paragraph))
     # Count $ signs
     dollar_signs = paragraph.count('$')
     # Count financial noise patterns like Inc., Ltd., Corp., Cl A, ADR, etc.
-    financial_terms = len(re.findall(r'\b(Inc\.|Ltd\.|Corp\.|Cl [A-Z]|ADR|Holdings|Technologies|LLC|S\.A\.|PLC)\b', paragraph))
+    financial_terms = len(FINANCIAL_TERMS_RE.findall(paragraph))
     # Count visual separators
-    symbol_chars = ['.', '%', '$', '-', '+', '=', '|']
-    symbol_ratio = sum(paragraph.count(ch) for ch in symbol_chars) / max(len(paragraph), 1)
-    if (
-        company_mentions >= 3 and
-        (dollar_signs >= 5 or financial_terms >= 5 or symbol_ratio > 0.04)
-    ):
-        return True
-    return False
-
+    symbol_ratio = sum(paragraph.count(ch) for ch in SYMBOL_CHARS) / max(len(paragraph), 1)
+    if not (dollar_signs >= 5 or financial_terms >= 5 or symbol_ratio > 0.04):
+        return False
+    # Count company mentions (case-sensitive whole words, one pass for all names)
+    found = _holdings_matcher(tickers_dict, tickers_key or _tickers_key(tickers_dict)).find(paragraph)
+    company_mentions = sum(1 for name in tickers_dict.values() if name in found)
+    return company_mentions >= 3
+
+def compute_paragraph_features(paragraph, tickers_dict, tickers_key=None):
+    words = paragraph.split()
+    num_count = sum(
+        1 for word in words
+        if any(char.isdigit() for char in word.strip(string.punctuation))
+    )
+    lowered = paragraph.lower()
+    return ParagraphFeatures(
+        starts_with_table=paragraph.strip().lower().startswith("table"),
+        word_count=len(words),
+        numeric_token_ratio=num_count / len(words) if words else 0.0,
+        numbers_only=bool(NUMBERS_ONLY_RE.match(paragraph)),
+        symbol_ratio=sum(paragraph.count(ch) for ch in SYMBOL_CHARS) / max(len(paragraph), 1),
+        uppercase_ratio=sum(1 for ch in paragraph if ch.isupper()) / max(len(paragraph), 1),
+        is_holdings=is_holdings_paragraph(paragraph, tickers_dict, tickers_key),
+        has_keyword=any(keyword in lowered for keyword in RELEVANCE_KEYWORDS),
+    )
+
+def compute_paragraph_features_batch(paragraphs, tickers_dict, tickers_key=None):
+    """Compute ParagraphFeatures for many paragraphs at once.
+
+    The per-character rules (uppercase, symbol and numeric-token counts) run
+    with NumPy over one code-point array for the whole batch; results are
+    identical to compute_paragraph_features. Falls back to the per-paragraph
+    path when NumPy is not installed.
+    """
+    tickers_key = tickers_key or _tickers_key(tickers_dict)
+    count = len(paragraphs)
+    if np is None or count == 0:
+        return [compute_paragraph_features(p, tickers_dict, tickers_key) for p in paragraphs]
+
+    lengths = np.fromiter(map(len, paragraphs), dtype=np.int64, count=count)
+    codes = np.frombuffer("".join(paragraphs).encode("utf-32-le"), dtype=np.uint32)
+    para_ids = np.repeat(np.arange(count), lengths)
+
+    # Classify each distinct code point once into lookup tables indexed by code point
+    present = np.flatnonzero(np.bincount(codes)) if len(codes) else np.zeros(0, dtype=np.int64)
+    table_size = int(present[-1]) + 1 if len(present) else 1
+    upper_table = np.zeros(table_size, dtype=bool)
+    digit_table = np.zeros(table_size, dtype=bool)
+    space_table = np.zeros(table_size, dtype=bool)
+    symbol_table = np.zeros(table_size, dtype=bool)
+    for code in present.tolist():
+        ch = chr(code)
+        upper_table[code] = ch.isupper()
+        digit_table[code] = ch.isdigit()
+        space_table[code] = ch.isspace()
+        symbol_table[code] = ch in SYMBOL_CHARS
+    is_upper = upper_table[codes]
+    is_digit = digit_table[codes]
+    is_space = space_table[codes]
+    is_symbol = symbol_table[codes]
+
+    upper_counts = np.bincount(para_ids[is_upper], minlength=count)
+    symbol_counts = np.bincount(para_ids[is_symbol], minlength=count)
+
+    # Tokens as str.split() sees them: runs of non-space characters within a paragraph.
+    # Digits are never punctuation, so "has a digit after strip(punctuation)" is "has a digit".
+    previous_is_space = np.empty(len(codes), dtype=bool)
+    if len(codes):
+        previous_is_space[0] = True
+        previous_is_space[1:] = is_space[:-1]
+        starts = np.cumsum(lengths) - lengths
+        previous_is_space[starts[lengths > 0]] = True
+    token_starts = ~is_space & previous_is_space
+    token_ids = np.cumsum(token_starts) - 1
+    token_paras = para_ids[token_starts]
+    token_has_digit = np.zeros(len(token_paras), dtype=bool)
+    token_has_digit[token_ids[is_digit]] = True
+    word_counts = np.bincount(token_paras, minlength=count)
+    numeric_counts = np.bincount(token_paras[token_has_digit], minlength=count)
+
+    safe_lengths = np.maximum(lengths, 1)
+    symbol_ratios = symbol_counts / safe_lengths
+    uppercase_ratios = upper_counts / safe_lengths
+    numeric_ratios = np.divide(numeric_counts, word_counts, out=np.zeros(count), where=word_counts > 0)
+
+    features = []
+    for i, paragraph in enumerate(paragraphs):
+        lowered = paragraph.lower()
+        features.append(ParagraphFeatures(
+            starts_with_table=lowered.lstrip().startswith("table"),
+            word_count=int(word_counts[i]),
+            numeric_token_ratio=float(numeric_ratios[i]),
+            numbers_only=bool(NUMBERS_ONLY_RE.match(paragraph)),
+            symbol_ratio=float(symbol_ratios[i]),
+            uppercase_ratio=float(uppercase_ratios[i]),
+            is_holdings=is_holdings_paragraph(paragraph, tickers_dict, tickers_key),
+            has_keyword=any(keyword in lowered for keyword in RELEVANCE_KEYWORDS),
+        ))
+    return features
+
+def relevance_mask(paragraphs, tickers_dict):
+    """Return a boolean keep-mask over `paragraphs`, scoring the ones not seen before in one batch."""
+    tickers_key = _tickers_key(tickers_dict)
+    keys = [_paragraph_key(paragraph, tickers_key) for paragraph in paragraphs]
+
+    decisions = {}
+    missing = {}
+    for key, paragraph in zip(keys, paragraphs):
+        if key in decisions or key in missing:
+            continue
+        if key in _paragraph_decisions:
+            _paragraph_decisions.move_to_end(key)
+            decisions[key] = _paragraph_decisions[key]
+        else:
+            missing[key] = paragraph
+    if missing:
+        batch = compute_paragraph_features_batch(list(missing.values()), tickers_dict, tickers_key)
+        for key, features in zip(missing, batch):
+            decisions[key] = _paragraph_decisions[key] = is_relevant(features)
+        while len(_paragraph_decisions) > PARAGRAPH_CACHE_SIZE:
+            _paragraph_decisions.popitem(last=False)
+
+    keep = [decisions[key] for key in keys]
+    return np.array(keep, dtype=bool) if np is not None else keep
+
+def is_relevant(features):
+    # Rule 0: Remove paragraphs that start with "Table" (case-insensitive)
+    if features.starts_with_table:
+        return False
+    # Rule 1: Paragraphs that are mostly numeric — remove if more than 40% of tokens are numbers
+    if features.numeric_token_ratio > 0.4:
+        return False
+    # Rule 2: Remove paragraphs that are mostly numbers (e.g., stock tables)
+    if features.numbers_only:
+        return False
+    # Rule 3: Skip paragraphs with lots of symbols/visual separators (common in holdings dumps)
+    if features.symbol_ratio > 0.04:  # ~4% symbol ratio threshold
+        return False
+    # Rule 4: Skip paragraphs with excessive uppercase (common in security names)
+    if features.uppercase_ratio > 0.35:
+        return False
+    # Rule 5: Keep only longer paragraphs (20+ words)
+    if features.word_count < 20:
+        return False
+    # Rule 6: Removing potential dumps
+    if features.is_holdings:
+        return False
+    # Rule 7: Paragraph must contain investment-related keywords
+    return features.has_keyword
 
 def filter_relevant_paragraphs(paragraphs, tickers_dict):
     """Filter paragraphs that mention Spotify AND contain investment-related context."""
-    keywords = ["performance", "returns", "growth", "valuation", "strategy", 
-                "fund", "impact", "investment", "revenue", "market", "expansion", 
-                "company", "subscribers", "profit", "financials", "earnings", "business"]
-
-    relevant_paragraphs = []
-    
-    for paragraph in paragraphs:
-        words = paragraph.split()
-
-        # Rule 0: Remove paragraphs that start with "Table" (case-insensitive)
-        if paragraph.strip().lower().startswith("table"):
-            continue
-
-        # Rule 1: Paragraphs that are mostly numeric — remove if more than 40% of tokens are numbers
-        num_count = sum(
-            1 for word in words
-            if any(char.isdigit() for char in word.strip(string.punctuation))
-        )
-        if len(words) > 0 and (num_count / len(words)) > 0.4:
-            continue
-
-        # **Rule 2: Remove paragraphs that are mostly numbers (e.g., stock tables)**
-        if re.match(r"^\s*[\d\s.,%$-]+\s*$", paragraph):
-            continue  # Skip paragraphs that are only numbers
-
-         # Rule 3: Skip paragraphs with lots of symbols/visual separators (common in holdings dumps)
-        symbol_chars = ['.', '%', '$', '-', '+', '=', '|']
-        symbol_ratio = sum(paragraph.count(ch) for ch in symbol_chars) / max(len(paragraph), 1)
-        if symbol_ratio > 0.04:  # ~4% symbol ratio threshold
-            continue
-
-        # Rule 4: Skip paragraphs with excessive uppercase (common in security names)
-        uppercase_ratio = sum(1 for ch in paragraph if ch.isupper()) / max(len(paragraph), 1)
-        if uppercase_ratio > 0.35:
-            continue
-
-        # **Rule 5: Keep only longer paragraphs (20+ words)**
-        if len(words) < 20:
-            continue
-
-        # **Rule 6: Removing potential dumps**    
-        if is_holdings_paragraph(paragraph, tickers_dict):
-            continue
-
-        # **Rule 7: Paragraph must contain investment-related keywords**
-        if any(keyword in paragraph.lower() for keyword in keywords):
-            relevant_paragraphs.append(paragraph)
-
-    return relevant_paragraphs
+    keep = relevance_mask(paragraphs, tickers_dict)
+    return [paragraph for paragraph, kept in zip(paragraphs, keep) if kept]
 
 def identify_companies_in_text(text):
     found = {}
@@ -144,28 +611,64 @@ def extract_company_paragraphs(text, company_name):
             relevant_paragraphs.append(para.strip())
     return relevant_paragraphs
 
-def remove_duplicate_paragraphs(results):
+_company_matcher = None
+
+def get_company_matcher():
+    """Aho-Corasick matcher over every company name in tickers, built once per process."""
+    global _company_matcher
+    if _company_matcher is None:
+        _company_matcher = CompanyMatcher(tickers.values())
+    return _company_matcher
+
+def group_company_paragraphs(text):
+    """Return {company: [paragraphs mentioning it]} for every company in tickers.
+
+    Single-pass replacement for calling extract_company_paragraphs once per
+    company; paragraphs and company order match the per-company loop.
+    """
+    return get_company_matcher().group_by_company(text)
+
+# Estimated Jaccard similarity of character 5-gram shingles at which two paragraphs
+# count as the same text; 1.0 only removes byte-identical paragraphs
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+def remove_duplicate_paragraphs(results, similarity_threshold=None):
+    """Drop repeated paragraphs across all companies, keeping the first occurrence.
+
+    Besides exact repeats this removes near duplicates (OCR variants, the same
+    commentary in several share-class fact sheets) using a MinHash LSH index.
+    """
+    if similarity_threshold is None:
+        similarity_threshold = NEAR_DUPLICATE_THRESHOLD
+    near_duplicates = NearDuplicateIndex(similarity_threshold) if similarity_threshold < 1.0 else None
     seen = set()
     deduped_results = {}
 
     for company, paras in results.items():
         unique_paras = []
         for p in paras:
-            if p not in seen:
-                seen.add(p)
+            if p in seen:
+                continue
+            seen.add(p)
+            if near_duplicates is None or near_duplicates.add_if_new(p):
                 unique_paras.append(p)
         if unique_paras:
             deduped_results[company] = unique_paras
 
     return deduped_results
 
-def save_results_to_pdf(results, output_path):
+def save_results_to_pdf(results, output_path, title=None):
     c = canvas.Canvas(output_path, pagesize=LETTER)
     width, height = LETTER
     margin = 50
     y = height - margin
     line_height = 14
 
+    if title:
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(margin, y, title)
+        y -= line_height * 2
+
     c.setFont("Helvetica", 12)
     for company, paragraphs in results.items():
         c.setFont("Helvetica-Bold", 14)
@@ -192,19 +695,40 @@ def save_results_to_pdf(results, output_path):
 
     c.save()
 
-def main(pdf_path):
-    full_text = extract_full_text_from_pdf(pdf_path)
-    detected_companies = identify_companies_in_text(full_text)
-
-    results = {}
-    for ticker, company_name in detected_companies.items():
-        raw_paragraphs = extract_company_paragraphs(full_text, company_name)
-        filtered = filter_relevant_paragraphs(raw_paragraphs, tickers)
-        if filtered:
-            results[company_name] = filtered
-    # Deduplicate across all company paragraphs after all processing
-    results = remove_duplicate_paragraphs(results)
+def excerpt_text(full_text):
+    with stage("match"):
+        company_paragraphs = group_company_paragraphs(full_text)
+    with stage("filter"):
+        # Score every candidate paragraph of the document in one batch up front
+        relevance_mask([p for paras in company_paragraphs.values() for p in paras], tickers)
+
+        results = {}
+        for company_name, raw_paragraphs in company_paragraphs.items():
+            filtered = filter_relevant_paragraphs(raw_paragraphs, tickers)
+            if filtered:
+                results[company_name] = filtered
+    with stage("dedupe"):
+        # Deduplicate across all company paragraphs after all processing
+        results = remove_duplicate_paragraphs(results)
     return results
 
+def excerpt_pdfs(pdf_paths, label=None):
+    """Excerpt several PDFs as one document without merging them on disk."""
+    full_text = "\n\n".join(extract_full_text_from_pdf(path, label=label) for path in pdf_paths)
+    return excerpt_text(full_text)
+
+def main(pdf_path, label=None):
+    return excerpt_pdfs([pdf_path], label=label)
+
+# === Source Selection ===
+
+def select_source_pdfs(pdf_paths):
+    """Drop scraper-built *_Merged.pdf files when the individual PDFs are also present."""
+    individual = [path for path in pdf_paths if not path.endswith("_Merged.pdf")]
+    return individual or list(pdf_paths)
+
+# Seconds spent importing this module; compare with `python -X importtime`
+IMPORT_SECONDS = time.perf_counter() - _import_started
+
 if __name__ == "__main__":
     print("This file is meant to be imported by excerpt.py — not run directly.")
@@ -0,0 +1,211 @@
+# fund_manifest.py
+import hashlib
+import json
+import os
+import time
+
+from progress_events import emit
+from run_profiler import stage
+
+MANIFEST_NAME = "manifest.json"
+EXCERPT_STATE_NAME = "excerpt_state.json"
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _write_json(path, data):
+    # Write-then-rename so a killed scraper never leaves a truncated manifest
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(temp_path, path)
+
+def _read_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+class FundManifest:
+    """Record of the documents in one fund's downloads folder, keyed by source URL.
+
+    Each entry keeps the file name, ETag, Last-Modified, size and SHA-256 of
+    the last download, so the next run can send a conditional request and
+    keep the existing file when the server (or the content hash) says it has
+    not changed. Files not fetched or kept during a run are removed by prune().
+    """
+
+    def __init__(self, downloads_dir, fund=None):
+        self.downloads_dir = downloads_dir
+        self.fund = fund  # attributes download timings when several funds share a process
+        self.path = os.path.join(downloads_dir, MANIFEST_NAME)
+        os.makedirs(downloads_dir, exist_ok=True)
+        self.entries = (_read_json(self.path) or {}).get("documents", {})
+        self.current = set()  # file names fetched or kept this run
+        self.changed = 0
+        self.unchanged = 0
+
+    def _existing_file(self, url):
+        """Path of the previous download of `url` if it is still intact on disk."""
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        path = os.path.join(self.downloads_dir, entry["file"])
+        if not os.path.isfile(path) or os.path.getsize(path) != entry["size"]:
+            return None
+        # The file name may since have been reused for a different document
+        if file_sha256(path) != entry["sha256"]:
+            return None
+        return path
+
+    def fetch(self, session, url, dest_path, **kwargs):
+        """Download `url` to `dest_path` unless the copy from an earlier run is still current.
+
+        `session` is anything with a requests-style get() (requests, a
+        Session, cloudscraper). Returns (path, changed); path is the existing
+        file when nothing changed, which may have an older date in its name.
+        Raises on HTTP errors and when the response is not a PDF.
+        """
+        existing, headers = self.request_headers(url, kwargs.pop("headers", None))
+        with stage("download", self.fund):
+            response = session.get(url, headers=headers, **kwargs)
+            response.content  # a streamed body is read here, inside the timing
+        return self.record(url, dest_path, existing, response)
+
+    def request_headers(self, url, headers=None):
+        """Return (existing, headers) for downloading `url`.
+
+        `existing` is the previous download if it is still intact, in which
+        case its ETag / Last-Modified validators are added to `headers`.
+        """
+        entry = self.entries.get(url)
+        existing = self._existing_file(url)
+        headers = dict(headers or {})
+        if existing is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return existing, headers
+
+    def record(self, url, dest_path, existing, response):
+        """Keep `existing` or write the response body to `dest_path`; returns (path, changed).
+
+        `response` is a requests or httpx response to a request made with
+        request_headers(url). Raises on HTTP errors and when it is not a PDF.
+        """
+        entry = self.entries.get(url)
+        content = response.content
+        if existing is not None and response.status_code == 304:
+            path, changed = existing, False
+            entry["checked"] = time.time()
+        else:
+            response.raise_for_status()
+            if not content.startswith(b"%PDF"):
+                raise ValueError(f"{url} did not return a PDF ({response.headers.get('Content-Type', 'unknown type')})")
+            sha256 = hashlib.sha256(content).hexdigest()
+            if existing is not None and sha256 == entry["sha256"]:
+                # Server ignored the validators but the document is byte-identical
+                path, changed = existing, False
+            else:
+                with open(dest_path, "wb") as f:
+                    f.write(content)
+                path, changed = dest_path, True
+            self.entries[url] = {
+                "file": os.path.basename(path),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "size": os.path.getsize(path),
+                "sha256": sha256,
+                "checked": time.time(),
+            }
+        return self._counted(path, changed)
+
+    def record_file(self, url, dest_path, downloaded):
+        """Like record() for a file already saved at `downloaded` (e.g. by a browser); returns (path, changed).
+
+        A browser cannot send conditional requests, so the document is always
+        fetched; when it is byte-identical to the previous download of `url`
+        that copy is kept and `downloaded` is deleted. Raises ValueError when
+        the file is not a PDF.
+        """
+        with open(downloaded, "rb") as f:
+            is_pdf = f.read(4) == b"%PDF"
+        if not is_pdf:
+            os.remove(downloaded)
+            raise ValueError(f"{url} did not download a PDF")
+        existing = self._existing_file(url)
+        sha256 = file_sha256(downloaded)
+        if existing is not None and sha256 == self.entries[url]["sha256"]:
+            os.remove(downloaded)
+            path, changed = existing, False
+        else:
+            os.replace(downloaded, dest_path)
+            path, changed = dest_path, True
+        self.entries[url] = {
+            "file": os.path.basename(path),
+            "etag": None,
+            "last_modified": None,
+            "size": os.path.getsize(path),
+            "sha256": sha256,
+            "checked": time.time(),
+        }
+        return self._counted(path, changed)
+
+    def _counted(self, path, changed):
+        self.current.add(os.path.basename(path))
+        if changed:
+            self.changed += 1
+        else:
+            self.unchanged += 1
+        emit("pdf_downloaded", path=path, bytes=os.path.getsize(path), changed=changed)
+        return path, changed
+
+    def keep(self, path):
+        """Mark a file produced outside fetch() (e.g. a browser download) as current."""
+        self.current.add(os.path.basename(path))
+
+    def prune(self):
+        """Delete PDFs that were neither fetched nor kept this run and forget their entries."""
+        for name in os.listdir(self.downloads_dir):
+            if name.endswith(".pdf") and name not in self.current:
+                os.remove(os.path.join(self.downloads_dir, name))
+                print(f"Deleted old report: {name}")
+        self.entries = {url: entry for url, entry in self.entries.items() if entry["file"] in self.current}
+
+    def save(self):
+        _write_json(self.path, {"documents": self.entries})
+
+    def summary(self):
+        return f"{self.changed} new or changed, {self.unchanged} unchanged"
+
+# === Excerpt Inputs ===
+# An excerpt is only regenerated when the content of its source PDFs changed;
+# file names are ignored because several scrapers put the run date in them
+def inputs_fingerprint(pdf_paths):
+    digests = sorted(file_sha256(path) for path in pdf_paths)
+    return hashlib.sha256("\n".join(digests).encode("ascii")).hexdigest()
+
+def load_excerpt_state(excerpted_dir):
+    """Return {"inputs": fingerprint, "results": {...}, "created": ...} from the last excerpt, or None."""
+    return _read_json(os.path.join(excerpted_dir, EXCERPT_STATE_NAME))
+
+def save_excerpt_state(excerpted_dir, fingerprint, results):
+    os.makedirs(excerpted_dir, exist_ok=True)
+    _write_json(os.path.join(excerpted_dir, EXCERPT_STATE_NAME), {
+        "inputs": fingerprint,
+        "results": results or {},
+        "created": time.time(),
+    })
+
+def current_excerpt(excerpted_dir, fingerprint):
+    """The saved excerpt state if it was built from exactly these inputs, else None."""
+    state = load_excerpt_state(excerpted_dir)
+    if not state or state.get("inputs") != fingerprint:
+        return None
+    return state
@@ -0,0 +1,96 @@
+# funds.py
+# Mutual fund families: display name -> scraper script, output folder and scraper kind
+
+# Scraper script per mutual fund family
+fund_scripts = {
+    "Amana (Saturna Capital)": "03_14_25_Amana.py",
+    "American Century Investments (ACI)": "03_14_25_ACI.py",
+    "Allianz Global Investors": "03_14_25_Allianz.py",
+    "Alger Funds": "03_14_25_Alger.py",
+    "ALPS Funds": "03_14_25_ALPS.py",
+    "Appleseed Fund": "03_14_25_Appleseed.py",
+    "Ariel Investments": "03_14_25_Ariel.py",
+    "Artisan Partners": "03_14_25_Artisan.py",
+    "Baird Asset Management": "03_14_25_Baird.py",
+    "Baron Capital": "03_14_25_Baron.py",
+    "Brookfield Asset Management": "03_14_25_Brookfield.py",
+    "Buffalo Funds": "03_14_25_Buffalo.py",
+    "Causeway Capital": "03_14_25_Causeway.py",
+    "Cavanal Hill Funds": "03_14_25_CavanalHill.py",
+    "Clipper Fund": "03_14_25_Clipper.py",
+    "Dodge & Cox":"03_14_25_DodgeCox.py",
+    "Fidelity Investments": "03_14_25_Fidelity.py",
+    "First Eagle Fund": "03_14_25_FirstEagleFund.py",
+    "Gabelli Funds": "03_14_25_Gabelli.py",
+    "Harbor Funds": "03_14_25_Harbor.py",
+    "Longleaf Partners": "03_14_25_Longleaf.py",
+    "MFS Investment Management": "03_14_25_MFS.py",
+    "Oakmark Fund": "03_14_25_Oakmark.py",
+    "Poplar Forest Funds": "03_14_25_PFF.py",
+    "Sequoia Funds": "03_14_25_Sequoia.py",
+    "Touchstone Mutual Funds": "03_14_25_Touchstone.py",
+    "Tweedy Browne Funds": "03_14_25_Tweedy.py",
+    "T. Rowe Price": "03_14_25_TRowe.py",
+    "Transamerica": "03_14_25_Transamerica.py",
+    "Value Line Funds": "03_14_25_ValueLine.py",
+    "Victory Funds": "03_14_25_Victory.py",
+    "Virtus Funds": "03_14_25_Virtus.py",
+    "Wasatch Global Funds": "03_14_25_Wasatch.py",
+    "Weitz Investments": "03_14_25_Weitz.py",
+    "William Blair Funds": "03_14_25_William.py"
+}
+
+FUND_FOLDER_MAP = {
+    "Amana (Saturna Capital)": "Amana",
+    "American Century Investments (ACI)": "American_Century_Investments",
+    "Allianz Global Investors":"Allianz",
+    "Alger Funds": "Alger",
+    "ALPS Funds": "ALPS",
+    "Appleseed Fund": "Appleseed",
+    "Ariel Investments": "Ariel",
+    "Artisan Partners": "Artisan",
+    "Baird Asset Management": "Baird",
+    "Baron Capital": "Baron",
+    "Brookfield Asset Management": "Brookfield",
+    "Buffalo Funds": "Buffalo",
+    "Causeway Capital": "Causeway",
+    "Cavanal Hill Funds": "CavanalHill",
+    "Clipper Fund": "Clipper",
+    "Dodge & Cox": "Dodge&Cox",
+    "Fidelity Investments": "Fidelity",
+    "First Eagle Fund": "FirstEagleFund",
+    "Gabelli Funds": "Gabelli",
+    "Harbor Funds": "Harbor",
+    "Longleaf Partners": "Longleaf",
+    "MFS Investment Management": "MFS",
+    "Oakmark Fund": "Oakmark",
+    "Poplar Forest Funds": "Poplar_Forest_Funds",
+    "Sequoia Funds": "Sequoia",
+    "Touchstone Mutual Funds": "Touchstone",
+    "Tweedy Browne Funds": "Tweedy",
+    "T. Rowe Price": "T_Rowe_Price",
+    "Transamerica": "Transamerica",
+    "Value Line Funds": "ValueLine",
+    "Victory Funds": "Victory",
+    "Virtus Funds": "Virtus",
+    "Wasatch Global Funds": "Wasatch",
+    "Weitz Investments": "Weitz",
+    "William Blair Funds": "WilliamBlair"
+}
+
+# Scrapers that only use requests/cloudscraper; everything else drives a browser
+HTTP_SCRAPERS = {
+    "ALPS Funds",
+    "Appleseed Fund",
+    "Brookfield Asset Management",
+    "Buffalo Funds",
+    "Sequoia Funds",
+    "Tweedy Browne Funds",
+}
+
+def fund_folder(fund_name):
+    """Folder under Cutler/ where the fund's scraper writes its downloads."""
+    return FUND_FOLDER_MAP.get(fund_name, fund_name.replace(" ", "_"))
+
+def scraper_kind(fund_name):
+    return "http" if fund_name in HTTP_SCRAPERS else "browser"
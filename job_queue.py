@@ -0,0 +1,212 @@
+# job_queue.py
+import json
+import os
+import sqlite3
+import time
+
+from funds import scraper_kind
+
+DEFAULT_QUEUE_PATH = os.path.join(os.getcwd(), "Cutler", "cache", "jobs.sqlite")
+# Running jobs whose worker has not checked in for this long are handed out again
+STALE_AFTER = 60
+# Tail of each job's output kept for the UI
+OUTPUT_LIMIT = 20000
+
+JOB_KINDS = ("scrape", "excerpt", "podcast")
+ACTIVE_STATUSES = ("queued", "running")
+
+class JobQueue:
+    """SQLite-backed queue of scrape/excerpt/podcast jobs shared by the app and worker.py.
+
+    The Streamlit app only submits, lists and cancels jobs; worker.py claims
+    them, runs them and writes progress back. Each call opens its own short
+    connection, so one JobQueue can be used from several threads.
+    """
+
+    def __init__(self, path=DEFAULT_QUEUE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " kind TEXT NOT NULL,"
+                " lane TEXT NOT NULL,"
+                " args TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " submitted REAL NOT NULL,"
+                " started REAL,"
+                " finished REAL,"
+                " heartbeat REAL,"
+                " worker TEXT,"
+                " cancel_requested INTEGER NOT NULL DEFAULT 0,"
+                " progress REAL NOT NULL DEFAULT 0,"
+                " message TEXT,"
+                " returncode INTEGER,"
+                " stdout TEXT,"
+                " stderr TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id)")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return _Closing(conn)
+
+    # === App Side ===
+    def submit(self, kind, **args):
+        """Queue a job and return its id.
+
+        scrape and excerpt jobs take fund=<fund name>; podcast jobs take name and url.
+        If a job of the same kind is already queued or running for the fund,
+        its id is returned instead of queueing the fund a second time.
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        placeholders = ", ".join("?" for _ in ACTIVE_STATUSES)
+        with self._connect() as conn:
+            # IMMEDIATE so two submits for the same fund cannot both miss each other's job
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if "fund" in args:
+                    rows = conn.execute(
+                        f"SELECT id, args FROM jobs WHERE kind = ? AND status IN ({placeholders}) ORDER BY id",
+                        [kind] + list(ACTIVE_STATUSES),
+                    ).fetchall()
+                    for row in rows:
+                        if json.loads(row["args"]).get("fund") == args["fund"]:
+                            conn.execute("COMMIT")
+                            return row["id"]
+                cursor = conn.execute(
+                    "INSERT INTO jobs (kind, lane, args, status, submitted) VALUES (?, ?, ?, 'queued', ?)",
+                    (kind, job_lane(kind, args), json.dumps(args), time.time()),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return cursor.lastrowid
+
+    def cancel(self, job_id):
+        """Cancel a queued job outright, or ask the worker to kill a running one."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished = ? WHERE id = ? AND status = 'queued'",
+                (time.time(), job_id),
+            )
+            conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,))
+
+    def get(self, job_id):
+        with self._connect() as conn:
+            return _as_job(conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+
+    def list_jobs(self, limit=50, kind=None):
+        """Most recent jobs first."""
+        query, params = "SELECT * FROM jobs", []
+        if kind is not None:
+            query, params = query + " WHERE kind = ?", [kind]
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY id DESC LIMIT ?", params + [limit]).fetchall()
+        return [_as_job(row) for row in rows]
+
+    def latest_by_fund(self, kind):
+        """{fund: job} for the newest job of `kind` per fund."""
+        latest = {}
+        for job in reversed(self.list_jobs(limit=1000, kind=kind)):
+            fund = job["args"].get("fund")
+            if fund is not None:
+                latest[fund] = job
+        return latest
+
+    # === Worker Side ===
+    def claim(self, worker, lanes):
+        """Atomically take the oldest queued job in one of `lanes`, or return None."""
+        if not lanes:
+            return None
+        placeholders = ", ".join("?" for _ in lanes)
+        with self._connect() as conn:
+            # IMMEDIATE takes the write lock up front so two workers cannot claim the same row
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    f"SELECT id FROM jobs WHERE status = 'queued' AND lane IN ({placeholders}) ORDER BY id LIMIT 1",
+                    list(lanes),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                now = time.time()
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', started = ?, heartbeat = ?, worker = ? WHERE id = ?",
+                    (now, now, worker, row["id"]),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return _as_job(conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone())
+
+    def heartbeat(self, job_ids):
+        """Mark running jobs as alive; returns the ids among them that were asked to cancel."""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return set()
+        placeholders = ", ".join("?" for _ in job_ids)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET heartbeat = ? WHERE id IN ({placeholders})", [time.time()] + job_ids)
+            rows = conn.execute(
+                f"SELECT id FROM jobs WHERE cancel_requested = 1 AND id IN ({placeholders})", job_ids).fetchall()
+        return {row["id"] for row in rows}
+
+    def update_progress(self, job_id, progress, message=None):
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET progress = ?, message = ? WHERE id = ?", (progress, message, job_id))
+
+    def finish(self, job_id, status, returncode=None, stdout="", stderr="", message=None):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, finished = ?, returncode = ?, stdout = ?, stderr = ?,"
+                " progress = CASE WHEN ? = 'done' THEN 1 ELSE progress END,"
+                " message = COALESCE(?, message) WHERE id = ?",
+                (status, time.time(), returncode, (stdout or "")[-OUTPUT_LIMIT:], (stderr or "")[-OUTPUT_LIMIT:],
+                 status, message, job_id),
+            )
+
+    def requeue_stale(self, stale_after=STALE_AFTER):
+        """Put running jobs whose worker died back in the queue; returns how many."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished = ? WHERE status = 'running'"
+                " AND cancel_requested = 1 AND heartbeat < ?",
+                (time.time(), time.time() - stale_after),
+            )
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'queued', started = NULL, worker = NULL, progress = 0"
+                " WHERE status = 'running' AND heartbeat < ?",
+                (time.time() - stale_after,),
+            )
+            return cursor.rowcount
+
+def job_lane(kind, args):
+    """Lane the worker caps a job under: browser/http for scrapes, otherwise the job kind."""
+    return scraper_kind(args["fund"]) if kind == "scrape" else kind
+
+class _Closing:
+    """sqlite3 connections do not close on `with`; this one does."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn
+
+    def __exit__(self, *exc_info):
+        self.conn.close()
+
+def _as_job(row):
+    if row is None:
+        return None
+    job = dict(row)
+    job["args"] = json.loads(job["args"])
+    return job
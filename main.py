@@ -1,92 +1,57 @@
-
 import streamlit as st
-import subprocess
 import os
-import threading
 import time
 
-# Define mutual fund scraper scripts
-fund_scripts = {
-    "Amana (Saturna Capital)": "03_14_25_Amana.py",
-    "American Century Investments (ACI)": "03_14_25_ACI.py",
-    "Allianz Global Investors": "03_14_25_Allianz.py",
-    "Alger Funds": "03_14_25_Alger.py",
-    "ALPS Funds": "03_14_25_ALPS.py",
-    "Appleseed Fund": "03_14_25_Appleseed.py",
-    "Ariel Investments": "03_14_25_Ariel.py",
-    "Artisan Partners": "03_14_25_Artisan.py",
-    "Baird Asset Management": "03_14_25_Baird.py",
-    "Baron Capital": "03_14_25_Baron.py",
-    "Brookfield Asset Management": "03_14_25_Brookfield.py",
-    "Buffalo Funds": "03_14_25_Buffalo.py",
-    "Causeway Capital": "03_14_25_Causeway.py",
-    "Cavanal Hill Funds": "03_14_25_CavanalHill.py",
-    "Clipper Fund": "03_14_25_Clipper.py",
-    "Dodge & Cox":"03_14_25_DodgeCox.py",
-    "Fidelity Investments": "03_14_25_Fidelity.py",
-    "First Eagle Fund": "03_14_25_FirstEagleFund.py",
-    "Gabelli Funds": "03_14_25_Gabelli.py",
-    "Harbor Funds": "03_14_25_Harbor.py",
-    "Longleaf Partners": "03_14_25_Longleaf.py",
-    "MFS Investment Management": "03_14_25_MFS.py",
-    "Oakmark Fund": "03_14_25_Oakmark.py",
-    "Poplar Forest Funds": "03_14_25_PFF.py",
-    "Sequoia Funds": "03_14_25_Sequoia.py",
-    "Touchstone Mutual Funds": "03_14_25_Touchstone.py",
-    "Tweedy Browne Funds": "03_14_25_Tweedy.py",
-    "T. Rowe Price": "03_14_25_TRowe.py",
-    "Transamerica": "03_14_25_Transamerica.py",
-    "Value Line Funds": "03_14_25_ValueLine.py",
-    "Victory Funds": "03_14_25_Victory.py",
-    "Virtus Funds": "03_14_25_Virtus.py",
-    "Wasatch Global Funds": "03_14_25_Wasatch.py",
-    "Weitz Investments": "03_14_25_Weitz.py",
-    "William Blair Funds": "03_14_25_William.py"
-}
-
-FUND_FOLDER_MAP = {
-    "Amana (Saturna Capital)": "Amana",
-    "American Century Investments (ACI)": "American_Century_Investments",
-    "Allianz Global Investors":"Allianz",
-    "Alger Funds": "Alger",
-    "ALPS Funds": "ALPS",
-    "Appleseed Fund": "Appleseed",
-    "Ariel Investments": "Ariel",
-    "Artisan Partners": "Artisan",
-    "Baird Asset Management": "Baird",
-    "Baron Capital": "Baron",
-    "Brookfield Asset Management": "Brookfield",
-    "Buffalo Funds": "Buffalo",
-    "Causeway Capital": "Causeway",
-    "Cavanal Hill Funds": "CavanalHill",
-    "Clipper Fund": "Clipper",
-    "Dodge & Cox": "Dodge&Cox",
-    "Fidelity Investments": "Fidelity",
-    "First Eagle Fund": "FirstEagleFund",
-    "Gabelli Funds": "Gabelli",
-    "Harbor Funds": "Harbor",
-    "Longleaf Partners": "Longleaf",
-    "MFS Investment Management": "MFS",
-    "Oakmark Fund": "Oakmark",
-    "Poplar Forest Funds": "Poplar_Forest_Funds",
-    "Sequoia Funds": "Sequoia",
-    "Touchstone Mutual Funds": "Touchstone",
-    "Tweedy Browne Funds": "Tweedy",
-    "T. Rowe Price": "T_Rowe_Price",
-    "Transamerica": "Transamerica",
-    "Value Line Funds": "ValueLine",
-    "Victory Funds": "Victory",
-    "Virtus Funds": "Virtus",
-    "Wasatch Global Funds": "Wasatch",
-    "Weitz Investments": "Weitz",
-    "William Blair Funds": "WilliamBlair"
-}
-
-EXCERPT_SCRIPT = os.path.join(os.getcwd(), "excerpt.py")
-PODCAST_SCRIPT = os.path.join(os.getcwd(), "podcast_processor.py")
+from funds import fund_scripts
+from job_queue import JobQueue, ACTIVE_STATUSES
+
+# Work runs in worker.py; the app only queues jobs and shows their status, so
+# reruns, refreshes and several users never kill or duplicate a running job
+# (JobQueue.submit returns the existing job for a fund that is already queued or running)
+jobs = JobQueue()
+REFRESH_SECONDS = 2
+
+def job_label(job):
+    return job["args"].get("fund") or job["args"].get("name") or job["kind"]
+
+def show_jobs(kinds, limit=20):
+    """List recent jobs of `kinds` with progress, output and cancel buttons; returns True if any are active."""
+    recent = [job for job in jobs.list_jobs(limit=200) if job["kind"] in kinds][:limit]
+    if not recent:
+        st.caption("No jobs yet.")
+        return False
+    for job in recent:
+        line = f"#{job['id']} {job['kind']} **{job_label(job)}** — {job['status']}"
+        if job["message"] and job["message"] != job["status"]:
+            line += f" ({job['message']})"
+        if job["started"] and job["finished"]:
+            line += f", {job['finished'] - job['started']:.1f}s"
+        text_column, button_column = st.columns([5, 1])
+        text_column.markdown(line)
+        if job["status"] == "running":
+            text_column.progress(min(max(job["progress"], 0.0), 1.0))
+        if job["status"] in ACTIVE_STATUSES:
+            if job["cancel_requested"]:
+                button_column.caption("Cancelling...")
+            elif button_column.button("Cancel", key=f"cancel_{job['id']}"):
+                jobs.cancel(job["id"])
+                st.rerun()
+        elif job["status"] == "failed" and (job["stderr"] or job["stdout"]):
+            with text_column.expander("Output"):
+                st.text(job["stderr"] or job["stdout"])
+    return any(job["status"] in ACTIVE_STATUSES for job in recent)
+
+def refresh_while_active(active):
+    if st.checkbox("Refresh automatically", value=True):
+        if active:
+            time.sleep(REFRESH_SECONDS)
+            st.rerun()
+    elif st.button("Refresh"):
+        st.rerun()
 
 # UI start
 st.title("Cutler Capital Management")
+st.caption("Jobs are run by the worker: start it once with `python worker.py`.")
 
 workflow = st.radio("Select Workflow", ["Mutual Fund Reports", "Podcast Processing"], horizontal=True)
 
@@ -100,104 +65,37 @@ if workflow == "Mutual Fund Reports":
     else:
         selected_funds = st.multiselect("Choose Mutual Fund Families", list(fund_scripts.keys()))
 
-    def run_scraper(script_path, result_holder):
-        result = subprocess.run(["python", script_path], capture_output=True, text=True)
-        result_holder.append(result) 
-
     if st.button("Download Reports"):
         if not selected_funds:
             st.warning("Please select at least one mutual fund to scrape.")
         else:
-            st.write("Starting the scraping process...")
-            base_dir = "Cutler"
-            os.makedirs(base_dir, exist_ok=True)
-            completed_funds = []
-
-            total = len(selected_funds)
-            progress_placeholder = st.empty()
-            progress_bar = st.progress(0)
-            status_placeholder = st.empty()
-
-            for i, fund in enumerate(selected_funds):
-                folder_name = FUND_FOLDER_MAP.get(fund, fund.replace(" ", "_"))
-                fund_folder = os.path.join(base_dir, folder_name)
-                os.makedirs(fund_folder, exist_ok=True)
-
-                script_path = fund_scripts[fund]
-                status_placeholder.markdown(f"Scraping: **{fund}**")
-
-                result_holder = []
-                thread = threading.Thread(target=run_scraper, args=(script_path, result_holder))
-                thread.start()
-
-                fake_progress = 0.0
-                step = 0.01
-                while thread.is_alive():
-                    time.sleep(0.1)
-                    fake_progress = min(fake_progress + step, 0.95)
-                    overall_progress = (i + fake_progress) / total
-                    progress_bar.progress(overall_progress)
-
-                thread.join()
-                progress_bar.progress((i + 1) / total)
-
-                result = result_holder[0]
-                if result.returncode == 0:
-                    st.success(f"{fund} reports downloaded successfully!")
-                    completed_funds.append(fund)
-                else:
-                    st.error(f"Error in scraping {fund}.")
-                    st.text(result.stderr)
-
-            status_placeholder.markdown("Scraping completed.")
-            if completed_funds:
-                st.session_state["scraping_done"] = True
-                st.session_state["completed_funds"] = completed_funds
-
-    def run_excerpt(fund_args, result_holder):
-        result = subprocess.run(["python", EXCERPT_SCRIPT, fund_args], capture_output=True, text=True)
-        result_holder.append(result)
-
-    if st.session_state.get("scraping_done", False):
+            os.makedirs("Cutler", exist_ok=True)
+            for fund in selected_funds:
+                jobs.submit("scrape", fund=fund)
+            st.success(f"Queued scraping for {len(selected_funds)} fund families.")
+
+    # Funds whose most recent scrape succeeded, in fund order
+    latest_scrapes = jobs.latest_by_fund("scrape")
+    completed_funds = [fund for fund in fund_scripts
+                       if fund in latest_scrapes and latest_scrapes[fund]["status"] == "done"]
+
+    if completed_funds:
         st.write("---")
         st.subheader("Generate Excerpt Reports")
+        excerpt_funds = st.multiselect("Funds to excerpt", completed_funds,
+                                       default=[fund for fund in selected_funds if fund in completed_funds])
 
         if st.button("Generate Excerpts"):
-            st.write("🔍 Starting the excerpt generation process...")
-
-            completed_funds = st.session_state["completed_funds"]
-            total = len(completed_funds)
-
-            progress_bar = st.progress(0)
-            status_placeholder = st.empty()
-
-            for i, fund in enumerate(completed_funds):
-                folder_name = FUND_FOLDER_MAP.get(fund, fund.replace(" ", "_"))
-                status_placeholder.markdown(f"Generating excerpt for **{fund}**...")
-
-                result_holder = []
-                thread = threading.Thread(target=run_excerpt, args=(folder_name, result_holder))
-                thread.start()
-
-                fake_progress = 0.0
-                step = 0.01
-                while thread.is_alive():
-                    time.sleep(0.1)
-                    fake_progress = min(fake_progress + step, 0.95)
-                    overall_progress = (i + fake_progress) / total
-                    progress_bar.progress(overall_progress)
-
-                thread.join()
-                result = result_holder[0]
-                progress_bar.progress((i + 1) / total)
-
-                if result.returncode == 0:
-                    st.success(f"Excerpt for {fund} generated successfully!")
-                else:
-                    st.error(f"❌ Error generating excerpt for {fund}.")
-                    st.text(result.stderr)
+            if not excerpt_funds:
+                st.warning("Please select at least one scraped fund to excerpt.")
+            else:
+                for fund in excerpt_funds:
+                    jobs.submit("excerpt", fund=fund)
+                st.success(f"Queued excerpt generation for {len(excerpt_funds)} funds.")
 
-            status_placeholder.markdown("✅ All excerpts generated successfully!")
+    st.write("---")
+    st.subheader("Jobs")
+    refresh_while_active(show_jobs(("scrape", "excerpt")))
 
 # === PODCAST WORKFLOW ===
 elif workflow == "Podcast Processing":
@@ -210,30 +108,9 @@ elif workflow == "Podcast Processing":
         if not podcast_name_input or not podcast_url_input:
             st.warning("Please enter both the podcast name and a valid URL.")
         else:
-            status_placeholder = st.empty()
-            progress_bar = st.progress(0)
-
-            def run_manual_podcast(name, url, result_holder):
-                result = subprocess.run(["python", PODCAST_SCRIPT, name, url], capture_output=True, text=True)
-                result_holder.append(result)
-
-            result_holder = []
-            thread = threading.Thread(target=run_manual_podcast, args=(podcast_name_input, podcast_url_input, result_holder))
-            thread.start()
-
-            fake_progress = 0.0
-            step = 0.01
-            while thread.is_alive():
-                time.sleep(0.1)
-                fake_progress = min(fake_progress + step, 0.95)
-                progress_bar.progress(fake_progress)
-
-            thread.join()
-            progress_bar.progress(1.0)
-
-            result = result_holder[0]
-            if result.returncode == 0:
-                st.success("✅ Podcast processed successfully!")
-            else:
-                st.error("❌ Podcast processing failed.")
-                st.text(result.stderr)
+            jobs.submit("podcast", name=podcast_name_input, url=podcast_url_input)
+            st.success("Podcast queued for processing.")
+
+    st.write("---")
+    st.subheader("Jobs")
+    refresh_while_active(show_jobs(("podcast",)))
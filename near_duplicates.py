@@ -0,0 +1,139 @@
+# near_duplicates.py
+import random
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+_MASK64 = (1 << 64) - 1
+_BASE = 1000003  # polynomial base for the rolling shingle hash
+_TOKEN_RE = re.compile(r"\w+")
+
+def normalize(text):
+    """Lowercase `text` and reduce it to its words joined by single spaces."""
+    return " ".join(_TOKEN_RE.findall(text.lower()))
+
+def shingle_hashes(text, size=SHINGLE_SIZE):
+    """64-bit hashes of the character `size`-grams of the normalized text.
+
+    Variants that only differ in line breaks or stray symbols shingle
+    identically, and a single OCR character error only changes `size` shingles.
+    Text without any word characters has no shingles.
+    """
+    normalized = normalize(text)
+    if not normalized:
+        return np.zeros(0, dtype=np.uint64) if np is not None else set()
+    if np is not None:
+        codes = np.frombuffer(normalized.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        if len(codes) < size:
+            codes = np.concatenate([codes, np.zeros(size - len(codes), dtype=np.uint64)])
+        count = len(codes) - size + 1
+        hashes = np.zeros(count, dtype=np.uint64)
+        for offset in range(size):
+            hashes *= np.uint64(_BASE)
+            hashes += codes[offset:offset + count]
+        return hashes
+    codes = [ord(ch) for ch in normalized] + [0] * max(0, size - len(normalized))
+    hashes = set()
+    for start in range(len(codes) - size + 1):
+        value = 0
+        for code in codes[start:start + size]:
+            value = (value * _BASE + code) & _MASK64
+        hashes.add(value)
+    return hashes
+
+def choose_bands(threshold, num_perm=NUM_PERM):
+    """Pick (bands, rows) so LSH candidates start appearing just below `threshold`.
+
+    A pair with Jaccard similarity s becomes a candidate with probability
+    1 - (1 - s**rows)**bands, whose inflection is near (1/bands)**(1/rows).
+    """
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    below = [(b, r) for b, r in options if (1 / b) ** (1 / r) <= threshold]
+    if not below:
+        return options[-1]
+    return max(below, key=lambda option: (1 / option[0]) ** (1 / option[1]))
+
+class NearDuplicateIndex:
+    """MinHash + LSH index answering "is this text a near duplicate of one already kept?"
+
+    Each insert costs O(num_perm) plus the size of the candidate buckets, so
+    deduplicating n paragraphs is linear in n for realistic inputs.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=NUM_PERM, seed=1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        rng = random.Random(seed)
+        # Multiply-shift universal hashing: h(x) = ((a * x + b) mod 2**64) >> 32, a odd
+        a = [rng.randrange(1, 1 << 64) | 1 for _ in range(num_perm)]
+        b = [rng.randrange(0, 1 << 64) for _ in range(num_perm)]
+        if np is not None:
+            self._a = np.array(a, dtype=np.uint64)
+            self._b = np.array(b, dtype=np.uint64)
+        else:
+            self._a, self._b = a, b
+        self._buckets = [{} for _ in range(self.bands)]
+        self._signatures = []
+
+    def signature(self, text):
+        """MinHash signature of `text`, or None if it has no shingles to compare."""
+        hashes = shingle_hashes(text)
+        if len(hashes) == 0:
+            return None
+        if np is not None:
+            # uint64 array arithmetic wraps silently, which is the mod 2**64 we want
+            permuted = np.multiply.outer(hashes, self._a)
+            permuted += self._b
+            permuted >>= np.uint64(32)
+            return tuple(permuted.min(axis=0).tolist())
+        return tuple(
+            min((((a * h + b) & _MASK64) >> 32) for h in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [signature[i * rows:(i + 1) * rows] for i in range(self.bands)]
+
+    def similarity(self, first, second):
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(1 for x, y in zip(first, second) if x == y) / self.num_perm
+
+    def find_similar(self, signature):
+        """Return the id of a kept text at least `threshold` similar to `signature`, or None."""
+        checked = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            for candidate in self._buckets[band].get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if self.similarity(signature, self._signatures[candidate]) >= self.threshold:
+                    return candidate
+        return None
+
+    def add(self, signature):
+        item_id = len(self._signatures)
+        self._signatures.append(signature)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(item_id)
+        return item_id
+
+    def add_if_new(self, text):
+        """Index `text` and return True unless it near-duplicates an indexed text.
+
+        Empty or symbol-only text is never indexed and always counts as new;
+        it would otherwise match every other such text.
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return True
+        if self.find_similar(signature) is not None:
+            return False
+        self.add(signature)
+        return True
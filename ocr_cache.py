@@ -0,0 +1,97 @@
+# ocr_cache.py
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = os.path.join(os.getcwd(), "Cutler", "cache", "ocr_cache.sqlite")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+def page_image_key(image, dpi, config=""):
+    """Content hash of a rendered page plus everything that changes its OCR text."""
+    digest = hashlib.sha256()
+    digest.update(f"{image.mode}|{image.size[0]}x{image.size[1]}|{dpi}|{config}|".encode("utf-8"))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+class OCRCache:
+    """Persistent page-hash -> OCR text store with size-bounded LRU eviction."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Several fund worker processes may share the cache; WAL lets readers and a writer overlap
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_pages ("
+            " key TEXT PRIMARY KEY,"
+            " text TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " confidence REAL)"
+        )
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(ocr_pages)")]
+        if "confidence" not in columns:
+            self._conn.execute("ALTER TABLE ocr_pages ADD COLUMN confidence REAL")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ocr_pages_last_used ON ocr_pages (last_used)")
+        self._conn.commit()
+
+    def get(self, key):
+        entry = self.get_with_confidence(key)
+        return entry[0] if entry is not None else None
+
+    def get_with_confidence(self, key):
+        """Return (text, confidence) for a cached page, or None; confidence may be None."""
+        with self._lock:
+            row = self._conn.execute("SELECT text, confidence FROM ocr_pages WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE ocr_pages SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return row[0], row[1]
+
+    def put(self, key, text, confidence=None):
+        size = len(text.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ocr_pages (key, text, size, last_used, confidence) VALUES (?, ?, ?, ?, ?)",
+                (key, text, size, time.time(), confidence),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr_pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Trim to 90% so a full cache does not evict on every insert
+        target = self.max_bytes * 0.9
+        for key, size in self._conn.execute("SELECT key, size FROM ocr_pages ORDER BY last_used").fetchall():
+            if total <= target:
+                break
+            self._conn.execute("DELETE FROM ocr_pages WHERE key = ?", (key,))
+            total -= size
+
+    def stats(self):
+        with self._lock:
+            entries, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM ocr_pages").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": total,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
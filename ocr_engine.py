@@ -0,0 +1,108 @@
+# ocr_engine.py
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytesseract
+
+DEFAULT_OCR_WORKERS = os.cpu_count() or 4
+# Tesseract's OpenMP threads per worker; 1 avoids oversubscribing the box
+DEFAULT_OMP_THREAD_LIMIT = 1
+
+def _init_worker(omp_thread_limit):
+    # Inherited by every tesseract subprocess this worker launches
+    os.environ["OMP_THREAD_LIMIT"] = str(omp_thread_limit)
+
+def _ocr_file(image_path, config):
+    try:
+        return pytesseract.image_to_string(image_path, config=config).strip()
+    finally:
+        os.remove(image_path)
+
+def text_and_confidence(data):
+    """Rebuild page text from image_to_data output and return it with the mean word confidence.
+
+    Words are joined per line, lines per paragraph and paragraphs are
+    separated by blank lines, matching image_to_string's layout.
+    """
+    paragraphs = {}
+    confidences = []
+    for i, word in enumerate(data["text"]):
+        conf = float(data["conf"][i])
+        if not word.strip() or conf < 0:
+            continue
+        confidences.append(conf)
+        paragraph_key = (data["block_num"][i], data["par_num"][i])
+        lines = paragraphs.setdefault(paragraph_key, {})
+        lines.setdefault(data["line_num"][i], []).append(word)
+    text = "\n\n".join(
+        "\n".join(" ".join(words) for words in lines.values())
+        for lines in paragraphs.values()
+    )
+    mean_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    return text, mean_confidence
+
+def _ocr_file_with_confidence(image_path, config):
+    try:
+        data = pytesseract.image_to_data(image_path, config=config, output_type=pytesseract.Output.DICT)
+        return text_and_confidence(data)
+    finally:
+        os.remove(image_path)
+
+class OCREngine:
+    """Process pool running Tesseract with a fixed worker count and thread limit.
+
+    Pages are handed to workers as uncompressed PNM files in a private temp
+    directory, so no PIL image is ever pickled across the process boundary.
+    """
+
+    def __init__(self, workers=DEFAULT_OCR_WORKERS, omp_thread_limit=DEFAULT_OMP_THREAD_LIMIT, config=""):
+        self.workers = workers
+        self.omp_thread_limit = omp_thread_limit
+        self.config = config
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="cutler_ocr_")
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(omp_thread_limit,)
+        )
+        self._lock = threading.Lock()
+        self._counter = 0
+        self.pages_done = 0
+
+    def submit(self, image, with_confidence=False):
+        """Queue a PIL image for OCR and return a Future of its text.
+
+        With `with_confidence` the Future yields (text, mean word confidence).
+        The image is written out before returning, so the caller may close it.
+        """
+        with self._lock:
+            self._counter += 1
+            number = self._counter
+        if image.mode not in ("RGB", "L", "1"):
+            image = image.convert("RGB")
+        image_path = os.path.join(self._temp_dir.name, f"page_{number}.pnm")
+        image.save(image_path, format="PPM")
+        worker = _ocr_file_with_confidence if with_confidence else _ocr_file
+        future = self._executor.submit(worker, image_path, self.config)
+        future.add_done_callback(self._count_page)
+        return future
+
+    def _count_page(self, future):
+        if future.exception() is None:
+            with self._lock:
+                self.pages_done += 1
+
+    def throughput_report(self, pages, elapsed):
+        rate = pages / elapsed if elapsed > 0 else 0.0
+        return (f"OCR'd {pages} pages in {elapsed:.1f}s "
+                f"({rate:.2f} pages/sec, {self.workers} workers, OMP_THREAD_LIMIT={self.omp_thread_limit})")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+        self._temp_dir.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
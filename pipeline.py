@@ -0,0 +1,322 @@
+# pipeline.py
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from PyPDF2 import PdfMerger
+
+import excerption_base
+import progress_events
+import run_profiler
+from excerption_base import save_results_to_pdf, select_source_pdfs
+from fund_manifest import EXCERPT_STATE_NAME, inputs_fingerprint, current_excerpt, save_excerpt_state
+from funds import fund_folder
+from scraper_scheduler import run_scrapers
+
+BASE_DIR = os.path.join(os.getcwd(), "Cutler")
+COMPILED_DIR = os.path.join(BASE_DIR, "Compiled")
+PARTS_DIR = os.path.join(COMPILED_DIR, "parts")
+# Processes doing text extraction/OCR and excerption; each gets a share of the OCR workers
+EXTRACT_WORKERS = 4
+# PDFs handed to the extraction pool at once; later downloads wait in the backlog
+EXTRACT_MAX_IN_FLIGHT = 8
+
+# kind is one of:
+#   "profile"        payload = stage timing records (see run_profiler) from a scraper or worker
+#   "resumed"        payload = None; the fund was scraped by the run being resumed
+#   "event"          payload = progress event dict from the fund's scraper or its extraction (pdf_pages, page_ocr)
+#   "scraped"        payload = ScraperResult
+#   "sources"        payload = sorted PDF paths the fund's excerpt will be built from
+#   "extracted"      payload = PDF path
+#   "extract_failed" payload = (PDF path, exception)
+#   "unchanged"      payload = None; the fund's PDFs match the last excerpt, which is reused
+#   "excerpted"      payload = {company: [paragraphs]} (empty if nothing relevant)
+#   "excerpt_failed" payload = exception
+#   "skipped"        payload = reason
+PipelineUpdate = namedtuple("PipelineUpdate", ["kind", "fund", "payload"])
+
+def downloads_dir(fund_name):
+    return os.path.join(BASE_DIR, fund_folder(fund_name), "downloads")
+
+def excerpted_dir(fund_name):
+    return os.path.join(BASE_DIR, fund_folder(fund_name), "excerpted")
+
+def _init_worker(ocr_workers, adaptive_ocr, events):
+    # Spawned workers do not inherit settings changed at runtime in the parent
+    excerption_base.OCR_WORKERS = ocr_workers
+    excerption_base.ADAPTIVE_OCR = adaptive_ocr
+    # Page counts and OCR'd pages go back to the parent as (fund, event) for its progress tracking
+    progress_events.forward_events(lambda record: events.put((run_profiler.current_fund(), record)))
+
+def _extract_job(pdf_path, label):
+    run_profiler.set_fund(label)
+    try:
+        return excerption_base.extract_full_text_from_pdf(pdf_path, label=label), run_profiler.drain()
+    finally:
+        excerption_base.shutdown_ocr_engine()
+
+def _excerpt_job(fund, texts):
+    run_profiler.set_fund(fund)
+    return excerption_base.excerpt_text("\n\n".join(texts)), run_profiler.drain()
+
+@contextmanager
+def _worker_events(updates):
+    """A queue for the pool workers' progress events, copied into `updates` as ("event", fund, event)."""
+    events = multiprocessing.Queue()
+
+    def relay():
+        for fund, event in iter(events.get, None):
+            updates.put(("event", fund, event))
+    relay_thread = threading.Thread(target=relay, daemon=True)
+    relay_thread.start()
+    try:
+        yield events
+    finally:
+        events.put(None)
+        relay_thread.join()
+
+class _FundState:
+    def __init__(self):
+        self.scraped = False
+        self.done = False
+        self.queued = set()  # PDFs ever sent to extraction
+        self.outstanding = 0  # extractions queued or running
+        self.final = None  # PDFs to excerpt, known once the scraper has exited
+        self.fingerprint = None
+        self.failed = False  # a PDF could not be extracted; do not save the excerpt as current
+        self.texts = {}
+        self.extract_started = None
+        self.excerpt_started = None
+
+def run_pipeline(funds, scrape_options=None, extract_workers=None, max_in_flight=None, ledger=None):
+    """Scrape, extract and excerpt `funds` with the stages overlapping.
+
+    Each PDF a scraper reports as downloaded is queued for text extraction
+    right away, and a fund is excerpted as soon as its scraper has exited and
+    all of its PDFs are extracted. PDFs a scraper reports as unchanged are
+    only extracted if another of the fund's inputs changed, and a fund whose
+    inputs all match its saved excerpt is not re-extracted at all. Yields
+    PipelineUpdate tuples in the caller's thread; every fund ends with
+    "excerpted", "excerpt_failed" or "skipped".
+
+    With a RunLedger, every fund's scrape, extract and excerpt outcome is
+    recorded in it, and funds the ledger's run already scraped are not
+    scraped again.
+    """
+    funds = list(funds)
+    if not funds:
+        return
+    extract_workers = extract_workers or EXTRACT_WORKERS
+    max_in_flight = max_in_flight or EXTRACT_MAX_IN_FLIGHT
+    states = {fund: _FundState() for fund in funds}
+    updates = queue.Queue()
+    backlog = deque()
+    in_flight = [0]
+    remaining = set(funds)
+    resumed = [fund for fund in funds if ledger is not None and ledger.is_done(fund, "scrape")]
+    to_scrape = [fund for fund in funds if fund not in resumed]
+
+    def record(fund, stage, status, started=None, **fields):
+        if ledger is not None:
+            duration = time.perf_counter() - started if started is not None else None
+            ledger.record(fund, stage, status, duration=fields.pop("duration", duration), **fields)
+
+    def scrape():
+        try:
+            for result in run_scrapers(to_scrape, on_event=lambda fund, event: updates.put(("event", fund, event)),
+                                       **(scrape_options or {})):
+                updates.put(("scraped", result.fund, result))
+        except Exception as e:
+            updates.put(("scrape_error", None, e))
+        updates.put(("scrape_finished", None, None))
+
+    ocr_workers = max(1, excerption_base.OCR_WORKERS // extract_workers)
+    with _worker_events(updates) as events, \
+            ProcessPoolExecutor(max_workers=extract_workers, initializer=_init_worker,
+                                initargs=(ocr_workers, excerption_base.ADAPTIVE_OCR, events)) as executor:
+
+        def enqueue(fund, pdf_path):
+            state = states[fund]
+            if pdf_path in state.queued:
+                return
+            state.queued.add(pdf_path)
+            if state.extract_started is None:
+                state.extract_started = time.perf_counter()
+            state.outstanding += 1
+            backlog.append((fund, pdf_path))
+
+        def pump():
+            while backlog and in_flight[0] < max_in_flight:
+                fund, pdf_path = backlog.popleft()
+                in_flight[0] += 1
+                future = executor.submit(_extract_job, pdf_path, fund)
+                future.add_done_callback(
+                    lambda done, fund=fund, pdf_path=pdf_path: updates.put(("extract_done", fund, (pdf_path, done))))
+
+        def maybe_excerpt(fund):
+            """Start the excerpt once the scraper has exited and every PDF is extracted."""
+            state = states[fund]
+            if state.done or not state.scraped or state.outstanding:
+                return None
+            state.done = True
+            record(fund, "extract", "failed" if state.failed else "done", state.extract_started,
+                   error="some PDFs could not be extracted" if state.failed else None)
+            if not state.texts:
+                record(fund, "excerpt", "skipped", error="no PDFs could be extracted")
+                return PipelineUpdate("skipped", fund, "no PDFs could be extracted")
+            texts = [state.texts[path] for path in sorted(state.texts)]
+            state.excerpt_started = time.perf_counter()
+            future = executor.submit(_excerpt_job, fund, texts)
+            future.add_done_callback(lambda done, fund=fund: updates.put(("excerpt_done", fund, done)))
+            return None
+
+        def finish_early(fund):
+            """Resolve `fund` without an excerpt; its running extractions finish and are ignored."""
+            state = states[fund]
+            state.done = True
+            for item in [item for item in backlog if item[0] == fund]:
+                backlog.remove(item)
+                state.outstanding -= 1
+            remaining.discard(fund)
+
+        def sources_ready(fund):
+            """Settle the fund's final PDF list once its scraper has exited."""
+            state = states[fund]
+            # Pick up PDFs the scraper did not announce (browser downloads, unchanged files)
+            directory = downloads_dir(fund)
+            listed = [os.path.abspath(os.path.join(directory, name)) for name in os.listdir(directory)
+                      if name.endswith(".pdf")] if os.path.isdir(directory) else []
+            final = set(select_source_pdfs(listed))
+            yield PipelineUpdate("sources", fund, sorted(final))
+            if not final:
+                finish_early(fund)
+                record(fund, "excerpt", "skipped", error="no PDFs found")
+                yield PipelineUpdate("skipped", fund, "no PDFs found")
+                return
+            state.fingerprint = inputs_fingerprint(final)
+            saved = current_excerpt(excerpted_dir(fund), state.fingerprint)
+            if saved is not None:
+                finish_early(fund)
+                # Keep the timings of a resumed run's own extraction and excerpt
+                if ledger is None or not ledger.is_done(fund, "excerpt"):
+                    record(fund, "extract", "skipped")
+                    record(fund, "excerpt", "done", artifact=os.path.join(excerpted_dir(fund), EXCERPT_STATE_NAME))
+                yield PipelineUpdate("unchanged", fund, None)
+                yield PipelineUpdate("excerpted", fund, saved["results"])
+                return
+            for path in sorted(final):
+                enqueue(fund, path)
+            # Forget extracted files the scraper removed or superseded afterwards
+            state.texts = {path: text for path, text in state.texts.items() if path in final}
+            state.final = final
+            state.scraped = True
+
+        scraper_thread = threading.Thread(target=scrape, daemon=True)
+        scraper_thread.start()
+        scraping = True
+        for fund in resumed:
+            yield PipelineUpdate("resumed", fund, None)
+            yield from sources_ready(fund)
+        while scraping or remaining:
+            kind, fund, payload = updates.get()
+
+            if kind == "scrape_finished":
+                scraping = False
+            elif kind == "scrape_error":
+                raise payload
+            elif kind == "event" and payload.get("event") == "stage_timing":
+                yield PipelineUpdate("profile", fund, [payload])
+            elif kind == "event":
+                yield PipelineUpdate("event", fund, payload)
+                path = payload.get("path")
+                if (payload.get("event") == "pdf_downloaded" and payload.get("changed", True)
+                        and path and path.lower().endswith(".pdf")
+                        and os.path.isfile(path)
+                        and os.path.abspath(os.path.dirname(path)) == os.path.abspath(downloads_dir(fund))):
+                    enqueue(fund, os.path.abspath(path))
+            elif kind == "scraped":
+                yield PipelineUpdate("scraped", fund, payload)
+                if payload.returncode != 0:
+                    record(fund, "scrape", "failed", duration=payload.duration,
+                           error="timed out" if payload.timed_out else f"exit status {payload.returncode}")
+                    finish_early(fund)
+                    yield PipelineUpdate("skipped", fund, "timed out" if payload.timed_out else "scraper failed")
+                else:
+                    record(fund, "scrape", "done", duration=payload.duration, artifact=downloads_dir(fund))
+                    yield from sources_ready(fund)
+            elif kind == "extract_done":
+                in_flight[0] -= 1
+                pdf_path, future = payload
+                state = states[fund]
+                state.outstanding -= 1
+                try:
+                    text, timings = future.result()
+                except Exception as e:
+                    state.failed = True
+                    yield PipelineUpdate("extract_failed", fund, (pdf_path, e))
+                else:
+                    yield PipelineUpdate("profile", fund, timings)
+                    if not state.done and (state.final is None or pdf_path in state.final):
+                        state.texts[pdf_path] = text
+                    yield PipelineUpdate("extracted", fund, pdf_path)
+            elif kind == "excerpt_done":
+                remaining.discard(fund)
+                try:
+                    results, timings = payload.result()
+                except Exception as e:
+                    record(fund, "excerpt", "failed", states[fund].excerpt_started, error=e)
+                    yield PipelineUpdate("excerpt_failed", fund, e)
+                else:
+                    yield PipelineUpdate("profile", fund, timings)
+                    artifact = None
+                    if not states[fund].failed:
+                        save_excerpt_state(excerpted_dir(fund), states[fund].fingerprint, results)
+                        artifact = os.path.join(excerpted_dir(fund), EXCERPT_STATE_NAME)
+                    record(fund, "excerpt", "done", states[fund].excerpt_started, artifact=artifact)
+                    yield PipelineUpdate("excerpted", fund, results)
+
+            pump()
+            for waiting in list(remaining):
+                update = maybe_excerpt(waiting)
+                if update is not None:
+                    remaining.discard(waiting)
+                    yield update
+
+# === Compiled Output ===
+
+def render_part(fund, results, date_str, ledger=None, reuse=False):
+    """Render one fund's excerpt to its own titled PDF under PARTS_DIR and return the path.
+
+    With `reuse`, a part the ledger's run already rendered is returned as-is;
+    only pass it when the excerpt was reused unchanged. Render outcomes are
+    recorded in the ledger; errors are re-raised after recording.
+    """
+    if reuse and ledger is not None and ledger.is_done(fund, "render"):
+        return ledger.artifact(fund, "render")
+    os.makedirs(PARTS_DIR, exist_ok=True)
+    part_path = os.path.join(PARTS_DIR, f"Excerpted_{fund_folder(fund)}_{date_str}.pdf")
+    started = time.perf_counter()
+    try:
+        with run_profiler.stage("render", fund):
+            save_results_to_pdf(results, part_path, title=fund)
+    except Exception as e:
+        if ledger is not None:
+            ledger.record(fund, "render", "failed", error=e)
+        raise
+    if ledger is not None:
+        ledger.record(fund, "render", "done", duration=time.perf_counter() - started, artifact=part_path)
+    return part_path
+
+def merge_pdfs(pdf_paths, output_path):
+    with run_profiler.stage("merge"):
+        merger = PdfMerger()
+        for path in pdf_paths:
+            merger.append(path)
+        merger.write(output_path)
+        merger.close()
+    return output_path
@@ -0,0 +1,185 @@
+# progress_events.py
+import atexit
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# Event lines are ordinary stdout lines with this prefix, so a script run by
+# hand still prints readable logs and a parent can pick the events out
+EVENT_PREFIX = "@@cutler-progress "
+ENABLED_ENV = "CUTLER_PROGRESS_EVENTS"
+
+_forward = None
+
+def enabled():
+    return os.getenv(ENABLED_ENV) == "1"
+
+def emit(event, **fields):
+    """Write one progress event as a JSON line on stdout, if the parent asked for events.
+
+    Events used so far:
+      links_found     count            report links discovered by a scraper
+      pdf_downloaded  path, bytes      one PDF written to disk
+      fund_started    fund             excerpt.py began a fund
+      pdf_pages       path, pages, ocr pages in a PDF and how many need OCR
+      page_ocr        page             one page OCR'd (or served from cache)
+      fund_done       fund             excerpt.py finished a fund
+      stage_timing    stage, calls, wall, cpu, peak_rss
+                                       stage totals sent by run_profiler at exit
+    """
+    if not enabled():
+        return
+    record = {"event": event, "time": time.time()}
+    record.update(fields)
+    if _forward is not None:
+        _forward(record)
+        return
+    sys.stdout.write(EVENT_PREFIX + json.dumps(record) + "\n")
+    sys.stdout.flush()
+
+def forward_events(put):
+    """Hand this process's events to put(record) instead of printing them.
+
+    For pool workers, whose stdout the parent does not read; put is
+    typically a multiprocessing queue's put.
+    """
+    global _forward
+    os.environ[ENABLED_ENV] = "1"
+    _forward = put
+
+def _report_stage_timings():
+    from run_profiler import report_at_exit
+    report_at_exit()
+
+# Child processes run with events on send their stage timings to the parent as they exit
+if enabled():
+    atexit.register(_report_stage_timings)
+
+def parse_event(line):
+    """Return the event dict carried by a stdout line, or None for ordinary output."""
+    if not line.startswith(EVENT_PREFIX):
+        return None
+    try:
+        return json.loads(line[len(EVENT_PREFIX):])
+    except ValueError:
+        return None
+
+def child_env():
+    """Environment for a child process that should stream events back unbuffered."""
+    env = dict(os.environ)
+    env[ENABLED_ENV] = "1"
+    env["PYTHONUNBUFFERED"] = "1"
+    # Scrapers print non-ASCII; a pipe on Windows would otherwise default to cp1252
+    env["PYTHONIOENCODING"] = "utf-8"
+    return env
+
+def run_with_events(cmd, on_event=None, timeout=None, cancel=None):
+    """Run `cmd`, calling on_event(event) for every event line as it is printed.
+
+    Returns (returncode, stdout, stderr, timed_out) where stdout has the event
+    lines removed and returncode is None if the process was killed on timeout.
+    Setting the threading.Event `cancel` kills the process early; returncode
+    is then whatever the killed process reports.
+    """
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                               encoding="utf-8", errors="replace", env=child_env())
+    stderr_lines = []
+    stderr_reader = threading.Thread(target=lambda: stderr_lines.extend(process.stderr), daemon=True)
+    stderr_reader.start()
+
+    timed_out = threading.Event()
+    def kill():
+        timed_out.set()
+        process.kill()
+    timer = threading.Timer(timeout, kill) if timeout else None
+    if timer is not None:
+        timer.start()
+    if cancel is not None:
+        def watch_cancel():
+            while process.poll() is None:
+                if cancel.wait(0.5):
+                    process.kill()
+                    return
+        threading.Thread(target=watch_cancel, daemon=True).start()
+
+    stdout_lines = []
+    try:
+        for line in process.stdout:
+            event = parse_event(line)
+            if event is None:
+                stdout_lines.append(line)
+            elif on_event is not None:
+                on_event(event)
+        process.wait()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        stderr_reader.join()
+    returncode = None if timed_out.is_set() else process.returncode
+    return returncode, "".join(stdout_lines), "".join(stderr_lines), timed_out.is_set()
+
+class ProgressTracker:
+    """Turns events from several funds into overall progress, throughput and ETA."""
+
+    def __init__(self, funds):
+        self.funds = list(funds)
+        self.started = time.perf_counter()
+        self.finished = set()
+        self.links = {}
+        self.downloads = {}
+        self.pages = {}
+        self.pages_done = {}
+
+    def update(self, fund, event):
+        kind = event.get("event")
+        if kind == "links_found":
+            self.links[fund] = self.links.get(fund, 0) + event.get("count", 0)
+        elif kind == "pdf_downloaded":
+            self.downloads[fund] = self.downloads.get(fund, 0) + 1
+        elif kind == "pdf_pages":
+            self.pages[fund] = self.pages.get(fund, 0) + event.get("ocr", 0)
+        elif kind == "page_ocr":
+            self.pages_done[fund] = self.pages_done.get(fund, 0) + 1
+
+    def finish(self, fund):
+        self.finished.add(fund)
+
+    def fund_fraction(self, fund):
+        """Best estimate of how far along `fund` is, from the work it has announced."""
+        if fund in self.finished:
+            return 1.0
+        if self.pages.get(fund):
+            return min(self.pages_done.get(fund, 0) / self.pages[fund], 0.99)
+        if self.links.get(fund):
+            return min(self.downloads.get(fund, 0) / self.links[fund], 0.99)
+        return 0.0
+
+    def fraction(self):
+        if not self.funds:
+            return 1.0
+        return sum(self.fund_fraction(fund) for fund in self.funds) / len(self.funds)
+
+    def eta(self):
+        """Seconds remaining at the average rate so far, or None before any progress."""
+        done = self.fraction()
+        if done <= 0:
+            return None
+        elapsed = time.perf_counter() - self.started
+        return elapsed * (1 - done) / done
+
+    def summary(self):
+        elapsed = time.perf_counter() - self.started
+        parts = [f"{len(self.finished)}/{len(self.funds)} funds done"]
+        downloads = sum(self.downloads.values())
+        if downloads:
+            parts.append(f"{downloads} PDFs downloaded ({downloads / elapsed * 60:.1f}/min)")
+        pages_done = sum(self.pages_done.values())
+        if pages_done:
+            parts.append(f"{pages_done}/{sum(self.pages.values())} pages OCR'd ({pages_done / elapsed:.2f} pages/sec)")
+        eta = self.eta()
+        if eta is not None and len(self.finished) < len(self.funds):
+            parts.append(f"ETA {eta:.0f}s")
+        return ", ".join(parts)
@@ -0,0 +1,102 @@
+# run_ledger.py
+import os
+import sqlite3
+import time
+
+DEFAULT_LEDGER_PATH = os.path.join(os.getcwd(), "Cutler", "cache", "run_ledger.sqlite")
+STAGES = ("scrape", "extract", "excerpt", "render")
+
+class RunLedger:
+    """SQLite record of each fund's stage status, artifacts and timings per compilation run.
+
+    A run that dies part way stays "running" (or ends "failed"); starting
+    the next run with resume=True continues it, and is_done() tells the
+    pipeline which fund stages can be skipped.
+    """
+
+    def __init__(self, path=DEFAULT_LEDGER_PATH):
+        self.path = path
+        self.run_id = None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " started REAL NOT NULL,"
+            " finished REAL,"
+            " status TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stages ("
+            " run_id INTEGER NOT NULL,"
+            " fund TEXT NOT NULL,"
+            " stage TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " duration REAL,"
+            " artifact TEXT,"
+            " error TEXT,"
+            " updated REAL NOT NULL,"
+            " PRIMARY KEY (run_id, fund, stage))"
+        )
+        self._conn.commit()
+
+    def start_run(self, resume=False):
+        """Start a new run, or with `resume` continue the latest run that did not finish cleanly."""
+        if resume:
+            row = self._conn.execute(
+                "SELECT id FROM runs WHERE status != 'done' ORDER BY id DESC LIMIT 1").fetchone()
+            if row is not None:
+                self.run_id = row[0]
+                self._conn.execute("UPDATE runs SET status = 'running', finished = NULL WHERE id = ?", (self.run_id,))
+                self._conn.commit()
+                return self.run_id
+        cursor = self._conn.execute("INSERT INTO runs (started, status) VALUES (?, 'running')", (time.time(),))
+        self._conn.commit()
+        self.run_id = cursor.lastrowid
+        return self.run_id
+
+    def finish_run(self, status="done"):
+        self._conn.execute("UPDATE runs SET status = ?, finished = ? WHERE id = ?", (status, time.time(), self.run_id))
+        self._conn.commit()
+
+    def record(self, fund, stage, status, duration=None, artifact=None, error=None):
+        """Store the outcome of one fund stage ("done", "failed" or "skipped") in the current run."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO stages (run_id, fund, stage, status, duration, artifact, error, updated)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self.run_id, fund, stage, status, duration, artifact, None if error is None else str(error), time.time()),
+        )
+        self._conn.commit()
+
+    def get(self, fund, stage):
+        """Return (status, duration, artifact, error) for a fund stage of the current run, or None."""
+        return self._conn.execute(
+            "SELECT status, duration, artifact, error FROM stages WHERE run_id = ? AND fund = ? AND stage = ?",
+            (self.run_id, fund, stage),
+        ).fetchone()
+
+    def is_done(self, fund, stage):
+        """True if the stage finished in this run and its artifact, if any, is still on disk."""
+        row = self.get(fund, stage)
+        if row is None or row[0] != "done":
+            return False
+        return row[2] is None or os.path.exists(row[2])
+
+    def artifact(self, fund, stage):
+        row = self.get(fund, stage)
+        return row[2] if row is not None else None
+
+    def timings(self):
+        """[(fund, stage, status, duration)] for the current run, in fund then stage order."""
+        rows = self._conn.execute(
+            "SELECT fund, stage, status, duration FROM stages WHERE run_id = ?", (self.run_id,)).fetchall()
+        return sorted(rows, key=lambda row: (row[0], STAGES.index(row[1]) if row[1] in STAGES else len(STAGES)))
+
+    def close(self):
+        self._conn.close()
+
+def format_timings(rows):
+    """One line per fund stage from RunLedger.timings(), for end-of-run summaries."""
+    return [f"{fund}: {stage} {status}" + (f" in {duration:.1f}s" if duration is not None else "")
+            for fund, stage, status, duration in rows]
@@ -0,0 +1,236 @@
+# run_profiler.py
+import atexit
+import cProfile
+import html
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from funds import fund_scripts
+from progress_events import emit
+
+COMPILED_DIR = os.path.join(os.getcwd(), "Cutler", "Compiled")
+PROFILES_DIR = os.path.join(COMPILED_DIR, "profiles")
+# Stage names in pipeline order; the report lists stages in this order. "wait" (event-driven
+# waits) and "sleep" (fixed sleeps) are timed by waits.py inside a scraper's "scrape"
+STAGES = ("scrape", "wait", "sleep", "download", "merge", "rasterize", "ocr", "match", "filter", "dedupe", "render")
+# Set to a stage name (e.g. CUTLER_PROFILE_STAGE=ocr) to capture a cProfile of that stage in every process
+PROFILE_STAGE_ENV = "CUTLER_PROFILE_STAGE"
+
+_totals = {}  # (fund, stage) -> {"calls", "wall", "cpu", "peak_rss"}
+_totals_lock = threading.Lock()  # in-process scrapers time stages from several threads
+# Fund that stages timed without an explicit one belong to, per thread: in-process
+# scrapers for different funds run side by side in one process
+_current = threading.local()
+_profiler = None
+_process_started = time.perf_counter()
+
+def peak_rss_bytes():
+    """High-water resident set size of this process, or None if it cannot be measured."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss)
+    return None
+
+def set_fund(fund):
+    """Attribute stages timed in this thread without an explicit fund to `fund`; returns the previous one."""
+    previous = current_fund()
+    _current.fund = fund
+    return previous
+
+def current_fund():
+    return getattr(_current, "fund", None)
+
+def _stage_profiler(name):
+    global _profiler
+    if os.getenv(PROFILE_STAGE_ENV) != name:
+        return None
+    if _profiler is None:
+        _profiler = cProfile.Profile()
+        atexit.register(dump_profile)
+    return _profiler
+
+@contextmanager
+def stage(name, fund=None):
+    """Time a block as one call of stage `name`: wall time, CPU time of this process and peak RSS.
+
+    CPU time only covers this process, so work handed to other processes
+    (Tesseract workers) shows up as wall time only. Stages may nest, e.g.
+    rasterizing happens while OCR is being timed.
+    """
+    profiler = _stage_profiler(name)
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        wall = time.perf_counter() - wall_started
+        cpu = time.process_time() - cpu_started
+        peak = peak_rss_bytes()
+        with _totals_lock:
+            totals = _totals.setdefault((fund or current_fund(), name),
+                                        {"calls": 0, "wall": 0.0, "cpu": 0.0, "peak_rss": None})
+            totals["calls"] += 1
+            totals["wall"] += wall
+            totals["cpu"] += cpu
+            if peak is not None:
+                totals["peak_rss"] = max(totals["peak_rss"] or 0, peak)
+
+def drain():
+    """Return this process's stage records since the last drain and reset them."""
+    with _totals_lock:
+        records = [dict(totals, fund=fund, stage=name) for (fund, name), totals in _totals.items()]
+        _totals.clear()
+    if _profiler is not None:
+        dump_profile()
+    return records
+
+def dump_profile():
+    """Write the captured cProfile (cumulative for this process) as .prof plus a text summary."""
+    if _profiler is None:
+        return None
+    stage_name = os.getenv(PROFILE_STAGE_ENV)
+    os.makedirs(PROFILES_DIR, exist_ok=True)
+    path = os.path.join(PROFILES_DIR, f"{stage_name}_{os.getpid()}.prof")
+    _profiler.dump_stats(path)
+    with open(path[:-len(".prof")] + ".txt", "w", encoding="utf-8") as f:
+        pstats.Stats(path, stream=f).sort_stats("cumulative").print_stats(40)
+    return path
+
+def report_at_exit():
+    """Send this child process's stage records to the parent as stage_timing events.
+
+    progress_events calls this at exit in processes started with events
+    enabled. A scraper also reports its whole process as the "scrape" stage.
+    """
+    records = drain()
+    if os.path.basename(sys.argv[0]) in set(fund_scripts.values()):
+        records.append({"fund": None, "stage": "scrape", "calls": 1, "cpu": time.process_time(),
+                        "wall": time.perf_counter() - _process_started, "peak_rss": peak_rss_bytes()})
+    for record in records:
+        emit("stage_timing", **record)
+
+# === Run Report ===
+
+class ProfileReport:
+    """Per-fund, per-stage totals collected from every process of one run."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.totals = {}
+
+    def add(self, fund, records):
+        for record in records:
+            key = (record.get("fund") or fund or "(run)", record["stage"])
+            totals = self.totals.setdefault(key, {"calls": 0, "wall": 0.0, "cpu": 0.0, "peak_rss": None})
+            totals["calls"] += record.get("calls", 1)
+            totals["wall"] += record.get("wall", 0.0)
+            totals["cpu"] += record.get("cpu", 0.0)
+            if record.get("peak_rss") is not None:
+                totals["peak_rss"] = max(totals["peak_rss"] or 0, record["peak_rss"])
+
+    def rows(self):
+        order = {name: index for index, name in enumerate(STAGES)}
+        return [dict(totals, fund=fund, stage=name) for (fund, name), totals in
+                sorted(self.totals.items(), key=lambda item: (item[0][0], order.get(item[0][1], len(STAGES))))]
+
+    def stage_totals(self):
+        """Totals per stage across funds, slowest first."""
+        per_stage = {}
+        for (_, name), totals in self.totals.items():
+            summed = per_stage.setdefault(name, {"calls": 0, "wall": 0.0, "cpu": 0.0, "peak_rss": None})
+            summed["calls"] += totals["calls"]
+            summed["wall"] += totals["wall"]
+            summed["cpu"] += totals["cpu"]
+            if totals["peak_rss"] is not None:
+                summed["peak_rss"] = max(summed["peak_rss"] or 0, totals["peak_rss"])
+        return sorted(({**totals, "stage": name} for name, totals in per_stage.items()),
+                      key=lambda row: row["wall"], reverse=True)
+
+    def idle_rows(self):
+        """Per fund, scraper wall time split into waiting, fixed sleeps and the rest (work), most idle first."""
+        rows = []
+        for (fund, name), totals in self.totals.items():
+            if name != "scrape":
+                continue
+            waited = self.totals.get((fund, "wait"), {}).get("wall", 0.0)
+            slept = self.totals.get((fund, "sleep"), {}).get("wall", 0.0)
+            rows.append({"fund": fund, "scrape": totals["wall"], "wait": waited, "sleep": slept,
+                         "work": max(0.0, totals["wall"] - waited - slept)})
+        return sorted(rows, key=lambda row: row["wait"] + row["sleep"], reverse=True)
+
+    def write(self, directory=COMPILED_DIR, name=None):
+        """Write profile_<timestamp>.json and .html into `directory`; returns (json_path, html_path)."""
+        os.makedirs(directory, exist_ok=True)
+        name = name or time.strftime("profile_%Y%m%d_%H%M%S", time.localtime(self.started))
+        json_path = os.path.join(directory, name + ".json")
+        html_path = os.path.join(directory, name + ".html")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"started": self.started, "stages": self.stage_totals(), "funds": self.rows(),
+                       "idle": self.idle_rows(), "profiled_stage": os.getenv(PROFILE_STAGE_ENV)}, f, indent=2)
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.write(self._html())
+        return json_path, html_path
+
+    def _html(self):
+        def mb(value):
+            return "" if value is None else f"{value / (1024 * 1024):.0f}"
+
+        def table(rows, first_columns):
+            longest = max((row["wall"] for row in rows), default=0) or 1
+            lines = ["<tr>" + "".join(f"<th>{column}</th>" for column in first_columns)
+                     + "<th>calls</th><th>wall s</th><th></th><th>CPU s</th><th>peak RSS MB</th></tr>"]
+            for row in rows:
+                cells = "".join(f"<td>{html.escape(str(row[column]))}</td>" for column in first_columns)
+                bar = f'<div class="bar" style="width:{200 * row["wall"] / longest:.0f}px"></div>'
+                lines.append(f"<tr>{cells}<td>{row['calls']}</td><td>{row['wall']:.2f}</td><td>{bar}</td>"
+                             f"<td>{row['cpu']:.2f}</td><td>{mb(row['peak_rss'])}</td></tr>")
+            return "<table>" + "\n".join(lines) + "</table>"
+
+        def idle_table(rows):
+            lines = ["<tr><th>fund</th><th>scrape s</th><th>waiting s</th><th>sleeping s</th><th>working s</th>"
+                     "<th>idle %</th></tr>"]
+            for row in rows:
+                idle = 100 * (row["wait"] + row["sleep"]) / row["scrape"] if row["scrape"] else 0
+                lines.append(f"<tr><td>{html.escape(str(row['fund']))}</td><td>{row['scrape']:.1f}</td>"
+                             f"<td>{row['wait']:.1f}</td><td>{row['sleep']:.1f}</td><td>{row['work']:.1f}</td>"
+                             f"<td>{idle:.0f}</td></tr>")
+            return "<table>" + "\n".join(lines) + "</table>"
+
+        started = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.started))
+        return (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Cutler run profile</title><style>"
+            "body{font-family:sans-serif} table{border-collapse:collapse;margin-bottom:2em}"
+            "td,th{padding:2px 8px;text-align:right} td:first-child,th:first-child{text-align:left}"
+            ".bar{background:#4a7;height:10px}</style></head><body>"
+            f"<h1>Run profile, {started}</h1>"
+            "<p>CPU time is for the process doing the stage; OCR runs in separate Tesseract processes, "
+            "so compare its wall time. Stages can nest (rasterize inside OCR).</p>"
+            f"<h2>By stage</h2>{table(self.stage_totals(), ['stage'])}"
+            f"<h2>By fund</h2>{table(self.rows(), ['fund', 'stage'])}"
+            "<h2>Scrapers: waiting vs working</h2><p>Waiting is time in waits.py's event-driven waits, "
+            "sleeping is fixed sleeps (retry backoff); working is the rest of the scraper's wall time.</p>"
+            f"{idle_table(self.idle_rows())}"
+            "</body></html>"
+        )
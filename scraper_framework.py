@@ -0,0 +1,974 @@
+# scraper_framework.py
+import glob
+import io
+import os
+import random
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from PyPDF2 import PdfMerger, PdfReader
+
+from download_engine import DEADLINE_ERROR, DownloadResult, download_all
+from fund_manifest import FundManifest
+from funds import fund_folder
+from progress_events import emit
+from run_profiler import set_fund, stage
+from waits import DEFAULT_TIMEOUT as WAIT_TIMEOUT, pause, wait_for_dom_stable, wait_for_download, wait_for_selector
+
+BASE_DIR = os.path.join(os.getcwd(), "Cutler")
+# Applied to every page and PDF request unless a plugin sets its own, and cut
+# to the time left before the scheduler's deadline, so an in-process scraper
+# stops about when a subprocess would have been killed
+DEFAULT_REQUEST_TIMEOUT = 60
+HTTP_POOL_SIZE = 16
+# Upper bounds for browser sources: loading a page, and Chrome saving one PDF
+PAGE_LOAD_TIMEOUT = 60
+BROWSER_DOWNLOAD_TIMEOUT = 60
+# Seconds slept between attempts when a plugin retries a page
+RETRY_PAUSE = (5, 10)
+
+# date is the publication date _dated_report() read from the page, if any
+Document = namedtuple("Document", ["label", "url", "year", "date"], defaults=(None,))
+
+class Rule:
+    """Picks report links from a page by substrings of their text, title or href.
+
+    text/title patterns are matched against the lower-cased link text and
+    title attribute, href patterns case-sensitively against the raw href,
+    text_or_href against "<lower-cased text> <href>". Every pattern must be
+    present. pick is "first", "last", "all" or "latest_year"; the latter
+    parses year_pattern from the href and keeps the newest. `limit` caps
+    how many links "all" keeps.
+    """
+
+    def __init__(self, label, text=(), title=(), href=(), text_or_href=(), pick="first", limit=None,
+                 year_pattern=r"(20\d{2})"):
+        self.label = label
+        self.text = text
+        self.title = title
+        self.href = href
+        self.text_or_href = text_or_href
+        self.pick = pick
+        self.limit = limit
+        self.year_pattern = re.compile(year_pattern)
+
+    def matches(self, link):
+        href = link["href"]
+        text = link.get_text(strip=True).lower()
+        title = link.get("title", "").lower()
+        return (all(pattern in text for pattern in self.text)
+                and all(pattern in title for pattern in self.title)
+                and all(pattern in href for pattern in self.href)
+                and all(pattern in f"{text} {href}" for pattern in self.text_or_href))
+
+    def select(self, links, page_url):
+        found = []
+        for link in links:
+            if not self.matches(link):
+                continue
+            year = self.year_pattern.search(link["href"])
+            if self.pick == "latest_year" and year is None:
+                continue
+            found.append(Document(self.label, urljoin(page_url, link["href"]), year and int(year.group(1))))
+        if not found or self.pick == "all":
+            return found[:self.limit]
+        if self.pick == "first":
+            return found[:1]
+        if self.pick == "last":
+            return found[-1:]
+        # latest_year: the newest year wins, later links winning ties
+        return [max(reversed(found), key=lambda document: document.year)]
+
+class Source:
+    """One page listing report links: which anchors to look at and the rules that pick documents.
+
+    `find(soup, page_url)` can replace the rules for pages whose structure
+    (e.g. a table row per year) is more than a link filter; it returns Documents.
+    With `browser` the page is rendered in a pooled Chrome tab instead of
+    fetched: `wait_for` (CSS, or XPath starting with "/") must appear, then
+    prepare(driver, log, deadline) may click whatever reveals the links,
+    capping its waits with _time_left(deadline, ...). With `follow`
+    (a Source without a url) the documents found here are pages in turn,
+    each read with `follow`, e.g. a list of articles that each link a PDF.
+    """
+
+    def __init__(self, url, rules=(), selector="a[href]", pdf_only=True, find=None, browser=False, wait_for=None,
+                 prepare=None, follow=None):
+        self.url = url
+        self.rules = rules
+        self.selector = selector
+        self.pdf_only = pdf_only
+        self.find = find
+        self.browser = browser
+        self.wait_for = wait_for
+        self.prepare = prepare
+        self.follow = follow
+
+    def documents(self, soup, page_url=None):
+        page_url = page_url or self.url
+        if self.find is not None:
+            return self.find(soup, page_url)
+        links = [link for link in soup.select(self.selector)
+                 if link.get("href") and (not self.pdf_only or link["href"].endswith(".pdf"))]
+        return [document for rule in self.rules for document in rule.select(links, page_url)]
+
+class FundPlugin:
+    """Declarative description of one fund's report scraper.
+
+    filename and merged_name are format strings; filename can use {label},
+    {year}, {index} (1-based), {basename} (last URL segment) and {today},
+    merged_name {prefix}, {today} and {date} (the first document's date).
+    merge is "always" (merge whatever was downloaded), "multiple" (only when
+    more than one PDF) or "never". With `required`, finding or downloading
+    nothing fails the scraper; with required="all" every source must yield a
+    report, or the scraper fails without downloading anything. Each page is
+    tried `retries` times. download
+    is "http", or "browser" for sites that only hand PDFs to a real browser.
+    """
+
+    def __init__(self, name, sources, filename, prefix=None, client="requests", headers=None,
+                 request_options=None, merge="always", merged_name="{prefix}_{today}_Merged.pdf",
+                 required=False, retries=1, download="http"):
+        self.name = name
+        self.sources = sources
+        self.filename = filename
+        self.prefix = prefix or fund_folder(name)
+        self.client = client
+        self.headers = headers or {}
+        self.request_options = dict({"timeout": DEFAULT_REQUEST_TIMEOUT}, **(request_options or {}))
+        self.merge = merge
+        self.merged_name = merged_name
+        self.required = required
+        self.retries = retries
+        self.download = download
+
+    @property
+    def downloads_dir(self):
+        return os.path.join(BASE_DIR, fund_folder(self.name), "downloads")
+
+PLUGINS = {}
+
+def register(plugin):
+    PLUGINS[plugin.name] = plugin
+    return plugin
+
+# === Shared Runtime ===
+
+class _DeadlineReached(Exception):
+    """The scheduler's time for this scraper is up."""
+
+def _time_left(deadline, limit):
+    """`limit` seconds, or less if `deadline` is nearer; raises _DeadlineReached once it has passed."""
+    if deadline is None:
+        return limit
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise _DeadlineReached()
+    return min(limit, left)
+
+class ScraperRuntime:
+    """HTTP sessions and warm Chrome shared by every plugin run in this process.
+
+    A run borrows one session of its client type for as long as it lasts, so
+    no session (cloudscraper's challenge state, the cookie jar) is used by
+    two threads at once; afterwards it goes back for the next fund, keeping
+    its Cloudflare clearance cookies. All requests sessions mount one
+    HTTPAdapter and share its connection pool. Browser pages come from
+    browser_pool.shared_pool().
+    """
+
+    def __init__(self):
+        self._idle_sessions = {}
+        self._adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(self, client):
+        with self._lock:
+            idle = self._idle_sessions.setdefault(client, [])
+            session = idle.pop() if idle else None
+        if session is None:
+            session = self._new_session(client)
+        try:
+            yield session
+        finally:
+            with self._lock:
+                self._idle_sessions[client].append(session)
+
+    def _new_session(self, client):
+        if client == "cloudscraper":
+            import cloudscraper
+            # Keeps its own HTTPS adapter: that carries the TLS fingerprint matching its user agent
+            return cloudscraper.create_scraper()
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def run(self, plugin, log=print, on_event=None, deadline=None):
+        """Scrape one fund; returns (ok, paths, timed_out).
+
+        on_event(event) receives progress events; without it they are
+        emitted on stdout as a standalone scraper would. No page or PDF
+        request runs past `deadline` (a time.monotonic() value).
+        """
+        def notify(event, **fields):
+            if on_event is not None:
+                on_event(dict(fields, event=event, time=time.time()))
+            else:
+                emit(event, **fields)
+
+        today = datetime.today().strftime("%Y%m%d")
+        os.makedirs(plugin.downloads_dir, exist_ok=True)
+        os.makedirs(os.path.join(os.path.dirname(plugin.downloads_dir), "excerpted"), exist_ok=True)
+        # Unchanged reports from earlier runs are kept; anything not seen this run is pruned below
+        manifest = FundManifest(plugin.downloads_dir, fund=plugin.name)
+
+        paths = []
+        with self.session(plugin.client) as session:
+            try:
+                documents, failed_sources, empty_sources = self._find_documents(plugin, session, deadline, log)
+                log(f" Found {len(documents)} {plugin.prefix} report link(s).")
+                notify("links_found", count=len(documents))
+                if plugin.required == "all" and (failed_sources or empty_sources):
+                    log(f" {failed_sources + empty_sources} of {len(plugin.sources)} required reports missing; "
+                        f"nothing downloaded.")
+                    return False, paths, False
+
+                timed_out = False
+                for result in self._download(plugin, documents, session, manifest, today, deadline):
+                    if result.error == DEADLINE_ERROR:
+                        timed_out = True
+                    elif result.error:
+                        log(f" Failed to download {result.url}: {result.error}")
+                    else:
+                        paths.append(result.path)
+                        log(f" {'Downloaded' if result.changed else 'Unchanged'}: {os.path.basename(result.path)}")
+                        if on_event is not None:
+                            # FundManifest only reports downloads on stdout, which is not read in-process
+                            notify("pdf_downloaded", path=result.path, bytes=os.path.getsize(result.path),
+                                   changed=result.changed)
+                # A request cut short by the deadline fails like any other, so check the clock too
+                if timed_out or deadline is not None and time.monotonic() >= deadline:
+                    raise _DeadlineReached()
+            except _DeadlineReached:
+                log(" Timed out before all reports were downloaded.")
+                # Keep everything on disk: a partial run must not prune reports it did not get to
+                return False, paths, True
+        merge = plugin.merge == "always" and paths or plugin.merge == "multiple" and len(paths) > 1
+        date = next((document.date for document in documents if document.date), "UnknownDate")
+        if merge and not manifest.changed:
+            # Nothing changed since the last merge: keep that file rather than rebuild it under today's date
+            previous = sorted(glob.glob(os.path.join(glob.escape(plugin.downloads_dir), plugin.merged_name.format(
+                prefix=plugin.prefix, today="*", date="*"))))
+            if previous:
+                manifest.keep(previous[-1])
+                merge = False
+        manifest.prune()
+        manifest.save()
+
+        if merge:
+            merge_downloads(paths, os.path.join(plugin.downloads_dir,
+                                                plugin.merged_name.format(prefix=plugin.prefix, today=today,
+                                                                          date=date)),
+                            plugin.name, log)
+        log(f" {plugin.name}: {len(paths)} report(s) ({manifest.summary()}).")
+
+        ok = failed_sources < len(plugin.sources) and (paths or not plugin.required)
+        return bool(ok), paths, False
+
+    # === Finding Documents ===
+
+    def _find_documents(self, plugin, session, deadline, log):
+        """Return (documents, sources that could not be read, sources read that listed no report)."""
+        documents = []
+        failed_sources = 0
+        empty_sources = 0
+        for source in plugin.sources:
+            try:
+                found = self._source_documents(plugin, source, source.url, session, deadline, log)
+            except _DeadlineReached:
+                raise
+            except Exception as e:
+                failed_sources += 1
+                log(f" Failed to read {source.url}: {e}")
+                continue
+            if not found:
+                empty_sources += 1
+            documents.extend(found)
+        # Pages often link the same report more than once
+        unique = {}
+        for document in documents:
+            unique.setdefault(document.url, document)
+        return list(unique.values()), failed_sources, empty_sources
+
+    def _source_documents(self, plugin, source, url, session, deadline, log):
+        found = source.documents(self._read_page(plugin, source, url, session, deadline, log), url)
+        if source.follow is None:
+            return found
+        documents = []
+        for page in found:
+            try:
+                documents.extend(self._source_documents(plugin, source.follow, page.url, session, deadline, log))
+            except _DeadlineReached:
+                raise
+            except Exception as e:
+                log(f" Failed to read {page.url}: {e}")
+        return documents
+
+    def _read_page(self, plugin, source, url, session, deadline, log):
+        for attempt in range(1, plugin.retries + 1):
+            try:
+                if source.browser:
+                    return self._render(plugin, source, url, deadline, log)
+                response = session.get(url, headers=plugin.headers, **self._request_options(plugin, deadline))
+                response.raise_for_status()
+                return BeautifulSoup(response.text, "html.parser")
+            except _DeadlineReached:
+                raise
+            except Exception as e:
+                if attempt == plugin.retries:
+                    raise
+                log(f" Attempt {attempt} failed for {url}: {e}")
+                pause(_time_left(deadline, random.uniform(*RETRY_PAUSE)))
+
+    def _render(self, plugin, source, url, deadline, log):
+        from browser_pool import shared_pool
+
+        with shared_pool().page(plugin.name, deadline) as driver:
+            driver.set_page_load_timeout(_time_left(deadline, PAGE_LOAD_TIMEOUT))
+            driver.get(url)
+            if source.wait_for and wait_for_selector(driver, source.wait_for,
+                                                     timeout=_time_left(deadline, WAIT_TIMEOUT)) is None:
+                raise LookupError(f"{source.wait_for} did not appear")
+            wait_for_dom_stable(driver, timeout=_time_left(deadline, WAIT_TIMEOUT))
+            if source.prepare is not None:
+                source.prepare(driver, log, deadline)
+            return BeautifulSoup(driver.page_source, "html.parser")
+
+    def _request_options(self, plugin, deadline):
+        return dict(plugin.request_options, timeout=_time_left(deadline, plugin.request_options["timeout"]))
+
+    # === Downloading ===
+
+    def _download(self, plugin, documents, session, manifest, today, deadline):
+        """Download `documents`, yielding a DownloadResult for each."""
+        targets = []
+        for index, document in enumerate(documents, 1):
+            filename = plugin.filename.format(label=document.label, year=document.year, index=index, today=today,
+                                              basename=document.url.split("?")[0].rsplit("/", 1)[-1])
+            targets.append((document.url, os.path.join(plugin.downloads_dir, filename)))
+        if not targets:
+            return []
+        if plugin.download == "browser":
+            return self._browser_downloads(plugin, targets, manifest, deadline)
+        if plugin.client == "requests":
+            # Plain HTTP: the whole batch at once over pooled connections
+            return download_all(targets, manifest, plugin.headers, deadline=deadline,
+                                timeout=_time_left(deadline, plugin.request_options["timeout"]))
+        # cloudscraper needs its own session (clearance cookies, TLS fingerprint), one file at a time
+        return self._fetch_each(plugin, targets, session, manifest, deadline)
+
+    def _fetch_each(self, plugin, targets, session, manifest, deadline):
+        for url, path in targets:
+            options = self._request_options(plugin, deadline)
+            try:
+                path, changed = manifest.fetch(session, url, path, headers=plugin.headers, **options)
+            except Exception as e:
+                yield DownloadResult(url, None, False, f"{type(e).__name__}: {e}")
+                continue
+            yield DownloadResult(url, path, changed, None)
+
+    def _browser_downloads(self, plugin, targets, manifest, deadline):
+        from browser_pool import set_download_directory, shared_pool
+
+        # Chrome saves into an empty folder first, so each new file is the download just started
+        staging = tempfile.mkdtemp(prefix="browser-", dir=plugin.downloads_dir)
+        try:
+            with shared_pool().page(plugin.name, deadline) as driver:
+                set_download_directory(driver, staging)
+                for url, path in targets:
+                    timeout = _time_left(deadline, BROWSER_DOWNLOAD_TIMEOUT)
+                    try:
+                        driver.set_page_load_timeout(timeout)
+                        driver.get(url)
+                    except Exception as e:
+                        yield DownloadResult(url, None, False, f"{type(e).__name__}: {e}")
+                        continue
+                    downloaded = wait_for_download(staging, timeout=timeout)
+                    if downloaded is None:
+                        yield DownloadResult(url, None, False, "download did not finish")
+                        continue
+                    try:
+                        path, changed = manifest.record_file(url, path, downloaded)
+                    except ValueError as e:
+                        yield DownloadResult(url, None, False, str(e))
+                        continue
+                    yield DownloadResult(url, path, changed, None)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+def merge_downloads(paths, merged_path, fund, log=print):
+    """Merge the PDFs that open cleanly into merged_path; corrupted downloads are skipped."""
+    merger = PdfMerger()
+    merged = 0
+    for path in paths:
+        try:
+            PdfReader(path)
+        except Exception as e:
+            log(f" Skipped unreadable PDF {os.path.basename(path)}: {e}")
+            continue
+        merger.append(path)
+        merged += 1
+    if merged:
+        with stage("merge", fund):
+            merger.write(merged_path)
+        log(f" Merged {merged} PDFs -> {os.path.basename(merged_path)}")
+    merger.close()
+
+_runtime = ScraperRuntime()
+
+def run_in_process(fund, timeout=None, on_event=None):
+    """Run a registered plugin in this process; returns (returncode, stdout, stderr, timed_out) like run_with_events."""
+    output = io.StringIO()
+    log = lambda message: output.write(message + "\n")
+    deadline = time.monotonic() + timeout if timeout else None
+    # waits.py times its waits and sleeps without a fund; file them under this one
+    previous_fund = set_fund(fund)
+    try:
+        with stage("scrape", fund):
+            try:
+                ok, _, timed_out = _runtime.run(PLUGINS[fund], log, on_event, deadline)
+            except Exception as e:
+                return 1, output.getvalue(), f"{type(e).__name__}: {e}", False
+    finally:
+        set_fund(previous_fund)
+    if timed_out:
+        return None, output.getvalue(), "", True
+    return (0 if ok else 1), output.getvalue(), "", False
+
+def run_standalone(fund):
+    """Entry point for the thin per-fund scripts; returns the process exit code."""
+    ok, _, _ = _runtime.run(PLUGINS[fund])
+    return 0 if ok else 1
+
+# === Plugin Helpers ===
+
+def _parse_date(text, date_format):
+    try:
+        return datetime.strptime(text.strip(), "%B %d, %Y").strftime(date_format)
+    except (AttributeError, ValueError):
+        return "UnknownDate"
+
+def _first_link(selector, text=None, prefix=None):
+    """link() for _dated_report: the first `selector` match containing `text` whose URL starts with `prefix`."""
+    def link(soup, page_url):
+        for tag in soup.select(selector):
+            url = urljoin(page_url, tag["href"])
+            if (text is None or text in tag.get_text()) and (prefix is None or url.startswith(prefix)):
+                return url
+        return None
+    return link
+
+def _dated_report(label, link, date, date_format="%Y%m%d"):
+    """find() for a page holding one report and its publication date ("March 31, 2025").
+
+    link(soup, page_url) returns the report URL or None, date(soup) the tag
+    holding the date; `label` is formatted with the date, or "UnknownDate".
+    """
+    def find(soup, page_url):
+        url = link(soup, page_url)
+        if url is None:
+            return []
+        date_tag = date(soup)
+        parsed = _parse_date(date_tag and date_tag.get_text(), date_format)
+        return [Document(label.format(date=parsed), url, None, parsed)]
+    return find
+
+def _pdfs_named(*any_of, exclude=()):
+    """find() keeping PDF links whose file name has a word from every group in `any_of` and none from `exclude`."""
+    def find(soup, page_url):
+        documents = []
+        for link in soup.select("a[href]"):
+            url = urljoin(page_url, link["href"]).split("?")[0]
+            if not url.endswith(".pdf"):
+                continue
+            name = url.rsplit("/", 1)[-1].lower()
+            if all(any(word in name for word in group) for group in any_of) and not any(word in name for word in exclude):
+                documents.append(Document("Report", url, None))
+        return documents
+    return find
+
+# === Fund Plugins ===
+# Browser plugins render their pages in pooled Chrome tabs (browser_pool).
+# The scrapers still run as scripts need a browser that pool cannot lend:
+# undetected_chromedriver (Alger, Amana, Ariel, Victory, Virtus, William
+# Blair) patches and often shows its own Chrome to get past bot checks, and
+# the Playwright scrapers (Touchstone, Transamerica, Value Line, Wasatch,
+# Weitz) hold sync Playwright objects that only work in the thread that
+# created them.
+
+def _appleseed_latest_year(soup, page_url):
+    # Reports sit in a table with one row per year; the first row with a year cell is the newest
+    for row in soup.select("tbody tr"):
+        year_cell = row.find("strong")
+        if year_cell and year_cell.text.strip().isdigit():
+            year = int(year_cell.text.strip())
+            break
+    else:
+        return []
+    documents = []
+    for link in row.find_all("a", href=True):
+        label = link.text.strip().lower()
+        if "semi" in label or "annual" in label:
+            documents.append(Document("SemiAnnual" if "semi" in label else "Annual", urljoin(page_url, link["href"]),
+                                      year))
+    return documents
+
+register(FundPlugin(
+    "ALPS Funds",
+    sources=[Source(
+        "https://www.alpsfunds.com/document-library?doc_category=Literature&doc_type=Commentary",
+        selector="td.download a[href]",
+        rules=[Rule("Commentary", href=("comm",), pick="all")],
+    )],
+    headers={"User-Agent": "Mozilla/5.0"},
+    filename="{index:02d}_ALPS_Commentary.pdf",
+    merged_name="ALPS_Merged.pdf",
+))
+
+register(FundPlugin(
+    "Appleseed Fund",
+    sources=[Source("https://appleseedfund.com/perspectives/", find=_appleseed_latest_year)],
+    client="cloudscraper",
+    filename="Appleseed_{label}_{year}.pdf",
+))
+
+register(FundPlugin(
+    "Brookfield Asset Management",
+    sources=[
+        Source("https://bn.brookfield.com/reports-filings/annual-reports",
+               rules=[Rule("AnnualReport", text_or_href=("full annual report",), pick="latest_year",
+                           year_pattern=r"/(20\d{2})/")]),
+        Source("https://bn.brookfield.com/reports-filings/letters-shareholders",
+               rules=[Rule("ShareholderLetter", text_or_href=("letter-to-shareholders",), pick="latest_year",
+                           year_pattern=r"/(20\d{2})/")]),
+    ],
+    client="cloudscraper",
+    filename="Brookfield_{label}_{year}.pdf",
+))
+
+register(FundPlugin(
+    "Buffalo Funds",
+    sources=[Source("https://buffalofunds.com/our-funds/performance/#literature",
+                    rules=[Rule("AnnualReport", text=("annual report",))])],
+    client="cloudscraper",
+    filename="Buffalo_{label}_{today}.pdf",
+))
+
+register(FundPlugin(
+    "Sequoia Funds",
+    sources=[Source("https://www.sequoiafund.com/resources/", rules=[
+        Rule("Shareholder_Letter", title=("fund letter", "2024", "year-end"), pick="last"),
+        Rule("Tailored_Report", title=("tailored shareholder report", "2024", "dec"), pick="last"),
+        Rule("Annual_Report", title=("annual report", "2024", "dec"), pick="last"),
+    ])],
+    client="cloudscraper",
+    request_options={"timeout": 30},
+    filename="Sequoia_{label}_{today}.pdf",
+    merge="multiple",
+))
+
+register(FundPlugin(
+    "Tweedy Browne Funds",
+    sources=[Source("https://www.tweedyfunds.com/commentary/", rules=[Rule("Commentary", href=("FundCommentary",))])],
+    request_options={"timeout": 30},
+    filename="{basename}",
+    required=True,
+))
+
+# === Browser Fund Plugins ===
+
+register(FundPlugin(
+    "American Century Investments (ACI)",
+    sources=[Source(
+        "https://www.americancentury.com/insights/quarterly-performance-update/",
+        browser=True,
+        wait_for="//a[contains(@href, '.pdf')]",
+        find=_dated_report("ACI_{date}_Quarterly_Performance_Update", _first_link("a[href*='.pdf']"),
+                           lambda soup: soup.select_one("div[class*='pub-date']")),
+    )],
+    filename="{label}.pdf",
+    merge="never",
+    required=True,
+    retries=5,
+))
+
+register(FundPlugin(
+    "Allianz Global Investors",
+    sources=[Source(
+        "https://www.allianz.com/en/economic_research/insights/publications.html",
+        browser=True,
+        wait_for="a.c-heading__link",
+        selector="a.c-heading__link[href]",
+        pdf_only=False,
+        # The six newest publications, each linking its PDF from the article page
+        rules=[Rule("Publication", pick="all", limit=6)],
+        follow=Source(None, browser=True, wait_for="//div[@class='link']//a[contains(@href, '.pdf')]",
+                      selector="div.link a[href*='.pdf']", pdf_only=False, rules=[Rule("Publication")]),
+    )],
+    download="browser",
+    filename="{basename}",
+    merged_name="Allianz_Latest_6_Merged.pdf",
+))
+
+def _recent_months(count=4):
+    """"Mon YYYY" labels of this month and the `count` - 1 before it."""
+    today = datetime.today()
+    months = set()
+    for back in range(count):
+        year, month = divmod(today.year * 12 + today.month - 1 - back, 12)
+        months.add(datetime(year, month + 1, 1).strftime("%b %Y"))
+    return months
+
+def _artisan_commentaries(soup, page_url):
+    # One row per fund: its name "(TICKER)" in the second cell, then a commentary link per month
+    months = _recent_months()
+    documents = []
+    for row in soup.select("table#holdings tr"):
+        cells = row.find_all("td")
+        fund_link = cells[1].find("a") if len(cells) >= 2 else None
+        if fund_link is None:
+            continue
+        fund_full = fund_link.get("title") or fund_link.get_text(strip=True)
+        if "(" not in fund_full:
+            continue
+        fund = fund_full.split("(")[0].strip().replace(" ", "_")
+        ticker = fund_full.split("(")[1].split(")")[0]
+        for cell in cells[2:]:
+            link = cell.find("a", href=True)
+            if link is not None and link.get_text(strip=True) in months:
+                month = link.get_text(strip=True).replace(" ", "_")
+                documents.append(Document(f"Artisan_{month}_{fund}_{ticker}", urljoin(page_url, link["href"]), None))
+    return documents
+
+register(FundPlugin(
+    "Artisan Partners",
+    sources=[Source(
+        "https://www.artisanpartners.com/individual-investors/news-insights/thought-leadership/commentaries.html",
+        browser=True,
+        wait_for="#holdings",
+        find=_artisan_commentaries,
+    )],
+    filename="{label}.pdf",
+))
+
+register(FundPlugin(
+    "Baird Asset Management",
+    sources=[Source(
+        "https://www.bairdassetmanagement.com/insights/#category=cat-11568",
+        browser=True,
+        wait_for=".card",
+        selector="a.card[href]",
+        pdf_only=False,
+        rules=[Rule("Commentary", text=("2025", "international and global growth fund commentary"), pick="all")],
+        follow=Source(None, browser=True, wait_for=".btn", selector="a.btn[href]", pdf_only=False,
+                      rules=[Rule("Commentary", text=("read full",))]),
+    )],
+    filename="Baird_2025_Q{index}.pdf",
+))
+
+def _baron_quarterly_report(soup, page_url):
+    # The newest report is listed first; its file name carries the quarter-end date
+    for link in soup.select("a[href*='baron-funds-quarterly-report']"):
+        if not link["href"].endswith(".pdf"):
+            continue
+        match = re.search(r"quarterly-report-(\d{2})\.(\d{2})\.(\d{4})", link["href"])
+        if match:
+            month, _, year = match.groups()
+            quarter = f"Q{(int(month) - 1) // 3 + 1}_{year}"
+        else:
+            quarter = "Unknown_Quarter"
+        return [Document(quarter, urljoin(page_url, link["href"]), None)]
+    return []
+
+register(FundPlugin(
+    "Baron Capital",
+    sources=[Source(
+        "https://www.baroncapitalgroup.com/insights-webcasts#Reports",
+        browser=True,
+        wait_for="a[href*='baron-funds-quarterly-report']",
+        find=_baron_quarterly_report,
+    )],
+    filename="Baron_{label}.pdf",
+    merge="never",
+))
+
+_CAUSEWAY_SECTIONS = (
+    "Global Value Fund",
+    "International Value Fund",
+    "Emerging Markets Fund",
+    "International Opportunities Fund",
+    "International Small Cap Fund",
+)
+
+def _expand_causeway_sections(driver, log, deadline):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    # The document links of each fund only load once its section is opened
+    for section in _CAUSEWAY_SECTIONS:
+        try:
+            header = WebDriverWait(driver, _time_left(deadline, 10)).until(
+                EC.element_to_be_clickable((By.XPATH, f"//button[contains(text(), '{section}')]")))
+            driver.execute_script("arguments[0].scrollIntoView(true);", header)
+            header.click()
+            wait_for_dom_stable(driver, timeout=_time_left(deadline, 5))
+        except _DeadlineReached:
+            raise
+        except Exception as e:
+            log(f" Could not expand section '{section}': {e}")
+
+register(FundPlugin(
+    "Causeway Capital",
+    sources=[Source(
+        "https://www.causewaycap.com/documents/#documents-global-value",
+        browser=True,
+        prepare=_expand_causeway_sections,
+        find=_pdfs_named(("summary", "investor", "institutional", "flash", "quarterly", "semi"),
+                         exclude=("form-crs", "adv", "brochure", "disclosure")),
+    )],
+    download="browser",
+    filename="{basename}",
+))
+
+register(FundPlugin(
+    "Cavanal Hill Funds",
+    sources=[
+        Source("https://www.cavanalhillfunds.com/insights-commentary/mutual-fund-commentary/",
+               browser=True, wait_for=".download", selector="a.download[href]", pdf_only=False,
+               rules=[Rule("MutualFund_Commentary", pick="all", limit=7)]),
+        Source("https://cavanalhillim.com/insights-commentary/sma-commentary",
+               browser=True, wait_for=".download", selector="a.download[href]",
+               rules=[Rule("SMA_Commentary")]),
+    ],
+    # The site's certificate does not verify; the pooled Chrome ignores certificate errors
+    download="browser",
+    filename="CavanalHill_{label}_{index:02d}.pdf",
+))
+
+register(FundPlugin(
+    "Clipper Fund",
+    sources=[Source(
+        "https://clipperfund.com/funds/clipper-fund/pm-review",
+        browser=True,
+        wait_for="//a[contains(., 'Download this Review')]",
+        rules=[Rule("Review", text=("download this review",))],
+    )],
+    filename="{basename}",
+))
+
+register(FundPlugin(
+    "Dodge & Cox",
+    sources=[Source(
+        "https://www.dodgeandcox.com/individual-investor/us/en/insights/2024-annual-investment-reviews.html",
+        browser=True,
+        wait_for="a[href$='-strategy.html']",
+        selector="a[href$='-strategy.html']",
+        pdf_only=False,
+        rules=[Rule("Strategy", pick="all")],
+        follow=Source(None, browser=True,
+                      wait_for="//a[contains(text(), 'Download PDF') and contains(@href, '.pdf')]",
+                      pdf_only=False, rules=[Rule("Review", text=("download pdf",), href=(".pdf",))]),
+    )],
+    prefix="DodgeCox",
+    download="browser",
+    filename="{basename}",
+))
+
+register(FundPlugin(
+    "Fidelity Investments",
+    sources=[
+        Source(f"https://fundresearch.fidelity.com/mutual-funds/analysis/316345305?documentType={code}",
+               browser=True,
+               wait_for="//a[contains(@href, '/bin-public/') and contains(text(), 'View as PDF')]",
+               find=_dated_report(f"Fidelity_{{date}}_{name}",
+                                  _first_link("a[href*='/bin-public/']", "View as PDF",
+                                              "https://www.fidelity.com/bin-public/"),
+                                  lambda soup, date_id=date_id: soup.find(id=date_id), "%m%d%y"))
+        for code, name, date_id in (
+            ("QFR", "Quarterly_Fund_Review", "shcomm-QuarterlyFundReviewDate"),
+            ("QAA", "Portfolio_Manager_Q&A", "shcomm-PortfolioManagersQuestionAnswerDate"),
+            ("CHM", "Chairman’s_Message", "shcomm-ChairmanMessageDate"),
+        )
+    ],
+    filename="{label}.pdf",
+    # Named after the Quarterly Fund Review's date; the three reports are only fetched together
+    merged_name="Fidelity_{date}_Merged.pdf",
+    required="all",
+    retries=5,
+))
+
+register(FundPlugin(
+    "First Eagle Fund",
+    sources=[Source(
+        "https://www.firsteagle.com/first-eagle-fund-shareholder-reports",
+        browser=True,
+        wait_for="a[href$='.pdf']",
+        find=_pdfs_named(("globalfund", "overseasfund", "usvaluefund", "goldfund"), ("tsr", "annual", "semi")),
+    )],
+    download="browser",
+    filename="{basename}",
+))
+
+def _gabelli_latest_report(soup, page_url):
+    # The newest quarterly or annual report is the first link labelled so in a span
+    for link in soup.select("a[href]"):
+        if any("Quarterly Report" in span.get_text() or "Annual Report" in span.get_text()
+               for span in link.find_all("span", recursive=False)):
+            return [Document(link.get_text(strip=True).replace(" ", "_"), urljoin(page_url, link["href"]), None)]
+    return []
+
+register(FundPlugin(
+    "Gabelli Funds",
+    sources=[Source(
+        "https://www.gabelli.com/corporate/investor_relations",
+        browser=True,
+        wait_for="//a[span[contains(text(),'Quarterly Report') or contains(text(),'Annual Report')]]",
+        find=_gabelli_latest_report,
+    )],
+    filename="Gabelli_{today}_{label}.pdf",
+    merge="never",
+))
+
+def _harbor_quarterly_reports(soup, page_url):
+    # Documents are buttons carrying the PDF path, not links
+    return [Document("QuarterlyReport", urljoin(page_url, button["data-doc"]), None)
+            for button in soup.select("button[data-doc]")
+            if "Quarterly Report" in button.get_text() and button["data-doc"].endswith(".pdf")]
+
+register(FundPlugin(
+    "Harbor Funds",
+    sources=[Source(
+        "https://www.harborcapital.com/documents/fund/",
+        browser=True,
+        wait_for="//button[contains(., 'Quarterly Report')]",
+        find=_harbor_quarterly_reports,
+    )],
+    filename="Harbor_QR_{index}.pdf",
+    merged_name="HarborFunds_Merged.pdf",
+))
+
+register(FundPlugin(
+    "Longleaf Partners",
+    sources=[
+        Source(f"https://southeasternasset.com/commentary/4q24-{page}-fund-commentary/", browser=True,
+               wait_for="a[href*='.pdf']", pdf_only=False, rules=[Rule(fund, href=(".pdf",))])
+        for page, fund in (("partners", "LLPF"), ("small-cap", "LLSC"), ("international", "LLIN"),
+                           ("global", "LLGF"))
+    ],
+    download="browser",
+    filename="{basename}",
+))
+
+register(FundPlugin(
+    "MFS Investment Management",
+    sources=[
+        Source(url, browser=True, wait_for="//a[contains(@href, '.pdf')]",
+               find=_dated_report(f"MFS_{{date}}_{name}", _first_link("a[href*='.pdf']", prefix="https"),
+                                  lambda soup, date_id=date_id: soup.find(id=date_id), "%m%d%y"))
+        for url, name, date_id in (
+            ("https://www.mfs.com/en-gb/investment-professional/insights/sustainability/mfs-stewardship-report.html",
+             "Quarterly_Stewardship_Report", "stewardship-report-date"),
+            ("https://www.mfs.com/en-us/investment-professional/about-mfs/newsroom/shareholder-newsletters.html",
+             "Shareholder_Newsletter", "shareholder-newsletter-date"),
+            ("https://www.mfs.com/en-us/investment-professional/about-mfs/newsroom/announcements.html",
+             "CEO_Letter", "ceo-letter-date"),
+        )
+    ],
+    filename="{label}.pdf",
+    # As for Fidelity: named after the stewardship report's date, all three reports or none
+    merged_name="MFS_{date}_Merged.pdf",
+    required="all",
+    retries=5,
+))
+
+_OAKMARK_ARTICLE = Source(None, browser=True,
+                          wait_for="//a[contains(@aria-label, 'Download PDF') and contains(@href, '.pdf')]",
+                          selector="a[aria-label*='Download PDF'][href*='.pdf']", pdf_only=False,
+                          rules=[Rule("Commentary")])
+
+register(FundPlugin(
+    "Oakmark Fund",
+    sources=[
+        # The Oakmark Fund's own commentary, then the latest one on each manager's profile
+        Source("https://oakmark.com/news-insights/commentary/", browser=True,
+               wait_for="//a[contains(text(), 'Oakmark Fund:')]", pdf_only=False,
+               rules=[Rule("Commentary", text=("oakmark fund:",))], follow=_OAKMARK_ARTICLE),
+    ] + [
+        Source(f"https://oakmark.com/who-we-are/our-team/{manager}/", browser=True,
+               wait_for="div.commentary.article-wrap div.content-wrapper a",
+               selector="div.commentary.article-wrap div.content-wrapper a[href]", pdf_only=False,
+               rules=[Rule("Commentary")], follow=_OAKMARK_ARTICLE)
+        for manager in ("bill-nygren", "david-herro", "adam-d-abbas")
+    ],
+    download="browser",
+    filename="{basename}",
+))
+
+register(FundPlugin(
+    "Poplar Forest Funds",
+    sources=[Source(
+        "https://poplarforestfunds.com/category/quarterly-reports/",
+        browser=True,
+        selector="h2.entry-title a[href]",
+        pdf_only=False,
+        # The four latest quarterly report posts, each linking its letter
+        rules=[Rule("Report", href=("https://poplarforestfunds.com/",), pick="all", limit=4)],
+        follow=Source(None, browser=True, pdf_only=False,
+                      rules=[Rule("QuarterlyLetter", text=("download quarterly letter",))]),
+    )],
+    prefix="PoplarForest",
+    filename="{basename}",
+))
+
+def _trowe_review_date(soup):
+    label = soup.find("span", string=lambda text: text and "Quarterly Review" in text)
+    return label and label.find_next_sibling("span")
+
+def _trowe_reviews_and_fact_sheets(soup, page_url):
+    # The Quarterly Review and the U.S. stock funds' quarterly fact sheets share one page
+    documents = _dated_report("TRowePrice_{date}_Quarterly_Fund_Review",
+                              _first_link("a[href*='.pdf']", "Quarterly Review"), _trowe_review_date)(soup, page_url)
+    for link in soup.select("a[href*='quarterly-factsheet']"):
+        if link["href"].endswith(".pdf"):
+            fund = link.get_text(strip=True).replace("ViewPDF", "").strip()
+            documents.append(Document(f"{fund}_Quarterly_Fund_Fact_Sheet", urljoin(page_url, link["href"]), None))
+    return documents
+
+register(FundPlugin(
+    "T. Rowe Price",
+    sources=[
+        Source("https://www.troweprice.com/personal-investing/funds/mutual-funds/prospectuses-reports.html",
+               browser=True, wait_for="a[href$='.pdf']", find=_trowe_reviews_and_fact_sheets),
+        Source("https://www.troweprice.com/personal-investing/resources/insights/global-markets-quarterly-update.html",
+               browser=True,
+               wait_for="//a[contains(@href, '.pdf') and contains(text(), 'Download the PDF')]",
+               find=_dated_report("TRowePrice_{date}_Global_Markets_Quarterly_Update",
+                                  _first_link("a[href*='.pdf']", "Download the PDF"),
+                                  lambda soup: soup.find("time"))),
+    ],
+    filename="{label}.pdf",
+    merge="never",
+    retries=5,
+))
@@ -0,0 +1,87 @@
+# scraper_scheduler.py
+import queue
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from funds import fund_scripts, scraper_kind
+from progress_events import run_with_events
+from scraper_framework import PLUGINS, run_in_process
+
+# Scrapers running at once, and per-kind caps: headed/headless Chrome is
+# memory hungry, plain HTTP scrapers are only waiting on the network. The
+# browser cap matches browser_pool.MAX_BROWSERS
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_BROWSER_WORKERS = 3
+DEFAULT_MAX_HTTP_WORKERS = 6
+
+ScraperResult = namedtuple("ScraperResult", [
+    "fund", "script", "returncode", "stdout", "stderr", "duration", "timed_out",
+])
+
+def run_scraper(fund, script, timeout=None, on_event=None):
+    """Run one scraper script to completion and return its ScraperResult.
+
+    Progress events the script prints are passed to on_event(event) as they arrive.
+    Funds with a scraper_framework plugin run in this process instead, sharing
+    its HTTP connections and pooled Chrome with the other plugin scrapers.
+    """
+    started = time.perf_counter()
+    if fund in PLUGINS:
+        returncode, stdout, stderr, timed_out = run_in_process(fund, timeout, on_event)
+    else:
+        returncode, stdout, stderr, timed_out = run_with_events([sys.executable, script], on_event, timeout)
+    return ScraperResult(fund, script, returncode, stdout, stderr, time.perf_counter() - started, timed_out)
+
+def run_scrapers(funds, max_workers=DEFAULT_MAX_WORKERS, max_browser_workers=DEFAULT_MAX_BROWSER_WORKERS,
+                 max_http_workers=DEFAULT_MAX_HTTP_WORKERS, timeout=None, on_event=None):
+    """Run the scrapers for `funds` concurrently and yield a ScraperResult as each finishes.
+
+    At most `max_workers` scrapers run at once, of which at most
+    `max_browser_workers` drive a browser and `max_http_workers` are plain
+    HTTP scrapers. Scrapers start in the order given as capacity frees up.
+    on_event(fund, event) is called for each progress event in the caller's
+    thread, between results, so it can safely update the UI.
+    """
+    max_workers = max(1, max_workers)
+    caps = {"browser": max(1, max_browser_workers), "http": max(1, max_http_workers)}
+    queued = {"browser": deque(), "http": deque()}
+    for fund in funds:
+        queued[scraper_kind(fund)].append(fund)
+    running = {"browser": 0, "http": 0}
+    futures = {}
+    # Worker threads only post here; events and completions are handled in this thread
+    updates = queue.Queue()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while futures or any(queued.values()):
+            # Start whatever fits under the global and per-kind caps
+            started = True
+            while started and len(futures) < max_workers:
+                started = False
+                for kind in ("http", "browser"):
+                    if queued[kind] and running[kind] < caps[kind] and len(futures) < max_workers:
+                        fund = queued[kind].popleft()
+                        future = executor.submit(run_scraper, fund, fund_scripts[fund], timeout,
+                                                 lambda event, fund=fund: updates.put((fund, event)))
+                        future.add_done_callback(lambda done: updates.put((None, done)))
+                        futures[future] = kind
+                        running[kind] += 1
+                        started = True
+
+            fund, update = updates.get()
+            if fund is not None:
+                if on_event is not None:
+                    on_event(fund, update)
+                continue
+            running[futures.pop(update)] -= 1
+            yield update.result()
+
+def format_durations(results):
+    """One line per fund, slowest first, for end-of-run summaries."""
+    lines = []
+    for result in sorted(results, key=lambda r: r.duration, reverse=True):
+        status = "timed out" if result.timed_out else ("ok" if result.returncode == 0 else f"exit {result.returncode}")
+        lines.append(f"{result.fund}: {result.duration:.1f}s ({status})")
+    return lines
@@ -0,0 +1,54 @@
+# test_company_matcher.py
+import pytest
+
+import company_matcher
+from company_matcher import CompanyMatcher
+from excerption_base import extract_company_paragraphs
+
+NAMES = ["Apple", "Apple Inc", "Meta", "Meta Platforms", "AT&T", "T. Rowe Price", "Price", "Co", "3M"]
+
+TEXT = "\n\n".join([
+    "Apple Inc. reported record services revenue.",
+    "Pineapple growers and snapple drinkers are not Apple shareholders.",
+    "APPLE and apple's suppliers rallied; so did meta platforms.",
+    "Metadata vendors were flat.",
+    "AT&T's dividend and AT&Tx are different tokens.",
+    "We sold T. Rowe Price after its Price target cut.",
+    "Pricey names and Price_Target fields do not count.",
+    "3M fell; 3MM and co-ops rose with Co.",
+    "  Meta  ",
+    "",
+])
+
+@pytest.fixture(params=["pyahocorasick", "pure-python"])
+def matcher(request, monkeypatch):
+    if request.param == "pure-python":
+        monkeypatch.setattr(company_matcher, "ahocorasick", None)
+    elif company_matcher.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    return CompanyMatcher(NAMES)
+
+def test_matches_per_company_regex(matcher):
+    expected = {name: extract_company_paragraphs(TEXT, name) for name in NAMES}
+    expected = {name: paragraphs for name, paragraphs in expected.items() if paragraphs}
+    grouped = matcher.group_by_company(TEXT)
+    assert grouped == expected
+    assert list(grouped) == [name for name in NAMES if name in expected]
+
+def test_word_boundaries(matcher):
+    assert matcher.find("Pineapple and Metadata") == set()
+    assert matcher.find("Price_Target") == set()
+    assert matcher.find("AT&Tx") == set()
+    assert matcher.find("(Apple)") == {"Apple"}
+    # Like \b after a trailing ".", a name ending in punctuation needs a word character next
+    assert CompanyMatcher(["Apple Inc."]).find("Apple Inc. rose") == set()
+    assert CompanyMatcher(["Apple Inc."]).find("Apple Inc.X") == {"Apple Inc."}
+
+def test_overlapping_names(matcher):
+    assert matcher.find("Apple Inc. shares") == {"Apple", "Apple Inc"}
+    assert matcher.find("T. Rowe Price") == {"T. Rowe Price", "Price"}
+    assert matcher.find("Meta Platforms") == {"Meta", "Meta Platforms"}
+
+def test_case_variants(matcher):
+    assert matcher.find("APPLE inc. and META PLATFORMS") == {"Apple", "Apple Inc", "Meta", "Meta Platforms"}
+    assert CompanyMatcher(NAMES, case_sensitive=True).find("APPLE and Apple") == {"Apple"}
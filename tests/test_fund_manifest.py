@@ -0,0 +1,117 @@
+# test_fund_manifest.py
+import os
+
+import pytest
+
+from fund_manifest import FundManifest, current_excerpt, inputs_fingerprint, save_excerpt_state
+
+URL = "https://example.com/reports/annual.pdf"
+REPORT = b"%PDF-1.4 annual report"
+REVISED = b"%PDF-1.4 annual report, revised"
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+class FakeServer:
+    """requests-style session serving one document, honouring If-None-Match unless told not to."""
+
+    def __init__(self, content, etag='"v1"', honour_validators=True):
+        self.content = content
+        self.etag = etag
+        self.honour_validators = honour_validators
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append(headers or {})
+        if self.honour_validators and (headers or {}).get("If-None-Match") == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.content, {"ETag": self.etag, "Content-Type": "application/pdf"})
+
+def _run(downloads_dir, session, dest_name):
+    """One scraper run: fetch the document, prune, save; returns (path, changed, manifest)."""
+    manifest = FundManifest(str(downloads_dir))
+    path, changed = manifest.fetch(session, URL, os.path.join(str(downloads_dir), dest_name))
+    manifest.prune()
+    manifest.save()
+    return path, changed, manifest
+
+def test_unchanged_file_is_skipped(tmp_path):
+    server = FakeServer(REPORT)
+    first, changed, _ = _run(tmp_path, server, "Annual_2025-01-01.pdf")
+    assert changed
+    mtime = os.path.getmtime(first)
+
+    path, changed, manifest = _run(tmp_path, server, "Annual_2025-02-01.pdf")
+    assert server.requests[-1]["If-None-Match"] == '"v1"'
+    assert (path, changed) == (first, False)
+    assert os.path.getmtime(first) == mtime
+    assert sorted(name for name in os.listdir(tmp_path) if name.endswith(".pdf")) == ["Annual_2025-01-01.pdf"]
+    assert manifest.summary() == "0 new or changed, 1 unchanged"
+
+def test_identical_body_is_skipped_without_validators(tmp_path):
+    _run(tmp_path, FakeServer(REPORT), "Annual_2025-01-01.pdf")
+    path, changed, _ = _run(tmp_path, FakeServer(REPORT, honour_validators=False), "Annual_2025-02-01.pdf")
+    assert (os.path.basename(path), changed) == ("Annual_2025-01-01.pdf", False)
+    assert not os.path.exists(tmp_path / "Annual_2025-02-01.pdf")
+
+def test_changed_file_is_refetched(tmp_path):
+    _run(tmp_path, FakeServer(REPORT), "Annual_2025-01-01.pdf")
+    path, changed, _ = _run(tmp_path, FakeServer(REVISED, etag='"v2"'), "Annual_2025-02-01.pdf")
+    assert changed and os.path.basename(path) == "Annual_2025-02-01.pdf"
+    with open(path, "rb") as f:
+        assert f.read() == REVISED
+    # The superseded download is pruned
+    assert not os.path.exists(tmp_path / "Annual_2025-01-01.pdf")
+
+def test_damaged_local_copy_is_refetched(tmp_path):
+    server = FakeServer(REPORT)
+    first, _, _ = _run(tmp_path, server, "Annual.pdf")
+    with open(first, "wb") as f:
+        f.write(b"%PDF-1.4 annual reporT")  # same size, different bytes
+    path, changed, _ = _run(tmp_path, server, "Annual.pdf")
+    assert "If-None-Match" not in server.requests[-1]
+    assert changed
+    with open(path, "rb") as f:
+        assert f.read() == REPORT
+
+def test_non_pdf_response_is_rejected(tmp_path):
+    server = FakeServer(b"<html>Access denied</html>")
+    with pytest.raises(ValueError):
+        FundManifest(str(tmp_path)).fetch(server, URL, str(tmp_path / "Annual.pdf"))
+    assert not os.path.exists(tmp_path / "Annual.pdf")
+
+def test_browser_download_is_checked_against_manifest(tmp_path):
+    def download(content):
+        manifest = FundManifest(str(tmp_path))
+        downloaded = tmp_path / "partial.crdownload"
+        downloaded.write_bytes(content)
+        result = manifest.record_file(URL, str(tmp_path / "Annual.pdf"), str(downloaded))
+        manifest.save()
+        assert not downloaded.exists()
+        return result
+
+    assert download(REPORT)[1]
+    assert not download(REPORT)[1]
+    _, changed = download(REVISED)
+    assert changed and (tmp_path / "Annual.pdf").read_bytes() == REVISED
+
+def test_excerpt_reused_only_for_same_inputs(tmp_path):
+    source = tmp_path / "Annual.pdf"
+    source.write_bytes(REPORT)
+    excerpted = str(tmp_path / "excerpted")
+    save_excerpt_state(excerpted, inputs_fingerprint([str(source)]), {"Apple": ["Paragraph"]})
+
+    # Renaming a source (a new date in its name) keeps the excerpt
+    renamed = tmp_path / "Annual_2025-02-01.pdf"
+    source.rename(renamed)
+    assert current_excerpt(excerpted, inputs_fingerprint([str(renamed)]))["results"] == {"Apple": ["Paragraph"]}
+
+    renamed.write_bytes(REVISED)
+    assert current_excerpt(excerpted, inputs_fingerprint([str(renamed)])) is None
@@ -0,0 +1,22 @@
+# test_job_queue.py
+from job_queue import JobQueue
+
+def test_submitting_an_active_fund_twice_returns_the_same_job(tmp_path):
+    jobs = JobQueue(str(tmp_path / "jobs.sqlite"))
+    first = jobs.submit("scrape", fund="Fidelity")
+    assert jobs.submit("scrape", fund="Fidelity") == first
+    assert len(jobs.list_jobs()) == 1
+
+def test_other_funds_and_kinds_get_their_own_jobs(tmp_path):
+    jobs = JobQueue(str(tmp_path / "jobs.sqlite"))
+    scrape = jobs.submit("scrape", fund="Fidelity")
+    assert jobs.submit("scrape", fund="Weitz") != scrape
+    assert jobs.submit("excerpt", fund="Fidelity") != scrape
+
+def test_running_job_is_reused_and_finished_job_is_not(tmp_path):
+    jobs = JobQueue(str(tmp_path / "jobs.sqlite"))
+    first = jobs.submit("scrape", fund="Fidelity")
+    assert jobs.claim("worker-1", ["http", "browser"])["id"] == first
+    assert jobs.submit("scrape", fund="Fidelity") == first
+    jobs.finish(first, "done", returncode=0)
+    assert jobs.submit("scrape", fund="Fidelity") != first
@@ -0,0 +1,41 @@
+# test_near_duplicates.py
+import pytest
+
+import near_duplicates
+from excerption_base import remove_duplicate_paragraphs
+from near_duplicates import NearDuplicateIndex, shingle_hashes
+
+PARAGRAPH = ("The fund's overweight in semiconductor equipment makers added to relative returns "
+             "as capital spending on advanced logic and memory capacity accelerated during the quarter.")
+# Two OCR slips ("rn" for "m", a dropped letter) keep it above the 0.8 threshold
+OCR_VARIANT = PARAGRAPH.replace("makers", "rnakers").replace("quarter", "quartr")
+UNRELATED = ("Consumer staples detracted as higher input costs squeezed margins at several "
+             "packaged food companies we hold, and we trimmed two positions on valuation.")
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def backend(request, monkeypatch):
+    if request.param == "pure-python":
+        monkeypatch.setattr(near_duplicates, "np", None)
+    elif near_duplicates.np is None:
+        pytest.skip("numpy not installed")
+    return request.param
+
+def test_exact_duplicates_keep_first(backend):
+    results = {"Alpha": [PARAGRAPH, UNRELATED], "Beta": [PARAGRAPH]}
+    assert remove_duplicate_paragraphs(results) == {"Alpha": [PARAGRAPH, UNRELATED]}
+
+def test_near_duplicates_at_threshold(backend):
+    index = NearDuplicateIndex(0.8)
+    assert index.add_if_new(PARAGRAPH)
+    assert not index.add_if_new(OCR_VARIANT)
+    assert index.add_if_new(UNRELATED)
+    assert index.similarity(index.signature(PARAGRAPH), index.signature(OCR_VARIANT)) >= 0.8
+
+def test_empty_input(backend):
+    assert remove_duplicate_paragraphs({}) == {}
+    assert len(shingle_hashes("")) == 0 and len(shingle_hashes("--- ** ...")) == 0
+    assert NearDuplicateIndex(0.8).signature("$ % |") is None
+
+def test_symbol_only_paragraphs_are_not_near_duplicates(backend):
+    results = {"Alpha": ["---", "* * *"], "Beta": ["|  |", PARAGRAPH]}
+    assert remove_duplicate_paragraphs(results) == results
@@ -0,0 +1,40 @@
+# test_paragraph_features.py
+import pytest
+
+import excerption_base
+from excerption_base import compute_paragraph_features, compute_paragraph_features_batch
+
+TICKERS = {"AAPL": "Apple", "MSFT": "Microsoft", "NVDA": "NVIDIA", "AMZN": "Amazon.com"}
+
+HOLDINGS = " ".join(f"{name} Inc. ${value},000 | {value / 10:.1f}% -" for name, value in
+                    [("Apple", 912), ("Microsoft", 845), ("NVIDIA", 771), ("Amazon.com", 650)] * 4)
+
+PARAGRAPHS = [
+    "",
+    "   \n\t ",
+    "Table 3: Top ten holdings",
+    "  table of contents",
+    "12.5% 3,400 $ 7.1",
+    "Apple's services revenue grew 14% (year over year) as the company raised prices.",
+    "ÉCOLE NORMALE and ΣΙΓΜΑ CAPITAL posted returns of ² and ³ points",
+    "Fund returns lagged;\x1cthe\x1fmarket rose 2x in Q3 — 🚀 growth stocks led",
+    "NVIDIA\n\nMicrosoft\r\nAmazon.com earnings beat by $0.12 (+5%) = strong quarter",
+    "İstanbul-listed holdings were sold.",
+    HOLDINGS,
+]
+
+def test_batch_matches_per_paragraph():
+    if excerption_base.np is None:
+        pytest.skip("numpy not installed")
+    expected = [compute_paragraph_features(p, TICKERS) for p in PARAGRAPHS]
+    assert any(features.is_holdings for features in expected)
+    assert compute_paragraph_features_batch(PARAGRAPHS, TICKERS) == expected
+    # Order and batch boundaries must not matter either
+    assert compute_paragraph_features_batch(PARAGRAPHS[::-1], TICKERS) == expected[::-1]
+    assert compute_paragraph_features_batch(PARAGRAPHS[5:6], TICKERS) == expected[5:6]
+
+def test_batch_without_numpy(monkeypatch):
+    monkeypatch.setattr(excerption_base, "np", None)
+    assert compute_paragraph_features_batch(PARAGRAPHS, TICKERS) == \
+        [compute_paragraph_features(p, TICKERS) for p in PARAGRAPHS]
+    assert compute_paragraph_features_batch([], TICKERS) == []
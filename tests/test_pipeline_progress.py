@@ -0,0 +1,47 @@
+# test_pipeline_progress.py
+import queue
+
+from PyPDF2 import PdfWriter
+
+import excerption_base
+import pipeline
+import progress_events
+from progress_events import ProgressTracker
+
+def _blank_pdf(path, pages):
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=612, height=792)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+def _fake_ocr(pdf_path, page_numbers=None, label=None):
+    for number in page_numbers:
+        progress_events.emit("page_ocr", page=number)
+    return {number: f"Page {number} text" for number in page_numbers}
+
+def test_extraction_worker_pages_advance_the_tracker(tmp_path, monkeypatch):
+    pdf_path = str(tmp_path / "report.pdf")
+    _blank_pdf(pdf_path, 3)
+    monkeypatch.delenv(progress_events.ENABLED_ENV, raising=False)
+    monkeypatch.setattr(progress_events, "_forward", None)
+    monkeypatch.setattr(excerption_base, "OCR_WORKERS", excerption_base.OCR_WORKERS)
+    monkeypatch.setattr(excerption_base, "ADAPTIVE_OCR", excerption_base.ADAPTIVE_OCR)
+    monkeypatch.setattr(excerption_base, "ocr_pdf_pages", _fake_ocr)
+
+    events = queue.Queue()
+    pipeline._init_worker(1, False, events)
+    pipeline._extract_job(pdf_path, "Fund A")
+
+    tracker = ProgressTracker(["Fund A", "Fund B"])
+    fractions = []
+    while not events.empty():
+        fund, event = events.get()
+        assert fund == "Fund A"
+        tracker.update(fund, event)
+        fractions.append(tracker.fraction())
+
+    assert tracker.pages == {"Fund A": 3}
+    assert tracker.pages_done == {"Fund A": 3}
+    assert fractions == sorted(fractions) and fractions[-1] > fractions[0]
+    assert "3/3 pages OCR'd" in tracker.summary()
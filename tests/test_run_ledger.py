@@ -0,0 +1,76 @@
+# test_run_ledger.py
+import os
+
+import pipeline
+from fund_manifest import EXCERPT_STATE_NAME, inputs_fingerprint, save_excerpt_state
+from run_ledger import RunLedger
+from scraper_scheduler import ScraperResult
+
+def test_resume_continues_the_unfinished_run(tmp_path):
+    path = str(tmp_path / "ledger.sqlite")
+    artifact = tmp_path / "part.pdf"
+    artifact.write_bytes(b"%PDF")
+
+    ledger = RunLedger(path)
+    run_id = ledger.start_run()
+    ledger.record("Fund A", "scrape", "done", duration=1.0)
+    ledger.record("Fund A", "render", "done", artifact=str(artifact))
+    ledger.record("Fund B", "scrape", "failed", error="exit status 1")
+    ledger.finish_run("failed")
+    ledger.close()
+
+    ledger = RunLedger(path)
+    assert ledger.start_run(resume=True) == run_id
+    assert ledger.is_done("Fund A", "scrape") and ledger.is_done("Fund A", "render")
+    assert not ledger.is_done("Fund B", "scrape")
+    assert not ledger.is_done("Fund A", "excerpt")
+    # A completed stage whose artifact is gone has to run again
+    artifact.unlink()
+    assert not ledger.is_done("Fund A", "render")
+    ledger.finish_run("done")
+    ledger.close()
+
+    ledger = RunLedger(path)
+    assert ledger.start_run(resume=True) != run_id
+    assert not ledger.is_done("Fund A", "scrape")
+    ledger.close()
+
+def test_resumed_pipeline_skips_completed_stages(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline, "BASE_DIR", str(tmp_path))
+    monkeypatch.setattr(pipeline, "PARTS_DIR", str(tmp_path / "parts"))
+    downloads = pipeline.downloads_dir("Fund A")
+    os.makedirs(downloads)
+    source = os.path.join(downloads, "Annual.pdf")
+    with open(source, "wb") as f:
+        f.write(b"%PDF-1.4 annual report")
+    results = {"Apple": ["Apple's services revenue grew."]}
+    save_excerpt_state(pipeline.excerpted_dir("Fund A"), inputs_fingerprint([source]), results)
+
+    ledger = RunLedger(str(tmp_path / "ledger.sqlite"))
+    run_id = ledger.start_run()
+    ledger.record("Fund A", "scrape", "done", artifact=downloads)
+    part_path = pipeline.render_part("Fund A", results, "2025-01-01", ledger)
+    ledger.finish_run("failed")
+
+    scraped = []
+
+    def fake_run_scrapers(funds, on_event=None, **options):
+        for fund in funds:
+            scraped.append(fund)
+            yield ScraperResult(fund, "script.py", 1, "", "", 0.1, False)
+
+    def no_render(*args, **kwargs):
+        raise AssertionError("a reused part was rendered again")
+
+    monkeypatch.setattr(pipeline, "run_scrapers", fake_run_scrapers)
+    assert ledger.start_run(resume=True) == run_id
+    updates = [(update.kind, update.fund) for update in pipeline.run_pipeline(["Fund A", "Fund B"], ledger=ledger)]
+
+    assert scraped == ["Fund B"]
+    assert [kind for kind, fund in updates if fund == "Fund A"] == ["resumed", "sources", "unchanged", "excerpted"]
+    assert ("skipped", "Fund B") in updates
+    assert ledger.artifact("Fund A", "excerpt") == os.path.join(pipeline.excerpted_dir("Fund A"), EXCERPT_STATE_NAME)
+
+    monkeypatch.setattr(pipeline, "save_results_to_pdf", no_render)
+    assert pipeline.render_part("Fund A", results, "2025-01-02", ledger, reuse=True) == part_path
+    ledger.close()
@@ -0,0 +1,139 @@
+# waits.py
+import os
+import time
+
+from run_profiler import stage
+
+# Upper bounds only: every wait returns as soon as its condition holds
+DEFAULT_TIMEOUT = 20
+POLL_INTERVAL = 0.25
+# How long the DOM / network must stay unchanged to count as settled
+QUIET_PERIOD = 0.5
+# Chrome and Edge write downloads under these names until they finish
+PARTIAL_SUFFIXES = (".crdownload", ".tmp", ".part")
+
+# Waits accept either a Selenium driver or a Playwright page
+def _is_playwright(target):
+    return hasattr(target, "wait_for_load_state")
+
+def _script(target, expression):
+    if _is_playwright(target):
+        return target.evaluate(f"() => {expression}")
+    return target.execute_script(f"return {expression}")
+
+def _poll(condition, timeout, poll):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            value = condition()
+        except Exception:
+            value = None
+        if value:
+            return value
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(poll)
+
+def wait_until(condition, timeout=DEFAULT_TIMEOUT, poll=POLL_INTERVAL):
+    """Poll condition() until it returns something truthy; returns that value, or None on timeout.
+
+    Exceptions raised by condition() count as "not yet".
+    """
+    with stage("wait"):
+        return _poll(condition, timeout, poll)
+
+def wait_for_selector(target, selector, timeout=DEFAULT_TIMEOUT, visible=False):
+    """Wait until `selector` (CSS, or XPath starting with "/" or "(") matches; returns the element or None."""
+    is_xpath = selector.startswith(("/", "("))
+    with stage("wait"):
+        if _is_playwright(target):
+            try:
+                return target.wait_for_selector(f"xpath={selector}" if is_xpath else selector,
+                                                state="visible" if visible else "attached", timeout=timeout * 1000)
+            except Exception:
+                return None
+
+        from selenium.webdriver.common.by import By
+
+        def found():
+            for element in target.find_elements(By.XPATH if is_xpath else By.CSS_SELECTOR, selector):
+                if not visible or element.is_displayed():
+                    return element
+            return None
+        return _poll(found, timeout, POLL_INTERVAL)
+
+def _settled(target, expression, timeout, quiet):
+    # True once `expression` has kept the same value for `quiet` seconds with the document loaded
+    last = None
+    unchanged_since = time.monotonic()
+
+    def check():
+        nonlocal last, unchanged_since
+        state = _script(target, f"[document.readyState, {expression}]")
+        now = time.monotonic()
+        if state != last:
+            last, unchanged_since = state, now
+            return False
+        return state[0] == "complete" and now - unchanged_since >= quiet
+    return _poll(check, timeout, min(POLL_INTERVAL, quiet / 2)) is not None
+
+def wait_for_network_idle(target, timeout=DEFAULT_TIMEOUT, quiet=QUIET_PERIOD):
+    """Wait until the page has loaded and started no new requests for `quiet` seconds; returns True or False.
+
+    Selenium has no network events, so there this watches the page's
+    resource timing entries instead.
+    """
+    with stage("wait"):
+        if _is_playwright(target):
+            try:
+                target.wait_for_load_state("networkidle", timeout=timeout * 1000)
+                return True
+            except Exception:
+                return False
+        return _settled(target, "performance.getEntriesByType('resource').length", timeout, quiet)
+
+def wait_for_dom_stable(target, timeout=DEFAULT_TIMEOUT, quiet=QUIET_PERIOD):
+    """Wait until the page has loaded and its element count and text stop changing for `quiet` seconds.
+
+    Use after clicks or navigation where no single selector marks "done".
+    Returns True, or False on timeout (the page is then used as it is).
+    """
+    with stage("wait"):
+        return _settled(target, "document.getElementsByTagName('*').length, "
+                                "document.body ? document.body.innerText.length : 0", timeout, quiet)
+
+def snapshot(directory):
+    """Names currently in `directory`; pass to wait_for_download(before=...) before triggering a download."""
+    return set(os.listdir(directory)) if os.path.isdir(directory) else set()
+
+def wait_for_download(directory, timeout=DEFAULT_TIMEOUT, before=None, name=None):
+    """Wait for a browser download into `directory` to finish; returns its path or None on timeout.
+
+    The download is `name` if given, else the first complete file not in
+    `before`. Complete means no partial download is pending in the
+    directory and the file's size held steady between two polls.
+    """
+    before = before or set()
+    sizes = {}
+
+    def finished():
+        names = os.listdir(directory)
+        if any(entry.endswith(PARTIAL_SUFFIXES) for entry in names):
+            return None
+        candidates = [name] if name else [entry for entry in names if entry not in before]
+        for candidate in candidates:
+            path = os.path.join(directory, candidate)
+            if not os.path.isfile(path):
+                continue
+            size = os.path.getsize(path)
+            if size and sizes.get(path) == size:
+                return path
+            sizes[path] = size
+        return None
+    with stage("wait"):
+        return _poll(finished, timeout, POLL_INTERVAL)
+
+def pause(seconds):
+    """A deliberate fixed sleep (retry backoff, rate limiting), counted separately from waits."""
+    with stage("sleep"):
+        time.sleep(seconds)
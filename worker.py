@@ -0,0 +1,128 @@
+# worker.py
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+
+from excerpt_service import excerpt_fund
+from funds import fund_folder, fund_scripts
+from job_queue import JobQueue
+from progress_events import ProgressTracker, run_with_events
+from scraper_scheduler import DEFAULT_MAX_WORKERS, DEFAULT_MAX_BROWSER_WORKERS, DEFAULT_MAX_HTTP_WORKERS
+
+EXCERPT_SCRIPT = os.path.join(os.getcwd(), "excerpt.py")
+PODCAST_SCRIPT = os.path.join(os.getcwd(), "podcast_processor.py")
+
+# Jobs running at once per lane; scrape jobs run in their scraper's browser/http lane
+DEFAULT_LANE_CAPS = {
+    "browser": DEFAULT_MAX_BROWSER_WORKERS,
+    "http": DEFAULT_MAX_HTTP_WORKERS,
+    "excerpt": 2,
+    "podcast": 1,
+}
+POLL_INTERVAL = 1.0
+# Progress is written to the queue at most this often per job
+PROGRESS_INTERVAL = 0.5
+
+def job_command(job):
+    args = job["args"]
+    if job["kind"] == "scrape":
+        return [sys.executable, fund_scripts[args["fund"]]]
+    if job["kind"] == "excerpt":
+        return [sys.executable, EXCERPT_SCRIPT, fund_folder(args["fund"])]
+    return [sys.executable, PODCAST_SCRIPT, args["name"], args["url"]]
+
+def run_job(queue, job, cancel, scrape_timeout=None):
+    """Run one claimed job to completion, streaming its progress into the queue."""
+    label = job["args"].get("fund") or job["args"].get("name") or job["kind"]
+    tracker = ProgressTracker([label])
+    last_write = [0.0]
+
+    def on_event(event):
+        tracker.update(label, event)
+        now = time.monotonic()
+        if now - last_write[0] >= PROGRESS_INTERVAL:
+            last_write[0] = now
+            queue.update_progress(job["id"], tracker.fraction(), event["event"].replace("_", " "))
+
+    timeout = scrape_timeout if job["kind"] == "scrape" else None
+    try:
+        if job["kind"] == "excerpt":
+            # Uses the warm excerpt service when one is running, else a fresh excerpt.py
+            returncode, stdout, stderr, timed_out = excerpt_fund(job["args"]["fund"], on_event, cancel)
+        else:
+            returncode, stdout, stderr, timed_out = run_with_events(job_command(job), on_event, timeout, cancel)
+    except Exception as e:
+        queue.finish(job["id"], "failed", message=f"could not start: {e}")
+        return
+    if cancel.is_set():
+        queue.finish(job["id"], "cancelled", returncode, stdout, stderr, message="cancelled")
+    elif timed_out:
+        queue.finish(job["id"], "failed", returncode, stdout, stderr, message=f"timed out after {timeout}s")
+    elif returncode == 0:
+        queue.finish(job["id"], "done", returncode, stdout, stderr, message="done")
+    else:
+        queue.finish(job["id"], "failed", returncode, stdout, stderr, message=f"exit status {returncode}")
+
+def serve(queue, max_jobs=DEFAULT_MAX_WORKERS, lane_caps=None, scrape_timeout=None, stop=None):
+    """Claim and run queued jobs until `stop` is set, keeping each lane under its cap."""
+    lane_caps = dict(DEFAULT_LANE_CAPS, **(lane_caps or {}))
+    stop = stop or threading.Event()
+    name = f"{socket.gethostname()}:{os.getpid()}"
+    running = {}  # job id -> (lane, cancel event, thread)
+
+    try:
+        while not stop.is_set():
+            requeued = queue.requeue_stale()
+            if requeued:
+                print(f"Requeued {requeued} jobs left running by a stopped worker")
+            for job_id, (_, _, thread) in list(running.items()):
+                if not thread.is_alive():
+                    del running[job_id]
+            # The heartbeat also tells us which running jobs the app asked to cancel
+            for job_id in queue.heartbeat(running):
+                running[job_id][1].set()
+
+            while len(running) < max_jobs:
+                busy = Counter(lane for lane, _, _ in running.values())
+                lanes = [lane for lane, cap in lane_caps.items() if busy[lane] < cap]
+                job = queue.claim(name, lanes)
+                if job is None:
+                    break
+                print(f"Starting job {job['id']}: {job['kind']} {job['args']}")
+                cancel = threading.Event()
+                thread = threading.Thread(target=run_job, args=(queue, job, cancel, scrape_timeout), daemon=True)
+                running[job["id"]] = (job["lane"], cancel, thread)
+                thread.start()
+
+            stop.wait(POLL_INTERVAL)
+    finally:
+        # Kill what is still running so no orphaned scraper keeps going without a worker
+        for _, cancel, thread in running.values():
+            cancel.set()
+        for _, _, thread in running.values():
+            thread.join()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run queued scrape, excerpt and podcast jobs.")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_MAX_WORKERS, help="jobs running at once")
+    parser.add_argument("--browser-jobs", type=int, default=DEFAULT_LANE_CAPS["browser"])
+    parser.add_argument("--http-jobs", type=int, default=DEFAULT_LANE_CAPS["http"])
+    parser.add_argument("--excerpt-jobs", type=int, default=DEFAULT_LANE_CAPS["excerpt"])
+    parser.add_argument("--podcast-jobs", type=int, default=DEFAULT_LANE_CAPS["podcast"])
+    parser.add_argument("--scrape-timeout", type=float, default=None, help="seconds before a scraper is killed")
+    options = parser.parse_args()
+
+    print(f"Worker {os.getpid()} serving {JobQueue().path}")
+    try:
+        serve(JobQueue(), max_jobs=options.jobs, scrape_timeout=options.scrape_timeout, lane_caps={
+            "browser": options.browser_jobs,
+            "http": options.http_jobs,
+            "excerpt": options.excerpt_jobs,
+            "podcast": options.podcast_jobs,
+        })
+    except KeyboardInterrupt:
+        print("Worker stopped")